@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import functools
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class SlowFilesystem:
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = {}
+        self._originals = {}
+
+    def __enter__(self):
+        for name in ("stat", "lstat", "scandir", "listdir"):
+            original = getattr(os, name)
+            self._originals[name] = original
+            setattr(os, name, self._delayed(name, original))
+        return self
+
+    def __exit__(self, *exc_info):
+        for name, original in self._originals.items():
+            setattr(os, name, original)
+
+    def _delayed(self, name, original):
+        @functools.wraps(original)
+        def call(*args, **kwargs):
+            self.calls[name] = self.calls.get(name, 0) + 1
+            time.sleep(self.latency)
+            return original(*args, **kwargs)
+        return call
+
+def make_media_directory(root, videos):
+    for index in range(videos):
+        base_name = f"Show.S{index // 100 + 1:02d}E{index % 100 + 1:02d}"
+        open(os.path.join(root, base_name + ".mkv"), "w").close()
+        if index % 2 == 0:
+            open(os.path.join(root, base_name + ".en.srt"), "w").close()
+        if index % 10 == 0:
+            open(os.path.join(root, base_name + ".en.forced.srt"), "w").close()
+
+def report(label, seconds, filesystem):
+    calls = ", ".join(f"{count} {name}" for name, count in sorted(filesystem.calls.items())) or "no calls"
+    print(f"{label:40} {seconds:8.2f} s   {calls}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time subtitle pairing on a folder of videos with delayed filesystem calls.")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout whose main.py provides the pairing code")
+    parser.add_argument("--videos", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Delay added to every stat/lstat/scandir/listdir call")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.repo)
+    import main as app
+
+    class Pairing:
+        _directory_listings = None
+        _find_subtitle_pair = app.MainWindow._find_subtitle_pair
+        _find_video_pair = app.MainWindow._find_video_pair
+        if hasattr(app.MainWindow, "_list_directory"):
+            _list_directory = app.MainWindow._list_directory
+        if hasattr(app.MainWindow, "_list_subtitle_candidates"):
+            _list_subtitle_candidates = app.MainWindow._list_subtitle_candidates
+
+    with tempfile.TemporaryDirectory() as root:
+        make_media_directory(root, args.videos)
+        videos = sorted(os.path.join(root, name) for name in os.listdir(root) if name.endswith(".mkv"))
+        print(f"{len(videos)} videos, {len(os.listdir(root)) - len(videos)} subtitles, {args.latency_ms} ms per filesystem call")
+
+        pairing = Pairing()
+        pairing._directory_listings = {}
+        with SlowFilesystem(args.latency_ms / 1000) as filesystem:
+            started = time.perf_counter()
+            paired = sum(1 for video in videos if pairing._find_subtitle_pair(video))
+            elapsed = time.perf_counter() - started
+        report(f"_find_subtitle_pair ({paired} paired)", elapsed, filesystem)
+
+        if hasattr(app.FileAdditionWorker, "tasks_discovered"):
+            worker = app.FileAdditionWorker([root])
+            tasks = []
+            worker.tasks_discovered.connect(tasks.extend)
+            with SlowFilesystem(args.latency_ms / 1000) as filesystem:
+                started = time.perf_counter()
+                worker.run()
+                elapsed = time.perf_counter() - started
+            report(f"FileAdditionWorker folder ({len(tasks)} tasks)", elapsed, filesystem)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHOWS = ["The.Office", "Breaking.Bad", "Dark", "Severance", "The.Expanse", "Chernobyl", "Succession", "Andor"]
+SUFFIXES = ["", ".forced", ".sdh", ".forced.sdh"]
+
+def make_filenames(count, distinct, language_codes):
+    rng = random.Random(0)
+    names = []
+    for index in range(distinct):
+        show = rng.choice(SHOWS)
+        lang_code = rng.choice(language_codes)
+        names.append(f"{show}.S{index // 100 + 1:02d}E{index % 100 + 1:02d}.1080p.WEB-DL.{index}.{lang_code}{rng.choice(SUFFIXES)}.srt")
+    return [names[index % distinct] for index in range(count)]
+
+def time_calls(function, filenames):
+    started = time.perf_counter()
+    for filename in filenames:
+        function(filename)
+    return time.perf_counter() - started
+
+def report(label, seconds, count):
+    print(f"{label:45} {seconds * 1000:8.1f} ms   {seconds / count * 1e6:7.2f} us/name")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time subtitle filename parsing and language-code stripping.")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout whose main.py provides the parsing helpers")
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--distinct", type=int, default=1000, help="Distinct names repeated to fill --count")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.repo)
+    import main as app
+
+    parse = app._parse_subtitle_filename
+    uncached_parse = getattr(parse, "__wrapped__", parse)
+    language_codes = [code for codes in app.LANGUAGES.values() for code in codes]
+
+    for distinct in (args.distinct, args.count):
+        filenames = make_filenames(args.count, distinct, language_codes)
+        stems = [os.path.splitext(filename)[0] for filename in filenames]
+        print(f"{args.count} filenames, {distinct} distinct")
+
+        report("_parse_subtitle_filename (uncached)", time_calls(uncached_parse, filenames), args.count)
+        if hasattr(parse, "cache_clear"):
+            parse.cache_clear()
+            report("_parse_subtitle_filename (lru_cache)", time_calls(parse, filenames), args.count)
+        report("_strip_language_codes_from_name", time_calls(app._strip_language_codes_from_name, stems), args.count)
+
+if __name__ == "__main__":
+    main()
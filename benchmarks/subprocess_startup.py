@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SPAWN_COMMANDS = {
+    "GUI module imports (pre-split entry cost)": ["-c", "import main"],
+    "main.py --run-gst-subprocess": ["main.py", "--run-gst-subprocess", "--help"],
+    "subprocess_entry.py --run-gst-subprocess": ["subprocess_entry.py", "--run-gst-subprocess", "--help"],
+}
+
+VERSION_COMMAND = ["-c", "import sys, PySide6; print('Python', sys.version.split()[0], 'PySide6', PySide6.__version__, sys.platform)"]
+
+def time_spawn(python, args, repo):
+    started = time.perf_counter()
+    subprocess.run([python] + args, cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Time how long a spawned translation subprocess takes to reach its entry point.")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter with the GUI dependencies installed")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout to spawn the entry points from")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    
+    print(subprocess.run([args.python] + VERSION_COMMAND, capture_output=True, text=True).stdout.strip())
+    
+    for label, spawn_args in SPAWN_COMMANDS.items():
+        if spawn_args[0].endswith(".py") and not os.path.exists(os.path.join(args.repo, spawn_args[0])):
+            continue
+        
+        try:
+            time_spawn(args.python, spawn_args, args.repo)
+            timings = [time_spawn(args.python, spawn_args, args.repo) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            print(f"{label:45} failed with exit code {e.returncode}")
+            continue
+        print(f"{label:45} median {statistics.median(timings) * 1000:7.1f} ms   min {min(timings) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
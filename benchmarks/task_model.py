@@ -0,0 +1,106 @@
+import os
+import sys
+import gc
+import time
+import argparse
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Pairing:
+    def _find_subtitle_pair(self, video_path):
+        return os.path.splitext(video_path)[0] + ".en.srt"
+
+    def _find_video_pair(self, subtitle_path):
+        return subtitle_path[:-len(".en.srt")] + ".mkv"
+
+def make_queue(tasks):
+    entries = []
+    for index in range(tasks):
+        base_path = f"/media/Show {index // 500}/Show.S{index // 100 % 100 + 1:02d}E{index % 100 + 1:02d}.{index}"
+        if index % 2:
+            entries.append((base_path + ".mkv", "video+subtitle"))
+        else:
+            entries.append((base_path + ".en.srt", "subtitle"))
+    return entries
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def load_records(app, entries):
+    model = app.CustomTaskModel(None)
+    pairing = Pairing()
+    records = []
+    for file_path, task_type in entries:
+        record = app.MainWindow._prepare_task_record(pairing, file_path, ["fr", "de"], "Episode overview. " * 10, task_type, "TMDB")
+        record.title = "Show Title"
+        record.status = "Queued"
+        records.append(record)
+    model.append_tasks(records)
+    return model
+
+def load_items(app, entries):
+    model = app.CustomTaskModel(None)
+    pairing = Pairing()
+    for file_path, task_type in entries:
+        model_row = app.MainWindow._prepare_model_row(pairing, file_path, ["fr", "de"], "Episode overview. " * 10, task_type, "TMDB")
+        model_row[1].setText("Show Title")
+        model_row[1].setToolTip("Show Title")
+        model_row[3].setText("Queued")
+        model.appendRow(model_row)
+    return model
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure load time and memory of a restored task queue in CustomTaskModel.")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout whose main.py provides CustomTaskModel")
+    parser.add_argument("--tasks", type=int, default=20000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.repo)
+    import main as app
+    from PySide6.QtCore import QCoreApplication, Qt
+
+    qt_app = QCoreApplication.instance() or QCoreApplication([])
+    entries = make_queue(args.tasks)
+    load = load_records if hasattr(app, "TaskRecord") else load_items
+    print(f"{args.tasks} tasks, half video+subtitle, {load.__name__}")
+
+    gc.collect()
+    rss_before = current_rss()
+    tracemalloc.start()
+    model = load(app, entries)
+    python_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    rss_after = current_rss()
+
+    print(f"{'Python heap':30} {python_bytes / 1024 / 1024:9.1f} MB")
+    if rss_before is not None:
+        print(f"{'RSS growth':30} {(rss_after - rss_before) / 1024 / 1024:9.1f} MB")
+
+    started = time.perf_counter()
+    timed_model = load(app, entries)
+    print(f"{'load':30} {(time.perf_counter() - started) * 1000:9.1f} ms")
+    del timed_model
+
+    started = time.perf_counter()
+    for row in range(model.rowCount()):
+        for column in range(model.columnCount()):
+            model.index(row, column).data(Qt.DisplayRole)
+    print(f"{'read every cell':30} {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+    paths = [model.index(row, 0).data(app.PathRole) for row in range(model.rowCount())]
+    started = time.perf_counter()
+    for path in paths:
+        model.find_task_index(path)
+    print(f"{'find_task_index every path':30} {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+    del model
+    qt_app.processEvents()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def show_data(show):
+    return {"id": show, "name": f"Show {show}", "overview": "Show overview. " * 12, "genres": [{"name": "Drama"}]}
+
+def episode_data(episode):
+    return {"name": f"Episode {episode}", "overview": "Episode overview. " * 16, "episode_number": episode}
+
+def fill_cache(cache, shows, episodes_per_show):
+    started = time.perf_counter()
+    for show in range(shows):
+        title = f"Show {show}"
+        cache.cache_show(title, show, title, show_data(show))
+        for episode in range(1, episodes_per_show + 1):
+            cache.cache_episode(title, 1, episode, episode_data(episode))
+    return time.perf_counter() - started
+
+def report(label, seconds, operations):
+    print(f"{label:45} {seconds:8.2f} s   {seconds / operations * 1e6:9.1f} us/op")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time TMDB cache inserts, lookups, eviction and reload.")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout whose main.py provides TMDBCacheManager")
+    parser.add_argument("--episodes", type=int, default=50000)
+    parser.add_argument("--episodes-per-show", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=200000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.repo)
+    import main as app
+
+    shows = max(1, args.episodes // args.episodes_per_show)
+    episodes = shows * args.episodes_per_show
+    settings = {"tmdb_cache_size_limit_mb": 1000, "tmdb_cache_max_entries": shows}
+    print(f"{shows} shows x {args.episodes_per_show} episodes = {episodes} episodes")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = os.path.join(cache_dir, "tmdb_cache.json")
+        cache = app.TMDBCacheManager(cache_path, settings)
+        report("insert show + episodes", fill_cache(cache, shows, args.episodes_per_show), shows + episodes)
+
+        rng = random.Random(0)
+        keys = [(f"Show {rng.randrange(shows)}", rng.randint(1, args.episodes_per_show)) for _ in range(args.lookups)]
+        started = time.perf_counter()
+        for title, episode in keys:
+            cache.get_cached_episode(title, 1, episode)
+        report("episode lookup (hit)", time.perf_counter() - started, args.lookups)
+
+        started = time.perf_counter()
+        for _ in range(args.lookups):
+            cache.get_cached_episode("Missing Show", 1, 1)
+        report("episode lookup (miss)", time.perf_counter() - started, args.lookups)
+
+        if hasattr(cache, "flush"):
+            cache.flush()
+        started = time.perf_counter()
+        app.TMDBCacheManager(cache_path, settings)
+        report("reload from disk", time.perf_counter() - started, shows)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        evicting_settings = dict(settings, tmdb_cache_max_entries=max(1, shows // 2))
+        cache = app.TMDBCacheManager(os.path.join(cache_dir, "tmdb_cache.json"), evicting_settings)
+        report("insert under an entry budget of half", fill_cache(cache, shows, args.episodes_per_show), shows + episodes)
+        print(f"{'shows kept after eviction':45} {len(cache.cache):8d}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the real gemini_srt_translator, so its import cost is counted, but swaps translate()
+# for a stub: no network or API key is needed, and a job described as "block" waits to be cancelled.
+TRANSLATE_STUB = '''
+import sys
+import time
+import importlib.abc
+import importlib.machinery
+
+class StubTranslateFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name != "gemini_srt_translator":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        exec_module = spec.loader.exec_module
+
+        def exec_with_stub(module):
+            exec_module(module)
+
+            def translate():
+                if getattr(module, "description", None) == "block":
+                    time.sleep(60)
+            module.translate = translate
+
+        spec.loader.exec_module = exec_with_stub
+        return spec
+
+sys.meta_path.insert(0, StubTranslateFinder())
+'''
+
+JOB_ARGS = ["--gemini_api_key", "key", "--target_language", "French", "--input_file", "input.srt"]
+
+def report(label, timings):
+    print(f"{label:45} median {statistics.median(timings) * 1000:7.1f} ms   min {min(timings) * 1000:7.1f} ms")
+
+def time_cold_job(python, repo, entry_script):
+    started = time.perf_counter()
+    subprocess.run(
+        [python, entry_script, "--run-gst-subprocess"] + JOB_ARGS,
+        cwd=repo, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+    )
+    return time.perf_counter() - started
+
+def time_warm_job(worker_process, repo, description=None, cancel_after=None):
+    args = JOB_ARGS + (["--description", description] if description else [])
+    started = time.perf_counter()
+    cancel_at = None if cancel_after is None else started + cancel_after
+    returncode = worker_process.run_job(args, repo, lambda line: None, lambda: cancel_at is not None and time.perf_counter() >= cancel_at)
+    finished = time.perf_counter()
+    return returncode, finished - (cancel_at if cancel_at is not None else started)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per-language translation job overhead: one subprocess per job versus the warm worker.")
+    parser.add_argument("--repo", default=REPO_DIR, help="Checkout whose entry points and GSTWorkerProcess are timed")
+    parser.add_argument("--jobs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as stub_dir:
+        with open(os.path.join(stub_dir, "sitecustomize.py"), "w", encoding="utf-8") as f:
+            f.write(TRANSLATE_STUB)
+        os.environ["PYTHONPATH"] = os.pathsep.join(filter(None, [stub_dir, os.environ.get("PYTHONPATH")]))
+
+        import PySide6
+        print(f"Python {sys.version.split()[0]}, PySide6 {PySide6.__version__}, {args.jobs} jobs, translate() stubbed")
+
+        entry_script = "subprocess_entry.py"
+        if not os.path.exists(os.path.join(args.repo, entry_script)):
+            entry_script = "main.py"
+        time_cold_job(sys.executable, args.repo, entry_script)
+        report(f"new subprocess per job ({entry_script})", [time_cold_job(sys.executable, args.repo, entry_script) for _ in range(args.jobs)])
+
+        sys.path.insert(0, args.repo)
+        import main as app
+        if not hasattr(app, "GSTWorkerProcess"):
+            return
+
+        started = time.perf_counter()
+        worker_process = app.GSTWorkerProcess()
+        try:
+            time_warm_job(worker_process, args.repo)
+            report("warm worker, first job (includes startup)", [time.perf_counter() - started])
+
+            timings = []
+            for _ in range(args.jobs):
+                returncode, elapsed = time_warm_job(worker_process, args.repo)
+                if returncode != 0:
+                    print(f"warm worker job failed with return code {returncode}")
+                    return
+                timings.append(elapsed)
+            report("warm worker, later jobs", timings)
+
+            cancel_timings = []
+            for _ in range(5):
+                returncode, elapsed = time_warm_job(worker_process, args.repo, description="block", cancel_after=0.2)
+                if returncode != -1:
+                    print(f"cancelled job returned {returncode} instead of -1")
+                    return
+                cancel_timings.append(elapsed)
+            report("warm worker, cancel to return", cancel_timings)
+
+            returncode, elapsed = time_warm_job(worker_process, args.repo)
+            print(f"{'job after cancels':45} return code {returncode}, {elapsed * 1000:.1f} ms, worker alive: {worker_process.is_alive()}")
+        finally:
+            worker_process.shutdown()
+
+if __name__ == "__main__":
+    main()
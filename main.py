@@ -1,16 +1,32 @@
 import sys
+
+if __name__ == "__main__":
+    import subprocess_entry
+    if subprocess_entry.is_subprocess_invocation(sys.argv):
+        subprocess_entry.main()
+        sys.exit(0)
+
 import os
 import json
 import re
 import subprocess
 import signal
 import time
-import argparse
+import random
+import email.utils
 import queue
+import selectors
+import codecs
+import shutil
+import hashlib
+import sqlite3
 import threading
 import requests
 import datetime
+import functools
+import types
 from datetime import timedelta
+from collections import OrderedDict
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTreeView, QLineEdit, QLabel, QFileDialog, QMessageBox,
@@ -20,8 +36,9 @@ from PySide6.QtWidgets import (
     QStyledItemDelegate, QStyleOptionViewItem
 )
 from PySide6.QtGui import QStandardItemModel, QStandardItem, QAction, QIcon, QKeySequence, QFont, QPixmap, QPainter, QLinearGradient, QColor, QPen, QFontMetrics
-from PySide6.QtCore import Qt, QThread, Slot, QObject, Signal, QTimer, QItemSelectionModel, QRect, QModelIndex, QBuffer
+from PySide6.QtCore import Qt, QThread, QThreadPool, Slot, QObject, Signal, QTimer, QItemSelectionModel, QRect, QModelIndex, QAbstractItemModel, QBuffer
 from window import FramelessWidget
+from subprocess_entry import parse_gst_output_line
 
 PathRole = Qt.UserRole + 1
 VideoPathRole = Qt.UserRole + 2
@@ -30,6 +47,7 @@ LanguagesRole = Qt.UserRole + 4
 TaskTypeRole = Qt.UserRole + 5
 DescriptionSourceRole = Qt.UserRole + 6
 TMDBTitleRole = Qt.UserRole + 7
+ProgressRole = Qt.UserRole + 8
 
 APP_VERSION = "1.2.0"
 
@@ -41,6 +59,11 @@ def get_executable_path():
     exe_path = os.path.abspath(sys.argv[0])
     return exe_path
     
+def get_subprocess_command(mode):
+    if is_compiled():
+        return [get_executable_path(), mode]
+    return [sys.executable, get_resource_path("subprocess_entry.py"), mode]
+    
 def get_app_directory():
     app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     return app_dir
@@ -60,6 +83,15 @@ def get_persistent_path(relative_path):
         base_path = os.path.dirname(os.path.abspath(__file__))
 
     return os.path.join(base_path, relative_path)
+
+def get_language_workspace_path(input_path, lang_code):
+    workspace_key = f"{os.path.normcase(os.path.abspath(input_path))}\0{lang_code}"
+    workspace_name = hashlib.sha1(workspace_key.encode("utf-8")).hexdigest()[:16]
+    return get_persistent_path(os.path.join("Files", "workspaces", workspace_name))
+
+def remove_language_workspaces(input_path, lang_codes):
+    for lang_code in lang_codes:
+        shutil.rmtree(get_language_workspace_path(input_path, lang_code), ignore_errors=True)
     
 def setup_ffmpeg_path():
     if is_compiled():
@@ -95,6 +127,63 @@ def setup_ffmpeg_path():
     except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False
 
+def probe_primary_audio_stream(video_path):
+    creation_flags = 0
+    if os.name == 'nt':
+        creation_flags = subprocess.CREATE_NO_WINDOW
+    
+    result = subprocess.run(
+        ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams", "-show_format", "-select_streams", "a", video_path],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=60,
+        check=True,
+        creationflags=creation_flags
+    )
+    data = json.loads(result.stdout or "{}")
+    streams = data.get("streams") or []
+    if not streams:
+        return None
+    
+    stream = next((s for s in streams if s.get("disposition", {}).get("default")), streams[0])
+    try:
+        duration = float(data.get("format", {}).get("duration") or stream.get("duration") or 0)
+    except ValueError:
+        duration = 0
+    
+    return {"index": stream["index"], "channels": stream.get("channels", 1), "duration": duration}
+
+def build_audio_extraction_command(video_path, stream, output_path):
+    filters = []
+    channels = stream["channels"]
+    if channels >= 6:
+        filters.append("pan=mono|c0=FC")
+    elif channels > 1:
+        pan_expression = " + ".join(f"{1 / channels:.3f}*c{i}" for i in range(channels))
+        filters.append(f"pan=mono|c0={pan_expression}")
+        filters.extend(["highpass=f=80", "lowpass=f=3400"])
+    filters.append("aresample=async=1")
+    
+    bitrate = AUDIO_EXTRACTION_MAX_BITRATE
+    if stream["duration"] > 0:
+        target_bitrate = int(AUDIO_EXTRACTION_TARGET_MB * 8192 * 0.95 / stream["duration"])
+        bitrate = max(AUDIO_EXTRACTION_MIN_BITRATE, min(target_bitrate, AUDIO_EXTRACTION_MAX_BITRATE))
+    
+    return [
+        "ffmpeg", "-hide_banner", "-nostdin", "-nostats", "-loglevel", "error", "-y",
+        "-i", video_path,
+        "-map", f"0:{stream['index']}",
+        "-vn",
+        "-af", ",".join(filters),
+        "-acodec", "libmp3lame",
+        "-b:a", f"{bitrate}k",
+        "-progress", "pipe:1",
+        "-f", "mp3",
+        output_path
+    ]
+
 def load_svg(svg_path, color="#A0A0A0", size=None):
     try:
         with open(svg_path, 'r', encoding='utf-8') as f:
@@ -166,6 +255,10 @@ def load_stylesheet():
         
 VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov'}
 
+AUDIO_EXTRACTION_TARGET_MB = 20
+AUDIO_EXTRACTION_MIN_BITRATE = 16
+AUDIO_EXTRACTION_MAX_BITRATE = 192
+
 def is_video_file(file_path):
     return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
 
@@ -194,6 +287,7 @@ DEFAULT_SETTINGS = {
     "tmdb_request_timeout": 10,
     "tmdb_cache_expiry_days": 365,
     "tmdb_cache_size_limit_mb": 150,
+    "tmdb_cache_max_entries": 5000,
     "tmdb_auto_cleanup_cache": True,
     "tmdb_movie_template": "Overview: {movie.overview}\n\n{movie.title} - {movie.year}\nGenre(s): {movie.genres}",
     "tmdb_episode_template": "Episode Overview: {episode.overview}\n\n{show.title} {episode.number} - {episode.title}\nShow Overview: {show.overview}",
@@ -213,7 +307,13 @@ DEFAULT_SETTINGS = {
     "cleanup_audio_on_failure": False,
     "cleanup_audio_on_cancel": False,
     "cleanup_audio_on_remove": True,
-    "cleanup_audio_on_exit": False
+    "cleanup_audio_on_exit": False,
+    "audio_cache_enabled": True,
+    "audio_cache_size_limit_mb": 2048,
+    "max_concurrent_tasks": 1,
+    "max_concurrent_languages": 1,
+    "use_warm_worker": True,
+    "queue_storage": "json"
 }
 
 LANGUAGES = {
@@ -251,34 +351,45 @@ def _build_language_code_maps():
         two_letter_to_standard[two_letter] = two_letter
         three_letter_to_standard[three_letter] = two_letter
     
-    return two_letter_to_standard, three_letter_to_standard
+    return types.MappingProxyType(two_letter_to_standard), types.MappingProxyType(three_letter_to_standard)
+
+TWO_LETTER_CODE_MAP, THREE_LETTER_CODE_MAP = _build_language_code_maps()
+
+def _build_language_name_map():
+    names_by_code = {}
+    
+    for lang_name, (two_letter, three_letter) in LANGUAGES.items():
+        names_by_code.setdefault(two_letter, lang_name)
     
-def _normalize_language_code(code):
-    two_letter_map, three_letter_map = _build_language_code_maps()
+    return types.MappingProxyType(names_by_code)
+
+LANGUAGE_NAMES_BY_CODE = _build_language_name_map()
     
-    if code in two_letter_map:
-        return two_letter_map[code]
-    elif code in three_letter_map:
-        return three_letter_map[code]
+def _normalize_language_code(code):
+    if code in TWO_LETTER_CODE_MAP:
+        return TWO_LETTER_CODE_MAP[code]
+    elif code in THREE_LETTER_CODE_MAP:
+        return THREE_LETTER_CODE_MAP[code]
     
     return None
-    
+
+@functools.lru_cache(maxsize=65536)
 def _parse_subtitle_filename(subtitle_filename):
     if not subtitle_filename.lower().endswith('.srt'):
         return None
     
     basename = os.path.splitext(subtitle_filename)[0]
-    parts = basename.split('.')
+    parts = tuple(basename.split('.'))
     
     if len(parts) < 2:
-        return {
+        return types.MappingProxyType({
             'base_name': basename,
             'lang_code': None,
             'forced': False,
             'sdh': False,
             'modifiers_string': '',
             'original_parts': parts
-        }
+        })
     
     result = {
         'base_name': None,
@@ -325,22 +436,26 @@ def _parse_subtitle_filename(subtitle_filename):
     
     result['lang_code'] = lang_code
     
-    return result
-    
-def _get_all_language_codes():
+    return types.MappingProxyType(result)
+
+def _build_all_language_codes():
     codes = []
     for two_letter, three_letter in LANGUAGES.values():
         codes.append(two_letter)
         if three_letter != two_letter:
             codes.append(three_letter)
-    return codes
+    return tuple(codes)
+
+ALL_LANGUAGE_CODES = _build_all_language_codes()
+    
+def _get_all_language_codes():
+    return ALL_LANGUAGE_CODES
     
 def _strip_language_codes_from_name(name_part):
     parts = name_part.split('.')
     if len(parts) < 2:
         return name_part
     
-    all_codes = _get_all_language_codes()
     modifiers = ['forced', 'sdh']
     
     while len(parts) > 1:
@@ -380,192 +495,6 @@ def _files_are_pair(subtitle_path, video_path):
     
     return subtitle_info['base_name'] == video_base
     
-def run_gst_translation_subprocess():
-    parser = argparse.ArgumentParser(description="Run Gemini SRT Translator for a single file (subprocess mode).")
-    parser.add_argument("--run-gst-subprocess", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--gemini_api_key", required=True, help="Gemini API Key")
-    parser.add_argument("--target_language", required=True, help="Target language")
-    parser.add_argument("--input_file", help="Input SRT file path")
-    parser.add_argument("--video_file", help="Video file path")
-    parser.add_argument("--audio_file", help="Audio file path")
-    parser.add_argument("--extract_audio", type=bool, default=False, help="Extract audio from video")
-    parser.add_argument("--model_name", help="Gemini model")
-    parser.add_argument("--gemini_api_key2", help="Second API Key")
-    parser.add_argument("--output_file", help="Output file name")
-    parser.add_argument("--start_line", type=int, help="Start line")
-    parser.add_argument("--description", help="Description")
-    parser.add_argument("--batch_size", type=int, help="Batch size")
-    parser.add_argument("--free_quota", type=bool, help="Free quota")
-    parser.add_argument("--skip_upgrade", type=bool, help="Skip upgrade")
-    parser.add_argument("--use_colors", type=bool, help="Use colors")
-    parser.add_argument("--progress_log", type=bool, help="Progress log")
-    parser.add_argument("--thoughts_log", type=bool, help="Thoughts log")
-    parser.add_argument("--temperature", type=float, help="Temperature")
-    parser.add_argument("--top_p", type=float, help="Top P")
-    parser.add_argument("--top_k", type=int, help="Top K")
-    parser.add_argument("--streaming", type=bool, help="Streaming")
-    parser.add_argument("--thinking", type=bool, help="Thinking")
-    parser.add_argument("--thinking_budget", type=int, help="Thinking budget")
-    
-    args = parser.parse_args()
-    
-    if os.name == 'nt':
-        import subprocess
-
-        original_Popen = subprocess.Popen
-        original_run = subprocess.run
-
-        class PatchedPopen(original_Popen):
-            def __init__(self, *args, **kwargs):
-                if 'creationflags' not in kwargs:
-                    kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-                super().__init__(*args, **kwargs)
-
-        def patched_run(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
-            if not kwargs.get('capture_output') and not kwargs.get('stdout') and not kwargs.get('stderr'):
-                kwargs['stdout'] = subprocess.DEVNULL
-                kwargs['stderr'] = subprocess.DEVNULL
-                
-            return original_run(*args, **kwargs)
-
-        subprocess.Popen = PatchedPopen
-        subprocess.run = patched_run
-
-    try:
-        import gemini_srt_translator as gst
-        
-        gst.gemini_api_key = args.gemini_api_key
-        gst.target_language = args.target_language
-        
-        if args.video_file and args.extract_audio:
-            gst.video_file = args.video_file
-            gst.extract_audio = True
-        elif args.input_file:
-            gst.input_file = args.input_file
-        elif args.video_file:
-            gst.video_file = args.video_file
-        if args.audio_file:
-            gst.audio_file = args.audio_file
-        if args.extract_audio:
-            gst.extract_audio = args.extract_audio
-        if args.model_name:
-            gst.model_name = args.model_name
-        if args.gemini_api_key2:
-            gst.gemini_api_key2 = args.gemini_api_key2
-        if args.output_file:
-            gst.output_file = args.output_file
-        if args.start_line is not None:
-            gst.start_line = args.start_line
-        if args.description:
-            gst.description = args.description
-        if args.batch_size is not None:
-            gst.batch_size = args.batch_size
-        if args.free_quota is not None:
-            gst.free_quota = args.free_quota
-        if args.skip_upgrade is not None:
-            gst.skip_upgrade = args.skip_upgrade
-        if args.use_colors is not None:
-            gst.use_colors = args.use_colors
-        if args.progress_log is not None:
-            gst.progress_log = args.progress_log
-        if args.thoughts_log is not None:
-            gst.thoughts_log = args.thoughts_log
-        if args.temperature is not None:
-            gst.temperature = args.temperature
-        if args.top_p is not None:
-            gst.top_p = args.top_p
-        if args.top_k is not None:
-            gst.top_k = args.top_k
-        if args.streaming is not None:
-            gst.streaming = args.streaming
-        if args.thinking is not None:
-            gst.thinking = args.thinking
-        if args.thinking_budget is not None:
-            gst.thinking_budget = args.thinking_budget
-        
-        gst.use_colors = False
-        
-        gst.translate()
-        sys.exit(0)
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-        
-def run_audio_extraction_subprocess():
-    parser = argparse.ArgumentParser(description="Extract audio only")
-    parser.add_argument("--run-audio-extraction", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--gemini_api_key", required=True)
-    parser.add_argument("--video_file", required=True)
-    parser.add_argument("--model_name", default="gemini-2.5-flash")
-    
-    args = parser.parse_args()
-    
-    if os.name == 'nt':
-        import subprocess
-
-        original_Popen = subprocess.Popen
-        original_run = subprocess.run
-
-        class PatchedPopen(original_Popen):
-            def __init__(self, *args, **kwargs):
-                if 'creationflags' not in kwargs:
-                    kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-                super().__init__(*args, **kwargs)
-
-        def patched_run(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            
-            if not kwargs.get('capture_output') and not kwargs.get('stdout') and not kwargs.get('stderr'):
-                kwargs['stdout'] = subprocess.DEVNULL
-                kwargs['stderr'] = subprocess.DEVNULL
-
-            return original_run(*args, **kwargs)
-
-        subprocess.Popen = PatchedPopen
-        subprocess.run = patched_run
-    
-    try:
-        import gemini_srt_translator as gst
-        
-        gst.gemini_api_key = args.gemini_api_key
-        gst.video_file = args.video_file
-        gst.extract_audio = True
-        gst.target_language = "English"
-        gst.use_colors = False
-        gst.model_name = args.model_name
-        
-        print("Starting audio extraction and processing...")
-
-        gst.translate()
-        
-        video_dir = os.path.dirname(args.video_file)
-        video_name = os.path.splitext(os.path.basename(args.video_file))[0]
-        expected_audio = os.path.join(video_dir, f"{video_name}_extracted.mp3")
-        
-        if os.path.exists(expected_audio):
-            print(f"Success! Audio saved as: {expected_audio}")
-            dummy_subtitle = os.path.join(video_dir, f"{video_name}.srt")
-            if os.path.exists(dummy_subtitle):
-                try:
-                    os.remove(dummy_subtitle)
-                except OSError:
-                    pass
-            sys.exit(0)
-        else:
-            print("Audio extraction process finished, but the output file was not found.")
-            sys.exit(1)
-        
-    except Exception as e:
-        print(f"Error during audio extraction: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
 class IconTextDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -652,11 +581,12 @@ class IconTextDelegate(QStyledItemDelegate):
 class APIKeyValidator(QObject):
     validation_finished = Signal(str, bool)
 
-    def __init__(self, key_id, api_key, validation_model="gemini-flash-lite-latest"):
+    def __init__(self, key_id, api_key, validation_model="gemini-flash-lite-latest", session=None):
         super().__init__()
         self.key_id = key_id
         self.api_key = api_key.strip()
         self.validation_model = validation_model
+        self.session = session
 
     def run(self):
         is_valid = False
@@ -669,19 +599,27 @@ class APIKeyValidator(QObject):
                 client.models.count_tokens(model=self.validation_model, contents="test")
                 is_valid = True
             elif self.key_id == 'tmdb':
-                is_valid = _validate_tmdb_api_key(self.api_key)
+                is_valid = _validate_tmdb_api_key(self.api_key, self.session)
         except Exception:
             is_valid = False
         finally:
             self.validation_finished.emit(self.key_id, is_valid)
             
 class FileAdditionWorker(QObject):
-    finished = Signal(list)
+    tasks_discovered = Signal(list)
+    finished = Signal()
     status_update = Signal(str)
 
-    def __init__(self, file_paths):
+    def __init__(self, file_paths, chunk_size=200):
         super().__init__()
         self.file_paths = file_paths
+        self.chunk_size = chunk_size
+        self.cancelled = False
+        self.discovered_count = 0
+        self._pending_tasks = []
+
+    def cancel(self):
+        self.cancelled = True
 
     def _select_best_subtitle(self, subtitle_paths):
         best_subtitle = None
@@ -708,9 +646,67 @@ class FileAdditionWorker(QObject):
     def run(self):
         self.status_update.emit("Discovering Files...")
         
+        try:
+            files = [path for path in self.file_paths if not os.path.isdir(path)]
+            if files:
+                self._queue_tasks(self._build_tasks(files))
+            
+            for path in self.file_paths:
+                if self.cancelled:
+                    break
+                if os.path.isdir(path):
+                    self._walk_directory(path)
+            
+            if not self.cancelled:
+                self._emit_pending_tasks()
+        finally:
+            self.finished.emit()
+    
+    def _walk_directory(self, root):
+        directories = [root]
+        
+        while directories and not self.cancelled:
+            directory = directories.pop()
+            media_files = []
+            subdirectories = []
+            
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirectories.append(entry.path)
+                            elif is_video_file(entry.name) or is_subtitle_file(entry.name):
+                                media_files.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            
+            if media_files:
+                media_files.sort()
+                self._queue_tasks(self._build_tasks(media_files))
+            
+            directories.extend(sorted(subdirectories, reverse=True))
+    
+    def _queue_tasks(self, tasks):
+        self._pending_tasks.extend(tasks)
+        if len(self._pending_tasks) >= self.chunk_size:
+            self._emit_pending_tasks()
+    
+    def _emit_pending_tasks(self):
+        if self.cancelled or not self._pending_tasks:
+            return
+        
+        tasks, self._pending_tasks = self._pending_tasks, []
+        self.discovered_count += len(tasks)
+        self.tasks_discovered.emit(tasks)
+        self.status_update.emit(f"Discovering Files... {self.discovered_count} found (Click to Cancel)")
+    
+    def _build_tasks(self, file_paths):
         groups = {}
 
-        for path in self.file_paths:
+        for path in file_paths:
             if is_video_file(path):
                 base_name = os.path.splitext(os.path.basename(path))[0]
                 if base_name not in groups:
@@ -761,13 +757,13 @@ class FileAdditionWorker(QObject):
                         'requires_extraction': False
                     })
         
-        self.finished.emit(tasks_to_add)
+        return tasks_to_add
         
 class TMDBLookupWorker(QObject):
     finished = Signal(str, str, bool)
     status_update = Signal(str, str)
 
-    def __init__(self, task_id, lookup_file_path, api_key, movie_template, episode_template, semaphore, settings=None):
+    def __init__(self, task_id, lookup_file_path, api_key, movie_template, episode_template, settings=None, session=None, single_flight=None, rate_limiter=None):
         super().__init__()
         self.task_id = task_id
         self.lookup_file_path = lookup_file_path
@@ -775,8 +771,10 @@ class TMDBLookupWorker(QObject):
         self.movie_template = movie_template
         self.episode_template = episode_template
         self.base_url = "https://api.themoviedb.org/3"
-        self.semaphore = semaphore
         self.settings = settings or {}
+        self.session = session or requests
+        self.single_flight = single_flight or SingleFlight()
+        self.rate_limiter = rate_limiter or TMDBRateLimiter()
 
     def _trim_show_data(self, full_show_data):
         if not full_show_data:
@@ -798,11 +796,7 @@ class TMDBLookupWorker(QObject):
         }
 
     def run(self):
-        acquired = False
         try:
-            self.semaphore.acquire()
-            acquired = True
-            
             self.status_update.emit(self.task_id, "Fetching TMDB info...")
             
             parsed_info = self._parse_filename(self.lookup_file_path)
@@ -820,9 +814,6 @@ class TMDBLookupWorker(QObject):
             
         except Exception as e:
             self.finished.emit(self.task_id, "", False)
-        finally:
-            if acquired:
-                self.semaphore.release()
     
     def _parse_filename(self, file_path):
         basename = os.path.basename(file_path)
@@ -877,24 +868,32 @@ class TMDBLookupWorker(QObject):
         timeout = self.settings.get("tmdb_request_timeout", 10)
         
         for attempt in range(retries):
+            self.rate_limiter.acquire()
             try:
-                response = requests.get(f"{self.base_url}/{endpoint}", params=params, timeout=timeout)
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:
-                    time.sleep(10)
-                    continue
-                else:
-                    break
+                response = self.session.get(f"{self.base_url}/{endpoint}", params=params, timeout=timeout)
             except requests.RequestException:
                 if attempt < retries - 1:
-                    time.sleep(2)
+                    time.sleep(self.rate_limiter.backoff_delay(attempt))
                     continue
                 break
+            
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code == 200:
+                return response.json()
+            elif response.status_code == 429:
+                self.rate_limiter.throttle(response.headers.get("Retry-After"), attempt)
+                continue
+            else:
+                break
         
         return None
     
     def _lookup_movie(self, title, year=None):
+        movie_key = ("movie", title.lower().replace(' ', '_'), year)
+        return self.single_flight.do(movie_key, lambda: self._fetch_movie_description(title, year))
+    
+    def _fetch_movie_description(self, title, year=None):
         search_params = {'query': title}
         if year:
             search_params['year'] = year
@@ -938,20 +937,11 @@ class TMDBLookupWorker(QObject):
                 tv_id = cached_show["tmdb_id"]
                 tv_details = cached_show["data"]
             else:
-                search_result = self._make_request('search/tv', {'query': show_title})
-                if not search_result or not search_result.get('results'):
-                    return ""
+                show_key = ("tv", show_title.lower().replace(' ', '_'))
+                tv_id, tv_details = self.single_flight.do(show_key, lambda: self._fetch_show(show_title))
                 
-                tv_id = search_result['results'][0]['id']
-                full_tv_details = self._make_request(f'tv/{tv_id}')
-                
-                if not full_tv_details:
+                if not tv_details:
                     return ""
-                
-                tv_details = self._trim_show_data(full_tv_details)
-                
-                if hasattr(self, 'tmdb_cache'):
-                    self.tmdb_cache.cache_show(show_title, tv_id, tv_details.get('name', ''), tv_details)
 
             tv_id_for_episode_lookup = tv_details.get('id')
             if not tv_id_for_episode_lookup:
@@ -963,15 +953,22 @@ class TMDBLookupWorker(QObject):
             if not tv_id_for_episode_lookup:
                 return ""
 
-            full_episode_details = self._make_request(f'tv/{tv_id_for_episode_lookup}/season/{season}/episode/{episode}')
+            season_key = ("season", show_title.lower().replace(' ', '_'), season)
+            season_episodes = self.single_flight.do(
+                season_key, lambda: self._fetch_season(show_title, tv_id_for_episode_lookup, season)
+            )
+            episode_details = season_episodes.get(episode) if season_episodes else None
             
-            if not full_episode_details:
-                return ""
+            if not episode_details:
+                full_episode_details = self._make_request(f'tv/{tv_id_for_episode_lookup}/season/{season}/episode/{episode}')
+                
+                if not full_episode_details:
+                    return ""
 
-            episode_details = self._trim_episode_data(full_episode_details)
-            
-            if hasattr(self, 'tmdb_cache'):
-                self.tmdb_cache.cache_episode(show_title, season, episode, episode_details)
+                episode_details = self._trim_episode_data(full_episode_details)
+                
+                if hasattr(self, 'tmdb_cache'):
+                    self.tmdb_cache.cache_episode(show_title, season, episode, episode_details)
         
         episode_data = {
             'show.title': tv_details.get('name', ''),
@@ -985,6 +982,44 @@ class TMDBLookupWorker(QObject):
         
         return self._apply_template(self.episode_template, episode_data)
     
+    def _fetch_show(self, show_title):
+        cached_show = self.tmdb_cache.get_cached_show(show_title) if hasattr(self, 'tmdb_cache') else None
+        if cached_show:
+            return cached_show["tmdb_id"], cached_show["data"]
+        
+        search_result = self._make_request('search/tv', {'query': show_title})
+        if not search_result or not search_result.get('results'):
+            return None, None
+        
+        tv_id = search_result['results'][0]['id']
+        full_tv_details = self._make_request(f'tv/{tv_id}')
+        
+        if not full_tv_details:
+            return None, None
+        
+        tv_details = self._trim_show_data(full_tv_details)
+        
+        if hasattr(self, 'tmdb_cache'):
+            self.tmdb_cache.cache_show(show_title, tv_id, tv_details.get('name', ''), tv_details)
+        
+        return tv_id, tv_details
+    
+    def _fetch_season(self, show_title, tv_id, season):
+        season_details = self._make_request(f'tv/{tv_id}/season/{season}')
+        if not season_details:
+            return {}
+        
+        episodes = {}
+        for full_episode_details in season_details.get('episodes', []):
+            episode_number = full_episode_details.get('episode_number')
+            if episode_number is not None:
+                episodes[episode_number] = self._trim_episode_data(full_episode_details)
+        
+        if hasattr(self, 'tmdb_cache'):
+            self.tmdb_cache.cache_season(show_title, season, episodes)
+        
+        return episodes
+    
     def _apply_template(self, template, data):
         lines = template.split('\n')
         result_lines = []
@@ -1016,12 +1051,115 @@ class TMDBLookupWorker(QObject):
         
         return '\n'.join(result_lines)
 
-def _validate_tmdb_api_key(api_key):
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+    
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+        
+        if not is_leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+class TMDBRateLimiter:
+    def __init__(self, rate=20.0, capacity=20, max_backoff=30.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_backoff = max_backoff
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
+    
+    def backoff_delay(self, attempt):
+        return random.uniform(0, min(self.max_backoff, 2 ** attempt))
+    
+    def _block_for(self, delay):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            self._tokens = 0.0
+    
+    def throttle(self, retry_after=None, attempt=0):
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = email.utils.parsedate_to_datetime(retry_after)
+                    delay = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+        
+        if delay is None:
+            delay = 1 + self.backoff_delay(attempt)
+        else:
+            delay += random.uniform(0, 0.5)
+        
+        self._block_for(max(0.0, min(delay, self.max_backoff)))
+    
+    def update_from_headers(self, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            if int(remaining) <= 0:
+                delay = float(reset) - time.time()
+                if delay > 0:
+                    self._block_for(min(delay, self.max_backoff))
+        except ValueError:
+            pass
+
+def create_tmdb_session(pool_size=10):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+def _validate_tmdb_api_key(api_key, session=None):
     if not api_key or len(api_key.strip()) < 30:
         return False
     
     try:
-        response = requests.get(
+        response = (session or requests).get(
             f"https://api.themoviedb.org/3/configuration",
             params={'api_key': api_key.strip()},
             timeout=5
@@ -1033,35 +1171,152 @@ def _validate_tmdb_api_key(api_key):
 class TMDBCacheManager:
     def __init__(self, cache_file_path, settings=None):
         self.cache_file_path = cache_file_path
+        self.journal_file_path = cache_file_path + ".journal"
         self.settings = settings or {}
-        self.cache = self._load_cache()
         self._lock = threading.RLock()
+        self._pending_touches = {}
+        self._snapshot_size = 0
+        self._journal_size = 0
+        self.cache = self._load_cache()
+        self._entry_sizes = {show_key: self._measure_entry(show_data) for show_key, show_data in self.cache.items()}
+        self._cache_bytes = sum(self._entry_sizes.values())
+        
+        if os.path.exists(self.journal_file_path):
+            self._save_cache()
+        
         self._cleanup_expired_cache()
+        self.enforce_size_limit()
     
     def _load_cache(self):
+        cache = {}
         try:
             if os.path.exists(self.cache_file_path):
                 with open(self.cache_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    cache = json.load(f)
+                self._snapshot_size = os.path.getsize(self.cache_file_path)
         except Exception as e:
             print(f"Error loading TMDB cache: {e}")
         
-        return {}
+        self._replay_cache_journal(cache)
+        return OrderedDict(sorted(cache.items(), key=lambda item: item[1].get("last_used", "")))
     
-    def _save_cache(self):
+    def _replay_cache_journal(self, cache):
+        if not os.path.exists(self.journal_file_path):
+            return
+        
+        try:
+            with open(self.journal_file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    self._apply_cache_record(cache, record)
+        except Exception as e:
+            print(f"Error replaying TMDB cache journal: {e}")
+    
+    def _apply_cache_record(self, cache, record):
+        op = record.get("op")
+        show_key = record.get("key")
+        
+        if op == "show":
+            show_data = cache.setdefault(show_key, {"episodes": {}})
+            show_data.update(record["entry"])
+        elif op == "episode":
+            if show_key in cache:
+                cache[show_key].setdefault("episodes", {})[record["episode"]] = record["entry"]
+        elif op == "touch":
+            if show_key in cache:
+                cache[show_key]["last_used"] = record["last_used"]
+        elif op == "del":
+            cache.pop(show_key, None)
+    
+    def _save_cache(self, *records):
+        if records:
+            self._append_cache_records(records)
+        else:
+            self._write_cache_snapshot()
+    
+    def _append_cache_records(self, records):
+        with self._lock:
+            touch_records = [
+                {"op": "touch", "key": show_key, "last_used": last_used}
+                for show_key, last_used in self._pending_touches.items()
+            ]
+            self._pending_touches = {}
+            
+            try:
+                cache_dir = os.path.dirname(self.cache_file_path)
+                if not os.path.exists(cache_dir):
+                    os.makedirs(cache_dir, exist_ok=True)
+                
+                lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in touch_records + list(records))
+                with open(self.journal_file_path, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._journal_size += len(lines)
+            except Exception as e:
+                print(f"Error writing TMDB cache journal: {e}")
+                return
+            
+            if self._journal_size > max(1024 * 1024, self._snapshot_size):
+                self._write_cache_snapshot()
+    
+    def _write_cache_snapshot(self):
         with self._lock:
+            self._pending_touches = {}
             try:
                 cache_dir = os.path.dirname(self.cache_file_path)
                 if not os.path.exists(cache_dir):
                     os.makedirs(cache_dir, exist_ok=True)
                 
-                cache_copy = dict(self.cache)
+                temp_path = self.cache_file_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.cache, f, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.cache_file_path)
                 
-                with open(self.cache_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(cache_copy, f, indent=2, ensure_ascii=False)
+                if os.path.exists(self.journal_file_path):
+                    os.remove(self.journal_file_path)
+                
+                self._snapshot_size = os.path.getsize(self.cache_file_path)
+                self._journal_size = 0
             except Exception as e:
                 print(f"Error saving TMDB cache: {e}")
     
+    def flush(self):
+        with self._lock:
+            if self._pending_touches:
+                self._append_cache_records([])
+    
+    def _touch_show(self, show_key):
+        last_used = datetime.datetime.now().isoformat()
+        self.cache[show_key]["last_used"] = last_used
+        self.cache.move_to_end(show_key)
+        self._pending_touches[show_key] = last_used
+    
+    def _measure_entry(self, entry):
+        return len(json.dumps(entry))
+    
+    def _remove_show(self, show_key):
+        self.cache.pop(show_key, None)
+        self._pending_touches.pop(show_key, None)
+        self._cache_bytes -= self._entry_sizes.pop(show_key, 0)
+    
+    def enforce_size_limit(self):
+        with self._lock:
+            max_bytes = self.settings.get("tmdb_cache_size_limit_mb", 150) * 1024 * 1024
+            max_entries = max(1, self.settings.get("tmdb_cache_max_entries", 5000))
+            evicted_records = []
+            
+            while (self._cache_bytes > max_bytes or len(self.cache) > max_entries) and len(self.cache) > 1:
+                show_key = next(iter(self.cache))
+                self._remove_show(show_key)
+                evicted_records.append({"op": "del", "key": show_key})
+            
+            if evicted_records:
+                self._save_cache(*evicted_records)
+    
     def _cleanup_expired_cache(self):
         if not self.settings.get("tmdb_auto_cleanup_cache", True):
             return
@@ -1084,69 +1339,37 @@ class TMDBCacheManager:
                     expired_shows.append(show_key)
             
             for show_key in expired_shows:
-                del self.cache[show_key]
+                self._remove_show(show_key)
             
             if expired_shows:
                 self._save_cache()
-            
-            self._cleanup_oversized_cache()
-            
-    def _cleanup_oversized_cache(self):
-        try:
-            if os.path.exists(self.cache_file_path):
-                file_size_mb = os.path.getsize(self.cache_file_path) / (1024 * 1024)
-                max_size_mb = self.settings.get("tmdb_cache_size_limit_mb", 150)
-                
-                if file_size_mb > max_size_mb:
-                    entries_by_date = []
-                    for show_key, show_data in self.cache.items():
-                        last_used_str = show_data.get("last_used", "")
-                        if last_used_str:
-                            try:
-                                last_used = datetime.datetime.fromisoformat(last_used_str.replace('Z', ''))
-                                entries_by_date.append((last_used, show_key))
-                            except ValueError:
-                                entries_by_date.append((datetime.datetime.min, show_key))
-                        else:
-                            entries_by_date.append((datetime.datetime.min, show_key))
-                    
-                    entries_by_date.sort()
-                    
-                    entries_to_remove = len(entries_by_date) // 4
-                    if entries_to_remove > 0:
-                        for _, show_key in entries_by_date[:entries_to_remove]:
-                            del self.cache[show_key]
-                        
-                        self._save_cache()
-        except Exception as e:
-            pass
     
     def get_cached_show(self, show_title):
         with self._lock:
             show_key = show_title.lower().replace(' ', '_')
-            if show_key in self.cache:
-                show_data = self.cache[show_key]
-                show_data["last_used"] = datetime.datetime.now().isoformat()
-                self._save_cache()
-                return show_data
+            show_data = self.cache.get(show_key)
+            if show_data is not None:
+                self._touch_show(show_key)
             
-            return None
+            return show_data
     
     def cache_show(self, show_title, tmdb_id, title, show_data):
         with self._lock:
             show_key = show_title.lower().replace(' ', '_')
             if show_key not in self.cache:
-                self.cache[show_key] = {
+                entry = {
                     "tmdb_id": tmdb_id,
                     "title": title,
                     "data": show_data,
-                    "episodes": {},
                     "last_used": datetime.datetime.now().isoformat()
                 }
+                self.cache[show_key] = dict(entry, episodes={})
+                self._entry_sizes[show_key] = self._measure_entry(self.cache[show_key])
+                self._cache_bytes += self._entry_sizes[show_key]
+                self._save_cache({"op": "show", "key": show_key, "entry": entry})
+                self.enforce_size_limit()
             else:
-                self.cache[show_key]["last_used"] = datetime.datetime.now().isoformat()
-            
-            self._save_cache()
+                self._touch_show(show_key)
     
     def get_cached_episode(self, show_title, season, episode):
         with self._lock:
@@ -1154,12 +1377,10 @@ class TMDBCacheManager:
             episode_key = f"s{season:02d}e{episode:02d}"
             
             if show_key in self.cache:
-                show_data = self.cache[show_key]
-                episodes = show_data.get("episodes", {})
+                episodes = self.cache[show_key].get("episodes", {})
                 
                 if episode_key in episodes:
-                    show_data["last_used"] = datetime.datetime.now().isoformat()
-                    self._save_cache()
+                    self._touch_show(show_key)
                     return episodes[episode_key]
             
             return None
@@ -1170,69 +1391,383 @@ class TMDBCacheManager:
             episode_key = f"s{season:02d}e{episode:02d}"
             
             if show_key in self.cache:
-                if "episodes" not in self.cache[show_key]:
-                    self.cache[show_key]["episodes"] = {}
-                
-                self.cache[show_key]["episodes"][episode_key] = {
-                    "data": episode_data,
-                    "cached_at": datetime.datetime.now().isoformat()
-                }
-                
-                self.cache[show_key]["last_used"] = datetime.datetime.now().isoformat()
-                self._save_cache()
+                record = self._store_episode(show_key, episode_key, episode_data, datetime.datetime.now().isoformat())
+                self._touch_show(show_key)
+                self._save_cache(record)
+                self.enforce_size_limit()
+    
+    def cache_season(self, show_title, season, episodes_data):
+        with self._lock:
+            show_key = show_title.lower().replace(' ', '_')
+            if show_key not in self.cache or not episodes_data:
+                return
+            
+            cached_at = datetime.datetime.now().isoformat()
+            records = [
+                self._store_episode(show_key, f"s{season:02d}e{episode:02d}", episode_data, cached_at)
+                for episode, episode_data in episodes_data.items()
+            ]
+            self._touch_show(show_key)
+            self._save_cache(*records)
+            self.enforce_size_limit()
+    
+    def _store_episode(self, show_key, episode_key, episode_data, cached_at):
+        entry = {
+            "data": episode_data,
+            "cached_at": cached_at
+        }
+        episodes = self.cache[show_key].setdefault("episodes", {})
+        entry_size = self._measure_entry({episode_key: entry})
+        if episode_key in episodes:
+            entry_size -= self._measure_entry({episode_key: episodes[episode_key]})
+        episodes[episode_key] = entry
+        self._entry_sizes[show_key] = self._entry_sizes.get(show_key, 0) + entry_size
+        self._cache_bytes += entry_size
+        
+        return {"op": "episode", "key": show_key, "episode": episode_key, "entry": entry}
     
     def clear_cache(self):
         with self._lock:
-            self.cache = {}
+            self.cache = OrderedDict()
+            self._entry_sizes = {}
+            self._cache_bytes = 0
             self._save_cache()
 
-class QueueStateManager:
-    def __init__(self, queue_file_path):
-        self.queue_file_path = queue_file_path
-        self.state = self._load_queue_state()
+class ExtractedAudioCache:
+    IDENTITY_SAMPLE_BYTES = 1024 * 1024
+
+    def __init__(self, cache_dir, settings=None):
+        self.cache_dir = cache_dir
+        self.index_file_path = os.path.join(cache_dir, "index.json")
+        self.settings = settings or {}
+        self._lock = threading.RLock()
+        self._identities = {}
+        self.entries = self._load_index()
+        self._cache_bytes = sum(entry["size"] for entry in self.entries.values())
+        self.enforce_size_limit()
     
-    def _load_queue_state(self):
+    def _load_index(self):
+        entries = {}
         try:
-            if os.path.exists(self.queue_file_path):
-                with open(self.queue_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if os.path.exists(self.index_file_path):
+                with open(self.index_file_path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
         except Exception as e:
-            print(f"Error loading queue state: {e}")
+            print(f"Error loading audio cache index: {e}")
         
-        return {"queue_state": {}}
+        valid_entries = {}
+        for key, entry in entries.items():
+            cached_path = self._entry_path(key)
+            if not os.path.exists(cached_path):
+                continue
+            if os.stat(cached_path).st_nlink > 1 and not self._place_file(cached_path, cached_path):
+                continue
+            entry["size"] = os.path.getsize(cached_path)
+            valid_entries[key] = entry
         
-    def get_extracted_audio_file(self, subtitle_path):
-            if subtitle_path in self.state["queue_state"]:
-                audio_file = self.state["queue_state"][subtitle_path].get("extracted_audio_file")
-                return audio_file
-            return None
+        self._remove_orphaned_files(valid_entries)
+        return OrderedDict(sorted(valid_entries.items(), key=lambda item: item[1].get("last_used", "")))
     
-    def _save_queue_state(self):
+    def _remove_orphaned_files(self, entries):
         try:
-            queue_dir = os.path.dirname(self.queue_file_path)
-            if not os.path.exists(queue_dir):
-                os.makedirs(queue_dir, exist_ok=True)
-            
-            with open(self.queue_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving queue state: {e}")
+            with os.scandir(self.cache_dir) as directory_entries:
+                for directory_entry in directory_entries:
+                    name = directory_entry.name
+                    if name.endswith(".part") or (name.endswith(".mp3") and name[:-4] not in entries):
+                        try:
+                            os.remove(directory_entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
     
-    def add_subtitle_to_queue(self, subtitle_path, languages, description, output_pattern, task_type="subtitle", video_file=None, requires_extraction=False):
-        if subtitle_path not in self.state["queue_state"]:
-            self.state["queue_state"][subtitle_path] = {
-                "languages": {},
-                "description": description,
-                "target_languages": languages.copy(),
-                "output_pattern": output_pattern,
-                "task_type": task_type,
-                "video_file": video_file,
-                "requires_audio_extraction": requires_extraction,
-                "extracted_audio_file": None,
-                "audio_extraction_status": "pending"
-            }
-        
-        subtitle_dir = os.path.dirname(subtitle_path)
+    def _save_index(self):
+        with self._lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temp_path = self.index_file_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                os.replace(temp_path, self.index_file_path)
+            except Exception as e:
+                print(f"Error saving audio cache index: {e}")
+    
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+    
+    def is_enabled(self):
+        return self.settings.get("audio_cache_enabled", True)
+    
+    def video_identity(self, video_path):
+        stat = os.stat(video_path)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        known_identity = self._identities.get(video_path)
+        if known_identity and known_identity[0] == signature:
+            return known_identity[1]
+        
+        extraction_format = f"mp3:{AUDIO_EXTRACTION_TARGET_MB}:{AUDIO_EXTRACTION_MIN_BITRATE}:{AUDIO_EXTRACTION_MAX_BITRATE}"
+        digest = hashlib.sha1(f"{extraction_format}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        with open(video_path, 'rb') as f:
+            for offset in (0, stat.st_size // 2, stat.st_size - self.IDENTITY_SAMPLE_BYTES):
+                f.seek(max(0, offset))
+                digest.update(f.read(self.IDENTITY_SAMPLE_BYTES))
+        
+        identity = digest.hexdigest()
+        self._identities[video_path] = (signature, identity)
+        return identity
+    
+    def _place_file(self, source_path, target_path):
+        temp_path = f"{target_path}.part"
+        try:
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, target_path)
+            return True
+        except OSError as e:
+            print(f"Error copying extracted audio to {target_path}: {e}")
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+    
+    def _touch_entry(self, key):
+        self.entries[key]["last_used"] = datetime.datetime.now().isoformat()
+        self.entries.move_to_end(key)
+    
+    def _remove_entry(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        
+        self._cache_bytes -= entry["size"]
+        try:
+            os.remove(self._entry_path(key))
+        except OSError:
+            pass
+    
+    def restore(self, video_path, target_path):
+        if not self.is_enabled():
+            return False
+        
+        try:
+            key = self.video_identity(video_path)
+        except OSError:
+            return False
+        
+        with self._lock:
+            if key not in self.entries:
+                return False
+            
+            cached_path = self._entry_path(key)
+            if not os.path.exists(cached_path):
+                self._remove_entry(key)
+                self._save_index()
+                return False
+            
+            if not self._place_file(cached_path, target_path):
+                return False
+            
+            self._touch_entry(key)
+            self._save_index()
+            return True
+    
+    def store(self, video_path, audio_path):
+        if not self.is_enabled():
+            return
+        
+        try:
+            key = self.video_identity(video_path)
+        except OSError:
+            return
+        
+        with self._lock:
+            cached_path = self._entry_path(key)
+            if key not in self.entries or not os.path.exists(cached_path):
+                self._remove_entry(key)
+                if not self._place_file(audio_path, cached_path):
+                    return
+                self.entries[key] = {"size": os.path.getsize(cached_path)}
+                self._cache_bytes += self.entries[key]["size"]
+            
+            self._touch_entry(key)
+            self._save_index()
+            self.enforce_size_limit()
+    
+    def enforce_size_limit(self):
+        with self._lock:
+            max_bytes = self.settings.get("audio_cache_size_limit_mb", 2048) * 1024 * 1024
+            evicted = False
+            
+            while self._cache_bytes > max_bytes and len(self.entries) > 1:
+                self._remove_entry(next(iter(self.entries)))
+                evicted = True
+            
+            if evicted:
+                self._save_index()
+    
+    def clear_cache(self):
+        with self._lock:
+            for key in list(self.entries):
+                self._remove_entry(key)
+            self._cache_bytes = 0
+            self._save_index()
+
+def backup_migrated_queue_files(source_path, suffixes):
+    for suffix in suffixes:
+        if os.path.exists(source_path + suffix):
+            os.replace(source_path + suffix, source_path + ".bak" + suffix)
+
+def remove_migrated_queue_backup(source_path, suffixes):
+    for suffix in suffixes:
+        backup_path = source_path + ".bak" + suffix
+        if os.path.exists(backup_path):
+            try:
+                os.remove(backup_path)
+            except OSError as e:
+                print(f"Error removing migrated queue backup: {e}")
+
+class QueueStateManager:
+    audio_cache = None
+
+    def __init__(self, queue_file_path):
+        self.queue_file_path = queue_file_path
+        self.journal_file_path = queue_file_path + ".journal"
+        self._lock = threading.RLock()
+        self._journal_records = 0
+        self.load_failed = False
+        self.state = self._load_queue_state()
+        
+        if os.path.exists(self.journal_file_path):
+            self._compact_queue_state()
+    
+    def _load_queue_state(self):
+        state = {"queue_state": {}}
+        try:
+            if os.path.exists(self.queue_file_path):
+                with open(self.queue_file_path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+        except Exception as e:
+            print(f"Error loading queue state: {e}")
+            self.load_failed = True
+        
+        self._replay_queue_journal(state)
+        return state
+    
+    def _replay_queue_journal(self, state):
+        if not os.path.exists(self.journal_file_path):
+            return
+        
+        try:
+            with open(self.journal_file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    
+                    if record.get("op") == "set":
+                        state["queue_state"][record["path"]] = record["entry"]
+                    elif record.get("op") == "del":
+                        state["queue_state"].pop(record["path"], None)
+        except Exception as e:
+            print(f"Error replaying queue journal: {e}")
+            self.load_failed = True
+        
+    def get_extracted_audio_file(self, subtitle_path):
+            if subtitle_path in self.state["queue_state"]:
+                audio_file = self.state["queue_state"][subtitle_path].get("extracted_audio_file")
+                return audio_file
+            return None
+    
+    def _save_queue_state(self, *subtitle_paths):
+        with self._lock:
+            if not subtitle_paths:
+                return self._compact_queue_state()
+            
+            try:
+                queue_dir = os.path.dirname(self.queue_file_path)
+                if not os.path.exists(queue_dir):
+                    os.makedirs(queue_dir, exist_ok=True)
+                
+                records = []
+                for subtitle_path in subtitle_paths:
+                    entry = self.state["queue_state"].get(subtitle_path)
+                    if entry is None:
+                        records.append(json.dumps({"op": "del", "path": subtitle_path}, ensure_ascii=False))
+                    else:
+                        records.append(json.dumps({"op": "set", "path": subtitle_path, "entry": entry}, ensure_ascii=False))
+                
+                with open(self.journal_file_path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(records) + "\n")
+                self._journal_records += len(records)
+            except Exception as e:
+                print(f"Error writing queue journal: {e}")
+                return False
+            
+            if self._journal_records > max(200, len(self.state["queue_state"])):
+                return self._compact_queue_state()
+            return True
+    
+    def _save_language_state(self, subtitle_path, lang_code):
+        return self._save_queue_state(subtitle_path)
+    
+    def _save_task_data(self, *subtitle_paths):
+        return self._save_queue_state(*subtitle_paths)
+    
+    def _compact_queue_state(self):
+        with self._lock:
+            try:
+                queue_dir = os.path.dirname(self.queue_file_path)
+                if not os.path.exists(queue_dir):
+                    os.makedirs(queue_dir, exist_ok=True)
+                
+                temp_path = self.queue_file_path + ".tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.queue_file_path)
+                
+                if os.path.exists(self.journal_file_path):
+                    os.remove(self.journal_file_path)
+                self._journal_records = 0
+                return True
+            except Exception as e:
+                print(f"Error saving queue state: {e}")
+                return False
+    
+    def add_subtitle_to_queue(self, subtitle_path, languages, description, output_pattern, task_type="subtitle", video_file=None, requires_extraction=False):
+        self._add_queue_entry(subtitle_path, languages, description, output_pattern, task_type, video_file, requires_extraction)
+        self._save_queue_state(subtitle_path)
+    
+    def add_subtitles_to_queue(self, subtitles, languages, description, output_pattern):
+        subtitle_paths = []
+        for subtitle_path, task_type, video_file, requires_extraction in subtitles:
+            self._add_queue_entry(subtitle_path, languages, description, output_pattern, task_type, video_file, requires_extraction)
+            subtitle_paths.append(subtitle_path)
+        
+        if subtitle_paths:
+            self._save_queue_state(*subtitle_paths)
+    
+    def _add_queue_entry(self, subtitle_path, languages, description, output_pattern, task_type, video_file, requires_extraction):
+        if subtitle_path not in self.state["queue_state"]:
+            self.state["queue_state"][subtitle_path] = {
+                "languages": {},
+                "description": description,
+                "target_languages": languages.copy(),
+                "output_pattern": output_pattern,
+                "task_type": task_type,
+                "video_file": video_file,
+                "requires_audio_extraction": requires_extraction,
+                "extracted_audio_file": None,
+                "audio_extraction_status": "pending"
+            }
+        
+        subtitle_dir = os.path.dirname(subtitle_path)
         subtitle_basename = os.path.basename(subtitle_path)
         
         subtitle_parsed = _parse_subtitle_filename(subtitle_basename)
@@ -1264,13 +1799,11 @@ class QueueStateManager:
                     "status": "queued",
                     "output_file": output_path
                 }
-        
-        self._save_queue_state()
     
     def remove_subtitle_from_queue(self, subtitle_path):
         if subtitle_path in self.state["queue_state"]:
             del self.state["queue_state"][subtitle_path]
-            self._save_queue_state()
+            self._save_queue_state(subtitle_path)
     
     def get_current_language_in_progress(self, subtitle_path):
         if subtitle_path not in self.state["queue_state"]:
@@ -1300,31 +1833,59 @@ class QueueStateManager:
         
         return None
     
+    def claim_next_language(self, subtitle_path, exclude=()):
+        with self._lock:
+            if subtitle_path not in self.state["queue_state"]:
+                return None
+            
+            languages = self.state["queue_state"][subtitle_path]["languages"]
+            target_languages = self.state["queue_state"][subtitle_path]["target_languages"]
+            
+            for lang_code in target_languages:
+                if lang_code in exclude or lang_code not in languages:
+                    continue
+                if languages[lang_code]["status"] == "in_progress":
+                    return lang_code
+            
+            for lang_code in target_languages:
+                if lang_code in exclude or lang_code not in languages:
+                    continue
+                if languages[lang_code]["status"] == "queued":
+                    languages[lang_code]["status"] = "in_progress"
+                    self._save_language_state(subtitle_path, lang_code)
+                    return lang_code
+            
+            return None
+    
     def mark_language_in_progress(self, subtitle_path, lang_code):
-        if subtitle_path in self.state["queue_state"]:
-            if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
-                self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "in_progress"
-                self._save_queue_state()
+        with self._lock:
+            if subtitle_path in self.state["queue_state"]:
+                if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
+                    self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "in_progress"
+                    self._save_language_state(subtitle_path, lang_code)
     
     def mark_language_completed(self, subtitle_path, lang_code):
-        if subtitle_path in self.state["queue_state"]:
-            if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
-                self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "completed"
-                self._save_queue_state()
+        with self._lock:
+            if subtitle_path in self.state["queue_state"]:
+                if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
+                    self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "completed"
+                    self._save_language_state(subtitle_path, lang_code)
     
     def mark_language_queued(self, subtitle_path, lang_code):
-        if subtitle_path in self.state["queue_state"]:
-            if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
-                self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "queued"
-                self._save_queue_state()
+        with self._lock:
+            if subtitle_path in self.state["queue_state"]:
+                if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
+                    self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "queued"
+                    self._save_language_state(subtitle_path, lang_code)
     
     def get_language_progress_summary(self, subtitle_path):
-        if subtitle_path not in self.state["queue_state"]:
-            return "Queued"
-        
-        languages = self.state["queue_state"][subtitle_path]["languages"]
-        total_languages = len(languages)
-        completed_count = sum(1 for lang_data in languages.values() if lang_data["status"] == "completed")
+        with self._lock:
+            if subtitle_path not in self.state["queue_state"]:
+                return "Queued"
+            
+            languages = self.state["queue_state"][subtitle_path]["languages"]
+            total_languages = len(languages)
+            completed_count = sum(1 for lang_data in languages.values() if lang_data["status"] == "completed")
         
         if completed_count == 0:
             return "Queued"
@@ -1353,6 +1914,7 @@ class QueueStateManager:
                         os.remove(progress_file)
                     except Exception:
                         pass
+                remove_language_workspaces(subtitle_path, languages.keys())
     
     def _get_progress_file_path(self, subtitle_path):
         original_basename = os.path.basename(subtitle_path)
@@ -1364,6 +1926,10 @@ class QueueStateManager:
     def clear_all_state(self):
         self.state = {"queue_state": {}}
         self._save_queue_state()
+    
+    def close(self):
+        if self._journal_records:
+            self._compact_queue_state()
         
     def update_subtitle_languages(self, subtitle_path, new_languages, description, output_pattern):
         if subtitle_path in self.state["queue_state"]:
@@ -1423,14 +1989,15 @@ class QueueStateManager:
                     "output_file": output_path
                 }
             
-            self._save_queue_state()
+            self._save_queue_state(subtitle_path)
             
     def set_audio_extraction_status(self, subtitle_path, status, audio_file_path=None):
-        if subtitle_path in self.state["queue_state"]:
-            self.state["queue_state"][subtitle_path]["audio_extraction_status"] = status
-            if audio_file_path:
-                self.state["queue_state"][subtitle_path]["extracted_audio_file"] = audio_file_path
-            self._save_queue_state()
+        with self._lock:
+            if subtitle_path in self.state["queue_state"]:
+                self.state["queue_state"][subtitle_path]["audio_extraction_status"] = status
+                if audio_file_path:
+                    self.state["queue_state"][subtitle_path]["extracted_audio_file"] = audio_file_path
+                self._save_task_data(subtitle_path)
     
     def get_extracted_subtitle_file(self, subtitle_path):
         if subtitle_path in self.state["queue_state"]:
@@ -1441,8 +2008,12 @@ class QueueStateManager:
     def should_extract_audio(self, subtitle_path):
         if subtitle_path in self.state["queue_state"]:
             entry = self.state["queue_state"][subtitle_path]
-            return (entry.get("requires_audio_extraction", False) and 
-                    entry.get("audio_extraction_status") != "completed")
+            if not entry.get("requires_audio_extraction", False):
+                return False
+            if entry.get("audio_extraction_status") == "completed":
+                return False
+            audio_file, _ = self.sync_audio_extraction_status(subtitle_path)
+            return not (audio_file and os.path.exists(audio_file))
         return False
     
     def get_all_extracted_audio_files(self):
@@ -1470,10 +2041,11 @@ class QueueStateManager:
                 except Exception as e:
                     pass
             
-            self.state["queue_state"][subtitle_path]["extracted_audio_file"] = None
-            self.state["queue_state"][subtitle_path]["extracted_subtitle_file"] = None
-            self.state["queue_state"][subtitle_path]["audio_extraction_status"] = "pending"
-            self._save_queue_state()
+            with self._lock:
+                self.state["queue_state"][subtitle_path]["extracted_audio_file"] = None
+                self.state["queue_state"][subtitle_path]["extracted_subtitle_file"] = None
+                self.state["queue_state"][subtitle_path]["audio_extraction_status"] = "pending"
+                self._save_task_data(subtitle_path)
             
     def sync_audio_extraction_status(self, subtitle_path):
         if subtitle_path not in self.state["queue_state"]:
@@ -1493,6 +2065,8 @@ class QueueStateManager:
             expected_subtitle = os.path.join(video_dir, f"{video_name}_extracted.srt")
             
             audio_exists = os.path.exists(expected_audio)
+            if not audio_exists and self.audio_cache is not None and entry.get("requires_audio_extraction", False):
+                audio_exists = self.audio_cache.restore(video_file, expected_audio)
             subtitle_exists = os.path.exists(expected_subtitle)
             
             if audio_exists:
@@ -1505,16 +2079,17 @@ class QueueStateManager:
                     if not current_extracted_subtitle:
                         self.state["queue_state"][subtitle_path]["extracted_subtitle_file"] = None
                 
-                self._save_queue_state()
+                self._save_task_data(subtitle_path)
                 return expected_audio, expected_subtitle if subtitle_exists else current_extracted_subtitle
         
         return current_audio_file, current_extracted_subtitle
         
     def mark_language_skipped(self, subtitle_path, lang_code):
-        if subtitle_path in self.state["queue_state"]:
-            if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
-                self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "skipped"
-                self._save_queue_state()
+        with self._lock:
+            if subtitle_path in self.state["queue_state"]:
+                if lang_code in self.state["queue_state"][subtitle_path]["languages"]:
+                    self.state["queue_state"][subtitle_path]["languages"][lang_code]["status"] = "skipped"
+                    self._save_language_state(subtitle_path, lang_code)
                 
     def transform_to_video_subtitle(self, old_path, new_subtitle_path, new_video_path):
         if old_path in self.state["queue_state"]:
@@ -1525,7 +2100,7 @@ class QueueStateManager:
             entry_data["requires_audio_extraction"] = True
             
             self.state["queue_state"][new_subtitle_path] = entry_data
-            self._save_queue_state()
+            self._save_queue_state(old_path, new_subtitle_path)
             return True
         return False
         
@@ -1534,7 +2109,232 @@ class QueueStateManager:
             entry = self.state["queue_state"][subtitle_path]
             entry["description"] = new_description
             entry["description_source"] = source
-            self._save_queue_state()
+            self._save_task_data(subtitle_path)
+
+class SQLiteQueueStateManager(QueueStateManager):
+    def __init__(self, database_path, legacy_queue_file_path=None):
+        self.database_path = database_path
+        self.legacy_queue_file_path = legacy_queue_file_path
+        self._lock = threading.RLock()
+        
+        database_dir = os.path.dirname(database_path)
+        if database_dir and not os.path.exists(database_dir):
+            os.makedirs(database_dir, exist_ok=True)
+        
+        self.connection = sqlite3.connect(database_path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                path TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS languages (
+                task_path TEXT NOT NULL,
+                lang_code TEXT NOT NULL,
+                position INTEGER,
+                status TEXT NOT NULL,
+                output_file TEXT,
+                PRIMARY KEY (task_path, lang_code)
+            );
+            CREATE INDEX IF NOT EXISTS idx_languages_status ON languages (status);
+            CREATE INDEX IF NOT EXISTS idx_languages_task_status ON languages (task_path, status, position);
+        """)
+        
+        self.load_failed = False
+        migrated = self._migrate_legacy_queue_state()
+        self.state = self._load_queue_state()
+        
+        if legacy_queue_file_path and not migrated and not self.load_failed:
+            remove_migrated_queue_backup(legacy_queue_file_path, ("", ".journal"))
+    
+    def _migrate_legacy_queue_state(self):
+        legacy_path = self.legacy_queue_file_path
+        if not legacy_path:
+            return False
+        if not os.path.exists(legacy_path) and not os.path.exists(legacy_path + ".journal"):
+            return False
+        if self.connection.execute("SELECT 1 FROM tasks LIMIT 1").fetchone():
+            return False
+        
+        legacy_manager = QueueStateManager(legacy_path)
+        if legacy_manager.load_failed:
+            return False
+        
+        self.state = legacy_manager.state
+        if not self._save_queue_state(*self.state["queue_state"].keys()):
+            return False
+        
+        try:
+            backup_migrated_queue_files(legacy_path, ("", ".journal"))
+        except OSError as e:
+            print(f"Error backing up migrated queue state file: {e}")
+        return True
+    
+    def _load_queue_state(self):
+        state = {"queue_state": {}}
+        try:
+            with self._lock:
+                for path, data in self.connection.execute("SELECT path, data FROM tasks ORDER BY rowid"):
+                    entry = json.loads(data)
+                    entry["languages"] = {}
+                    state["queue_state"][path] = entry
+                
+                rows = self.connection.execute(
+                    "SELECT task_path, lang_code, status, output_file FROM languages ORDER BY task_path, position"
+                )
+                for task_path, lang_code, status, output_file in rows:
+                    if task_path in state["queue_state"]:
+                        state["queue_state"][task_path]["languages"][lang_code] = {
+                            "status": status,
+                            "output_file": output_file
+                        }
+        except Exception as e:
+            print(f"Error loading queue state: {e}")
+            self.load_failed = True
+        
+        return state
+    
+    def _write_task_data(self, subtitle_path, entry):
+        data = {key: value for key, value in entry.items() if key != "languages"}
+        self.connection.execute(
+            "INSERT INTO tasks (path, data) VALUES (?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET data = excluded.data WHERE data IS NOT excluded.data",
+            (subtitle_path, json.dumps(data, ensure_ascii=False))
+        )
+    
+    def _language_rows(self, subtitle_path, entry, lang_codes):
+        target_languages = entry.get("target_languages", [])
+        positions = {lang_code: position for position, lang_code in enumerate(target_languages)}
+        languages = entry.get("languages", {})
+        return [
+            (subtitle_path, lang_code, positions.get(lang_code), languages[lang_code].get("status", "queued"), languages[lang_code].get("output_file"))
+            for lang_code in lang_codes
+        ]
+    
+    def _write_language_rows(self, rows):
+        self.connection.executemany(
+            "INSERT INTO languages (task_path, lang_code, position, status, output_file) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (task_path, lang_code) DO UPDATE SET "
+            "position = excluded.position, status = excluded.status, output_file = excluded.output_file "
+            "WHERE position IS NOT excluded.position OR status IS NOT excluded.status OR output_file IS NOT excluded.output_file",
+            rows
+        )
+    
+    def _write_task_rows(self, subtitle_path):
+        entry = self.state["queue_state"].get(subtitle_path)
+        if entry is None:
+            self.connection.execute("DELETE FROM languages WHERE task_path = ?", (subtitle_path,))
+            self.connection.execute("DELETE FROM tasks WHERE path = ?", (subtitle_path,))
+            return
+        
+        self._write_task_data(subtitle_path, entry)
+        
+        languages = entry.get("languages", {})
+        stored_languages = [
+            lang_code for (lang_code,) in
+            self.connection.execute("SELECT lang_code FROM languages WHERE task_path = ?", (subtitle_path,))
+        ]
+        self.connection.executemany(
+            "DELETE FROM languages WHERE task_path = ? AND lang_code = ?",
+            [(subtitle_path, lang_code) for lang_code in stored_languages if lang_code not in languages]
+        )
+        self._write_language_rows(self._language_rows(subtitle_path, entry, languages))
+    
+    def _run_in_transaction(self, write):
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                try:
+                    write()
+                    self.connection.execute("COMMIT")
+                except Exception:
+                    self.connection.execute("ROLLBACK")
+                    raise
+                return True
+            except Exception as e:
+                print(f"Error saving queue state: {e}")
+                return False
+    
+    def _save_queue_state(self, *subtitle_paths):
+        def write():
+            paths = subtitle_paths
+            if not paths:
+                self.connection.execute("DELETE FROM languages")
+                self.connection.execute("DELETE FROM tasks")
+                paths = list(self.state["queue_state"].keys())
+            
+            for subtitle_path in paths:
+                self._write_task_rows(subtitle_path)
+        
+        return self._run_in_transaction(write)
+    
+    def _save_language_state(self, subtitle_path, lang_code):
+        with self._lock:
+            entry = self.state["queue_state"].get(subtitle_path)
+            if entry is None or lang_code not in entry.get("languages", {}):
+                return self._save_queue_state(subtitle_path)
+            
+            try:
+                self._write_language_rows(self._language_rows(subtitle_path, entry, [lang_code]))
+                return True
+            except Exception as e:
+                print(f"Error saving queue state: {e}")
+                return False
+    
+    def _save_task_data(self, *subtitle_paths):
+        def write():
+            for subtitle_path in subtitle_paths:
+                entry = self.state["queue_state"].get(subtitle_path)
+                if entry is None:
+                    self._write_task_rows(subtitle_path)
+                else:
+                    self._write_task_data(subtitle_path, entry)
+        
+        return self._run_in_transaction(write)
+    
+    def get_next_language_to_process(self, subtitle_path):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT lang_code FROM languages WHERE task_path = ? AND status = 'in_progress' AND position IS NOT NULL "
+                "ORDER BY position LIMIT 1",
+                (subtitle_path,)
+            ).fetchone()
+            if row is None:
+                row = self.connection.execute(
+                    "SELECT lang_code FROM languages WHERE task_path = ? AND status = 'queued' AND position IS NOT NULL "
+                    "ORDER BY position LIMIT 1",
+                    (subtitle_path,)
+                ).fetchone()
+        
+        return row[0] if row else None
+    
+    def get_language_progress_summary(self, subtitle_path):
+        with self._lock:
+            total_languages, completed_count = self.connection.execute(
+                "SELECT COUNT(*), COUNT(CASE WHEN status = 'completed' THEN 1 END) FROM languages WHERE task_path = ?",
+                (subtitle_path,)
+            ).fetchone()
+        
+        if completed_count == 0:
+            return "Queued"
+        elif completed_count == total_languages:
+            return "Translated"
+        else:
+            return f"{completed_count}/{total_languages} Languages completed"
+    
+    def has_any_work_remaining(self):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM languages WHERE status IN ('queued', 'in_progress') LIMIT 1"
+            ).fetchone()
+        return row is not None
+    
+    def close(self):
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
 
 class DialogTitleBarWidget(QWidget):
     def __init__(self, title="Dialog", parent=None):
@@ -2052,6 +2852,19 @@ class SettingsDialog(CustomFramelessDialog):
         
         form_layout.addRow("Queue on Exit:", self.queue_on_exit_combo)
         
+        self.queue_storage_combo = QComboBox()
+        self.queue_storage_combo.addItem("JSON File", "json")
+        self.queue_storage_combo.addItem("SQLite Database", "sqlite")
+        self.queue_storage_combo.setToolTip("Where the translation queue is stored. SQLite is faster for large queues; the existing queue is migrated on the next start.")
+        
+        current_setting = self.settings.get("queue_storage", "json")
+        for i in range(self.queue_storage_combo.count()):
+            if self.queue_storage_combo.itemData(i) == current_setting:
+                self.queue_storage_combo.setCurrentIndex(i)
+                break
+        
+        form_layout.addRow("Queue Storage:", self.queue_storage_combo)
+        
         self.existing_file_combo = QComboBox()
         self.existing_file_combo.addItem("Skip Existing Files", "skip")
         self.existing_file_combo.addItem("Overwrite Always (Skips if same as input)", "overwrite")
@@ -2064,6 +2877,20 @@ class SettingsDialog(CustomFramelessDialog):
         
         form_layout.addRow("Existing Output Files:", self.existing_file_combo)
         
+        self.concurrent_tasks_spin = QSpinBox()
+        self.concurrent_tasks_spin.setRange(1, 8)
+        self.concurrent_tasks_spin.setValue(self.settings.get("max_concurrent_tasks", 1))
+        self.concurrent_tasks_spin.setMaximumWidth(150)
+        self.concurrent_tasks_spin.setToolTip("Number of queue items translated at the same time (1-8). Higher values finish large queues faster but use more API quota at once.")
+        form_layout.addRow("Concurrent Tasks:", self.concurrent_tasks_spin)
+        
+        self.concurrent_languages_spin = QSpinBox()
+        self.concurrent_languages_spin.setRange(1, 8)
+        self.concurrent_languages_spin.setValue(self.settings.get("max_concurrent_languages", 1))
+        self.concurrent_languages_spin.setMaximumWidth(150)
+        self.concurrent_languages_spin.setToolTip("Number of languages of a single subtitle translated at the same time (1-8).")
+        form_layout.addRow("Parallel Languages per Task:", self.concurrent_languages_spin)
+        
         main_layout.addLayout(form_layout)
         
         self.update_queue_languages_checkbox = QCheckBox("Auto-Update Queue Languages")
@@ -2071,6 +2898,11 @@ class SettingsDialog(CustomFramelessDialog):
         self.update_queue_languages_checkbox.setToolTip("When enabled, changing the language selection will update all existing queue items that match the previous selection")
         main_layout.addWidget(self.update_queue_languages_checkbox)
         
+        self.warm_worker_checkbox = QCheckBox("Keep Translation Worker Running")
+        self.warm_worker_checkbox.setChecked(self.settings.get("use_warm_worker", True))
+        self.warm_worker_checkbox.setToolTip("When enabled, translations run in a background worker that stays loaded between languages instead of starting a new process each time")
+        main_layout.addWidget(self.warm_worker_checkbox)
+        
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         main_layout.addWidget(separator)
@@ -2100,6 +2932,32 @@ class SettingsDialog(CustomFramelessDialog):
         
         main_layout.addWidget(cleanup_widget)
         
+        self.audio_cache_checkbox = QCheckBox("Keep Extracted Audio in Cache")
+        self.audio_cache_checkbox.setChecked(self.settings.get("audio_cache_enabled", True))
+        self.audio_cache_checkbox.setToolTip("Reuse previously extracted audio when the same video is queued again, even after its audio file was deleted")
+        main_layout.addWidget(self.audio_cache_checkbox)
+        
+        audio_cache_widget = QWidget()
+        audio_cache_layout = QHBoxLayout(audio_cache_widget)
+        audio_cache_layout.setContentsMargins(20, 0, 0, 0)
+        
+        audio_cache_form = QFormLayout()
+        self.audio_cache_size_spin = QSpinBox()
+        self.audio_cache_size_spin.setRange(100, 100000)
+        self.audio_cache_size_spin.setSingleStep(256)
+        self.audio_cache_size_spin.setValue(self.settings.get("audio_cache_size_limit_mb", 2048))
+        self.audio_cache_size_spin.setMaximumWidth(150)
+        self.audio_cache_size_spin.setSuffix(" MB")
+        audio_cache_form.addRow("Cache Size Limit:", self.audio_cache_size_spin)
+        audio_cache_layout.addLayout(audio_cache_form)
+        
+        self.clear_audio_cache_btn = QPushButton("Clear Audio Cache")
+        self.clear_audio_cache_btn.clicked.connect(self.clear_audio_cache)
+        audio_cache_layout.addWidget(self.clear_audio_cache_btn)
+        audio_cache_layout.addStretch()
+        
+        main_layout.addWidget(audio_cache_widget)
+        
         main_layout.addStretch()
         return page
     
@@ -2350,6 +3208,14 @@ class SettingsDialog(CustomFramelessDialog):
         self.cache_size_spin.setSuffix(" MB")
         size_layout.addRow("Cache Size Limit:", self.cache_size_spin)
         
+        self.cache_entries_spin = QSpinBox()
+        self.cache_entries_spin.setRange(100, 100000)
+        self.cache_entries_spin.setSingleStep(100)
+        self.cache_entries_spin.setValue(self.settings.get("tmdb_cache_max_entries", 5000))
+        self.cache_entries_spin.setMaximumWidth(150)
+        self.cache_entries_spin.setSuffix(" shows")
+        size_layout.addRow("Cache Max Entries:", self.cache_entries_spin)
+        
         cache_layout.addLayout(size_layout)
         tmdb_layout.addWidget(cache_section)
         
@@ -2405,6 +3271,15 @@ class SettingsDialog(CustomFramelessDialog):
                 self.parent_window.tmdb_cache.clear_cache()
                 CustomMessageBox.information(self, "Cache Cleared", "TMDB cache has been cleared.")
             
+    def clear_audio_cache(self):
+        if self.parent_window and hasattr(self.parent_window, 'audio_cache'):
+            reply = CustomMessageBox.question(self, "Clear Audio Cache", 
+                                            "Delete all cached extracted audio?\n\nVideos queued again will need their audio extracted again.",
+                                            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply == QMessageBox.Yes:
+                self.parent_window.audio_cache.clear_cache()
+                CustomMessageBox.information(self, "Cache Cleared", "Audio cache has been cleared.")
+            
     def edit_movie_template(self):
         current_template = self.settings.get("tmdb_movie_template", "Overview: {movie.overview}\n\n{movie.title} - {movie.year}\nGenre(s): {movie.genres}")
         dialog = TemplateEditorDialog("movie", current_template, self)
@@ -2433,8 +3308,12 @@ class SettingsDialog(CustomFramelessDialog):
         self.validation_model_edit.setText("gemini-flash-lite-latest")
         self.output_naming_pattern_edit.setText("{original_name}.{lang_code}.srt")
         self.queue_on_exit_combo.setCurrentIndex(1)
+        self.queue_storage_combo.setCurrentIndex(0)
         self.existing_file_combo.setCurrentIndex(0)
+        self.concurrent_tasks_spin.setValue(1)
+        self.concurrent_languages_spin.setValue(1)
         self.update_queue_languages_checkbox.setChecked(False)
+        self.warm_worker_checkbox.setChecked(True)
         
         self.gst_checkbox.setChecked(False)
         self.batch_size_spin.setValue(30)
@@ -2469,6 +3348,7 @@ class SettingsDialog(CustomFramelessDialog):
         self.auto_cleanup_checkbox.setChecked(True)
         self.cache_expiry_spin.setValue(365)
         self.cache_size_spin.setValue(150)
+        self.cache_entries_spin.setValue(5000)
         self.settings["tmdb_movie_template"] = "Overview: {movie.overview}\n\n{movie.title} - {movie.year}\nGenre(s): {movie.genres}"
         self.settings["tmdb_episode_template"] = "Episode Overview: {episode.overview}\n\n{show.title} {episode.number} - {episode.title}\nShow Overview: {show.overview}"
         self._update_movie_template_display()
@@ -2484,6 +3364,8 @@ class SettingsDialog(CustomFramelessDialog):
         for key, default_val in cleanup_defaults.items():
             if key in self.cleanup_checkboxes:
                 self.cleanup_checkboxes[key].setChecked(default_val)
+        self.audio_cache_checkbox.setChecked(True)
+        self.audio_cache_size_spin.setValue(2048)
         
         self.toggle_gst_settings(False)
         self.toggle_model_settings(False)
@@ -2503,8 +3385,12 @@ class SettingsDialog(CustomFramelessDialog):
         s["validation_model"] = self.validation_model_edit.text().strip()
         s["output_file_naming_pattern"] = self.output_naming_pattern_edit.text().strip()
         s["queue_on_exit"] = self.queue_on_exit_combo.currentData()
+        s["queue_storage"] = self.queue_storage_combo.currentData()
         s["existing_file_handling"] = self.existing_file_combo.currentData()
+        s["max_concurrent_tasks"] = self.concurrent_tasks_spin.value()
+        s["max_concurrent_languages"] = self.concurrent_languages_spin.value()
         s["update_existing_queue_languages"] = self.update_queue_languages_checkbox.isChecked()
+        s["use_warm_worker"] = self.warm_worker_checkbox.isChecked()
         
         s["use_gst_parameters"] = self.gst_checkbox.isChecked()
         s["batch_size"] = self.batch_size_spin.value()
@@ -2527,11 +3413,14 @@ class SettingsDialog(CustomFramelessDialog):
         s["tmdb_auto_cleanup_cache"] = self.auto_cleanup_checkbox.isChecked()
         s["tmdb_cache_expiry_days"] = self.cache_expiry_spin.value()
         s["tmdb_cache_size_limit_mb"] = self.cache_size_spin.value()
+        s["tmdb_cache_max_entries"] = self.cache_entries_spin.value()
         s["tmdb_movie_template"] = self.settings.get("tmdb_movie_template", "Overview: {movie.overview}\n\n{movie.title} - {movie.year}\nGenre(s): {movie.genres}")
         s["tmdb_episode_template"] = self.settings.get("tmdb_episode_template", "Episode Overview: {episode.overview}\n\n{show.title} {episode.number} - {episode.title}\nShow Overview: {show.overview}")
             
         for key, checkbox in self.cleanup_checkboxes.items():
             s[key] = checkbox.isChecked()
+        s["audio_cache_enabled"] = self.audio_cache_checkbox.isChecked()
+        s["audio_cache_size_limit_mb"] = self.audio_cache_size_spin.value()
         
         return s
         
@@ -2708,6 +3597,15 @@ class CustomTaskDelegate(QStyledItemDelegate):
         
         self.indicator_font = QFont(base_font)
         self.indicator_font.setPointSize(max(6, int(base_font.pointSize() * 0.7)))
+        
+        self.primary_metrics = QFontMetrics(self.primary_font)
+        self.indicator_metrics = QFontMetrics(self.indicator_font)
+        
+        self.progress_color = QColor("#4CAF50")
+        
+        self.left_alignment = Qt.AlignLeft | Qt.AlignVCenter
+        self.right_alignment = Qt.AlignRight | Qt.AlignVCenter
+        self.panel_primitive = QStyle.PE_PanelItemViewItem
 
     def sizeHint(self, option, index):
         size = super().sizeHint(option, index)
@@ -2721,63 +3619,29 @@ class CustomTaskDelegate(QStyledItemDelegate):
             return
         
         style = option.widget.style() if option.widget else QApplication.style()
-        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        style.drawPrimitive(self.panel_primitive, option, painter, option.widget)
         
         painter.save()
         
         if index.column() == 2:
-            full_text = str(index.data()) if index.data() else ""
-            primary_text = full_text.split('\n')[0] if full_text else ""
+            display_text, indicator_text, indicator_width, text_width_available, show_indicator = self._cached_layout(
+                index, option.rect.width(), self._layout_description
+            )
             
-            indicator_text = ""
-            if hasattr(index.model(), 'get_description_source'):
-                indicator_text = index.model().get_description_source(index)
+            primary_rect = QRect(option.rect.left() + 4, option.rect.top(), 
+                               text_width_available + 4, option.rect.height())
             
-            available_width = option.rect.width() - 16
+            painter.setFont(self.primary_font)
+            painter.drawText(primary_rect, self.left_alignment, display_text)
             
-            indicator_width = 0
-            if indicator_text:
+            if show_indicator and indicator_text:
+                indicator_rect = QRect(option.rect.right() - indicator_width, option.rect.top(),
+                                     indicator_width - 4, option.rect.height())
                 painter.setFont(self.indicator_font)
-                indicator_metrics = painter.fontMetrics()
-                indicator_width = indicator_metrics.horizontalAdvance(indicator_text) + 8
-            
-            painter.setFont(self.primary_font)
-            text_metrics = painter.fontMetrics()
-            
-            text_width_available = available_width - indicator_width
-            text_width_needed = text_metrics.horizontalAdvance(primary_text)
-            
-            display_text = primary_text
-            show_indicator = True
-            
-            if text_width_needed > text_width_available:
-                if text_width_available > 30:
-                    truncated_width = text_width_available - text_metrics.horizontalAdvance("...")
-                    display_text = text_metrics.elidedText(primary_text, Qt.ElideRight, truncated_width)
-                else:
-                    show_indicator = False
-                    text_width_available = available_width
-                    if text_width_needed > text_width_available:
-                        truncated_width = text_width_available - text_metrics.horizontalAdvance("...")
-                        display_text = text_metrics.elidedText(primary_text, Qt.ElideRight, truncated_width)
-            
-            primary_rect = QRect(option.rect.left() + 4, option.rect.top(), 
-                               text_width_available + 4, option.rect.height())
-            
-            painter.drawText(primary_rect, Qt.AlignLeft | Qt.AlignVCenter, display_text)
-            
-            if show_indicator and indicator_text:
-                indicator_rect = QRect(option.rect.right() - indicator_width, option.rect.top(),
-                                     indicator_width - 4, option.rect.height())
-                painter.setFont(self.indicator_font)
-                painter.drawText(indicator_rect, Qt.AlignRight | Qt.AlignVCenter, indicator_text)
-        
-        elif index.column() == 0:
-            primary_text = str(index.data()) if index.data() else ""
-            
-            secondary_text = ""
-            if hasattr(index.model(), 'get_secondary_info'):
-                secondary_text = index.model().get_secondary_info(index)
+                painter.drawText(indicator_rect, self.right_alignment, indicator_text)
+        
+        elif index.column() == 0:
+            primary_text, secondary_text = self._cached_layout(index, option.rect.width(), self._layout_file)
             
             primary_rect = QRect(option.rect.left() + 4, option.rect.top() + 2, 
                                option.rect.width() - 8, option.rect.height() // 2)
@@ -2785,28 +3649,409 @@ class CustomTaskDelegate(QStyledItemDelegate):
                                  option.rect.width() - 8, option.rect.height() // 2)
             
             painter.setFont(self.primary_font)
-            painter.drawText(primary_rect, Qt.AlignLeft | Qt.AlignVCenter, primary_text)
+            painter.drawText(primary_rect, self.left_alignment, primary_text)
             
             if secondary_text:
                 painter.setFont(self.secondary_font)
-                painter.drawText(secondary_rect, Qt.AlignLeft | Qt.AlignVCenter, secondary_text)
+                painter.drawText(secondary_rect, self.left_alignment, secondary_text)
         
         else:
-            primary_text = str(index.data()) if index.data() else ""
+            primary_text = self._cached_layout(index, option.rect.width(), self._layout_text)
             primary_rect = QRect(option.rect.left() + 4, option.rect.top(), 
                                option.rect.width() - 8, option.rect.height())
             
             painter.setFont(self.primary_font)
-            painter.drawText(primary_rect, Qt.AlignLeft | Qt.AlignVCenter, primary_text)
+            painter.drawText(primary_rect, self.left_alignment, primary_text)
+            
+            progress = index.data(ProgressRole) if index.column() == 3 else None
+            if progress is not None:
+                progress = max(0, min(int(progress), 100))
+                bar_width = (option.rect.width() - 8) * progress // 100
+                bar_rect = QRect(option.rect.left() + 4, option.rect.bottom() - 2, bar_width, 2)
+                painter.fillRect(bar_rect, self.progress_color)
         
         painter.restore()
+    
+    def _cached_layout(self, index, width, build):
+        model = index.model()
+        cache = model.get_render_cache(index) if hasattr(model, 'get_render_cache') else None
+        if cache is None:
+            return build(index, width)
+        
+        cached = cache.get(index.column())
+        if cached is None or cached[0] != width:
+            cached = (width, build(index, width))
+            cache[index.column()] = cached
+        return cached[1]
+    
+    def _layout_text(self, index, width):
+        return str(index.data()) if index.data() else ""
+    
+    def _layout_file(self, index, width):
+        primary_text = str(index.data()) if index.data() else ""
+        
+        secondary_text = ""
+        if hasattr(index.model(), 'get_secondary_info'):
+            secondary_text = index.model().get_secondary_info(index)
+        
+        return primary_text, secondary_text
+    
+    def _layout_description(self, index, width):
+        full_text = str(index.data()) if index.data() else ""
+        primary_text = full_text.split('\n', 1)[0] if full_text else ""
+        
+        indicator_text = ""
+        if hasattr(index.model(), 'get_description_source'):
+            indicator_text = index.model().get_description_source(index)
+        
+        available_width = width - 16
+        
+        indicator_width = 0
+        if indicator_text:
+            indicator_width = self.indicator_metrics.horizontalAdvance(indicator_text) + 8
+        
+        text_metrics = self.primary_metrics
+        
+        text_width_available = available_width - indicator_width
+        text_width_needed = text_metrics.horizontalAdvance(primary_text)
+        
+        display_text = primary_text
+        show_indicator = True
+        
+        if text_width_needed > text_width_available:
+            if text_width_available > 30:
+                truncated_width = text_width_available - text_metrics.horizontalAdvance("...")
+                display_text = text_metrics.elidedText(primary_text, Qt.ElideRight, truncated_width)
+            else:
+                show_indicator = False
+                text_width_available = available_width
+                if text_width_needed > text_width_available:
+                    truncated_width = text_width_available - text_metrics.horizontalAdvance("...")
+                    display_text = text_metrics.elidedText(primary_text, Qt.ElideRight, truncated_width)
+        
+        return display_text, indicator_text, indicator_width, text_width_available, show_indicator
+
+class TaskRecord:
+    __slots__ = ("path", "video_path", "description", "languages", "task_type", "description_source", "title", "status", "progress", "render_cache")
+
+    def __init__(self, path, video_path=None, description="", languages=None, task_type="subtitle", description_source="Manual", title="", status="Queued"):
+        self.path = path
+        self.video_path = video_path
+        self.description = description
+        self.languages = languages if languages is not None else []
+        self.task_type = task_type
+        self.description_source = description_source
+        self.title = title
+        self.status = status
+        self.progress = None
+        self.render_cache = None
+
+class CustomTaskModel(QAbstractItemModel):
+    HEADERS = ("Files", "Title", "Description", "Status")
+    COLUMN_ATTRIBUTES = (None, "title", "description", "status")
+    ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    DISPLAY_ROLE = Qt.DisplayRole
+    TOOLTIP_ROLE = Qt.ToolTipRole
+    TEXT_ROLES = (Qt.DisplayRole, Qt.EditRole)
+    ROLE_ATTRIBUTES = {
+        PathRole: "path",
+        VideoPathRole: "video_path",
+        DescriptionRole: "description",
+        LanguagesRole: "languages",
+        TaskTypeRole: "task_type",
+        DescriptionSourceRole: "description_source",
+    }
+    ATTRIBUTE_CHANGES = {
+        "path": (0, 0, [Qt.DisplayRole, Qt.ToolTipRole, PathRole]),
+        "video_path": (0, 0, [Qt.DisplayRole, Qt.ToolTipRole, VideoPathRole]),
+        "description": (0, 2, [Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole, DescriptionRole]),
+        "languages": (0, 0, [LanguagesRole]),
+        "task_type": (0, 0, [TaskTypeRole]),
+        "description_source": (0, 2, [DescriptionSourceRole]),
+        "title": (1, 1, [Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole]),
+        "status": (3, 3, [Qt.DisplayRole, Qt.EditRole]),
+        "progress": (3, 3, [ProgressRole]),
+    }
 
-class CustomTaskModel(QStandardItemModel):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self._records = []
+        self._record_rows = {}
+        self._stale_rows_from = None
+        self._records_by_id = {}
+        self._path_records = {}
+        self._base_name_records = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._records)
+        if parent.internalId() or parent.column() != 0:
+            return 0
+        return 1 if self._records[parent.row()].task_type == "video+subtitle" else 0
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if row < 0 or not 0 <= column < len(self.HEADERS):
+            return QModelIndex()
+        if parent.isValid():
+            if row != 0 or parent.internalId() or parent.column() != 0:
+                return QModelIndex()
+            record = self._records[parent.row()]
+            if record.task_type != "video+subtitle":
+                return QModelIndex()
+            return self.createIndex(row, column, id(record))
+        if row >= len(self._records):
+            return QModelIndex()
+        return self.createIndex(row, column, 0)
+    
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or not index.internalId():
+            return QModelIndex()
+        
+        record = self._records_by_id.get(index.internalId())
+        if record is None:
+            return QModelIndex()
+        return self.createIndex(self._record_row(record), 0, 0)
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.ITEM_FLAGS
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == self.DISPLAY_ROLE and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if index.internalId():
+            record = self._records_by_id.get(index.internalId())
+            if record is None or index.column() != 0:
+                return None
+            if role == self.DISPLAY_ROLE:
+                return os.path.basename(record.path)
+            if role == self.TOOLTIP_ROLE:
+                return f"Subtitle: {record.path}"
+            return None
+        
+        record = self._records[index.row()]
+        column = index.column()
+        
+        if role in self.TEXT_ROLES:
+            if column == 0:
+                return os.path.basename(record.video_path or record.path)
+            return getattr(record, self.COLUMN_ATTRIBUTES[column])
+        
+        if role == self.TOOLTIP_ROLE:
+            if column == 0:
+                return os.path.dirname(record.video_path or record.path)
+            if column in (1, 2):
+                return getattr(record, self.COLUMN_ATTRIBUTES[column]) or None
+            return None
+        
+        if column == 0 and role in self.ROLE_ATTRIBUTES:
+            return getattr(record, self.ROLE_ATTRIBUTES[role])
+        
+        if column == 3 and role == ProgressRole:
+            return record.progress
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.internalId():
+            return False
+        
+        column = index.column()
+        if role in self.TEXT_ROLES and column != 0:
+            attribute = self.COLUMN_ATTRIBUTES[column]
+        elif column == 0 and role in self.ROLE_ATTRIBUTES:
+            attribute = self.ROLE_ATTRIBUTES[role]
+        elif column == 3 and role == ProgressRole:
+            attribute = "progress"
+        else:
+            return False
+        
+        self.set_task_value(index.row(), attribute, value)
+        return True
+    
+    def set_task_value(self, row, attribute, value):
+        record = self._records[row]
+        old_value = getattr(record, attribute)
+        if old_value == value:
+            return
+        
+        if attribute in ("path", "video_path"):
+            self._unindex_record(record)
+        
+        if attribute == "task_type" and (old_value == "video+subtitle") != (value == "video+subtitle"):
+            parent = self.index(row, 0)
+            if value == "video+subtitle":
+                self.beginInsertRows(parent, 0, 0)
+                record.task_type = value
+                self.endInsertRows()
+            else:
+                self.beginRemoveRows(parent, 0, 0)
+                record.task_type = value
+                self.endRemoveRows()
+        else:
+            setattr(record, attribute, value)
+        
+        if attribute in ("path", "video_path"):
+            self._index_record(record)
+        
+        first_column, last_column, roles = self.ATTRIBUTE_CHANGES[attribute]
+        if record.render_cache:
+            for column in range(first_column, last_column + 1):
+                record.render_cache.pop(column, None)
+        self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column), roles)
+        
+        if attribute == "path" and record.task_type == "video+subtitle":
+            child_index = self.index(0, 0, self.index(row, 0))
+            self.dataChanged.emit(child_index, child_index, [Qt.DisplayRole, Qt.ToolTipRole])
+    
+    def get_task(self, row):
+        return self._records[row]
+    
+    def get_render_cache(self, index):
+        if not index.isValid() or index.internalId():
+            return None
+        
+        record = self._records[index.row()]
+        if record.render_cache is None:
+            record.render_cache = {}
+        return record.render_cache
+    
+    def append_task(self, record):
+        self.append_tasks([record])
+    
+    def append_tasks(self, records):
+        if not records:
+            return
+        
+        first_row = len(self._records)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(records) - 1)
+        for row, record in enumerate(records, first_row):
+            self._records.append(record)
+            self._records_by_id[id(record)] = record
+            self._record_rows[record] = row
+            self._index_record(record)
+        self.endInsertRows()
+    
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._records):
+            return False
+        
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        removed_records = self._records[row:row + count]
+        del self._records[row:row + count]
+        for record in removed_records:
+            self._records_by_id.pop(id(record), None)
+            self._record_rows.pop(record, None)
+            self._unindex_record(record)
+        if row < len(self._records):
+            self._stale_rows_from = row if self._stale_rows_from is None else min(self._stale_rows_from, row)
+        self.endRemoveRows()
+        return True
+    
+    def move_task(self, source_row, destination_row):
+        if source_row == destination_row:
+            return
+        
+        destination_child = destination_row + 1 if destination_row > source_row else destination_row
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row, QModelIndex(), destination_child):
+            return
+        self._records.insert(destination_row, self._records.pop(source_row))
+        self._reindex_rows(min(source_row, destination_row), max(source_row, destination_row))
+        self.endMoveRows()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        if not 0 <= column < len(self.HEADERS):
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        
+        old_persistent_indexes = [index for index in self.persistentIndexList() if not index.internalId()]
+        old_records = [self._records[index.row()] for index in old_persistent_indexes]
+        
+        self._records.sort(
+            key=lambda record: self._sort_text(record, column),
+            reverse=(order == Qt.DescendingOrder)
+        )
+        self._reindex_rows(0, len(self._records) - 1)
+        self._stale_rows_from = None
+        
+        new_persistent_indexes = [
+            self.createIndex(self._record_row(record), index.column(), 0)
+            for record, index in zip(old_records, old_persistent_indexes)
+        ]
+        self.changePersistentIndexList(old_persistent_indexes, new_persistent_indexes)
+        
+        self.layoutChanged.emit()
+    
+    def _sort_text(self, record, column):
+        if column == 0:
+            return os.path.basename(record.video_path or record.path)
+        return getattr(record, self.COLUMN_ATTRIBUTES[column]) or ""
+    
+    def find_task_index(self, path):
+        record = self._path_records.get(path)
+        if record is None:
+            return QModelIndex()
+        return self.index(self._record_row(record), 0)
+    
+    def find_task_indexes_by_base_name(self, base_name):
+        records = self._base_name_records.get(base_name)
+        if not records:
+            return []
+        return [self.index(row, 0) for row in sorted(self._record_row(record) for record in records)]
+    
+    def _record_row(self, record):
+        row = self._record_rows.get(record, -1)
+        if self._stale_rows_from is not None and row >= self._stale_rows_from:
+            self._reindex_rows(self._stale_rows_from, len(self._records) - 1)
+            self._stale_rows_from = None
+            row = self._record_rows.get(record, -1)
+        return row
+    
+    def _reindex_rows(self, first_row, last_row):
+        for row in range(first_row, last_row + 1):
+            self._record_rows[self._records[row]] = row
+    
+    def _task_base_names(self, record):
+        base_names = set()
+        
+        if record.video_path:
+            base_names.add(os.path.splitext(os.path.basename(record.video_path))[0])
+        
+        if record.path:
+            parsed = _parse_subtitle_filename(os.path.basename(record.path))
+            if parsed and parsed['base_name']:
+                base_names.add(parsed['base_name'])
+        
+        return base_names
+    
+    def _index_record(self, record):
+        if record.path:
+            self._path_records[record.path] = record
+        for base_name in self._task_base_names(record):
+            self._base_name_records.setdefault(base_name, []).append(record)
+    
+    def _unindex_record(self, record):
+        if self._path_records.get(record.path) is record:
+            del self._path_records[record.path]
+        for base_name in self._task_base_names(record):
+            records = self._base_name_records.get(base_name)
+            if records and record in records:
+                records.remove(record)
+                if not records:
+                    del self._base_name_records[base_name]
     
-          
     def get_secondary_info(self, index):
         if index.column() != 0:
             return ""
@@ -2831,6 +4076,244 @@ class CustomTaskModel(QStandardItemModel):
         return index.siblingAtColumn(0).data(DescriptionSourceRole) or "Manual"
 
       
+def split_pipe_chunk(state, chunk):
+    decoder, pending, after_carriage_return = state[0], state[1], state[2]
+    text = decoder.decode(chunk, final=not chunk)
+    if after_carriage_return and text.startswith("\n"):
+        text = text[1:]
+    if text:
+        state[2] = text.endswith("\r")
+    
+    text = pending + text.replace("\r\n", "\n").replace("\r", "\n")
+    *lines, state[1] = text.split("\n")
+    return lines
+
+class GSTWorkerProcess:
+    def __init__(self):
+        cmd = get_subprocess_command("--run-gst-worker")
+        
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["PYTHONUNBUFFERED"] = "1"
+
+        creation_flags = 0
+        if os.name == 'nt':
+            creation_flags = subprocess.CREATE_NO_WINDOW
+        
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            env=env,
+            creationflags=creation_flags,
+            start_new_session=(os.name != 'nt')
+        )
+        
+        self.events = queue.Queue()
+        self.selector = None
+        
+        if os.name == 'nt':
+            self.stdout_thread = threading.Thread(target=self._read_events, daemon=True)
+            self.stderr_thread = threading.Thread(target=self._read_output, daemon=True)
+            self.stdout_thread.start()
+            self.stderr_thread.start()
+        else:
+            self.selector = selectors.DefaultSelector()
+            for stream, is_event_stream in ((self.process.stdout, True), (self.process.stderr, False)):
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                self.selector.register(stream, selectors.EVENT_READ, [decoder, "", False, is_event_stream])
+    
+    def _queue_line(self, line, is_event_stream):
+        if is_event_stream:
+            try:
+                self.events.put(json.loads(line))
+                return
+            except ValueError:
+                pass
+        self.events.put({"type": "output", "line": line})
+    
+    def _poll_pipes(self, timeout):
+        ready = self.selector.select(timeout=timeout)
+        # gst output is written before the worker reports "done", so it is queued ahead of events
+        for key, _ in sorted(ready, key=lambda item: item[0].data[3]):
+            try:
+                chunk = os.read(key.fd, 65536)
+            except OSError:
+                chunk = b""
+            
+            lines = [line + "\n" for line in split_pipe_chunk(key.data, chunk)]
+            if not chunk:
+                if key.data[1]:
+                    lines.append(key.data[1])
+                    key.data[1] = ""
+                self.selector.unregister(key.fileobj)
+            
+            for line in lines:
+                self._queue_line(line, key.data[3])
+    
+    def _next_event(self, timeout=0.1):
+        if self.selector is None or not self.selector.get_map():
+            return self.events.get(timeout=timeout)
+        if self.events.empty():
+            self._poll_pipes(timeout)
+        return self.events.get_nowait()
+    
+    def _finish_reading(self):
+        if self.selector is None:
+            self.stdout_thread.join(timeout=1)
+            self.stderr_thread.join(timeout=1)
+            return
+        
+        deadline = time.monotonic() + 1
+        while self.selector.get_map() and time.monotonic() < deadline:
+            self._poll_pipes(0.1)
+    
+    def _read_events(self):
+        try:
+            for line in iter(self.process.stdout.readline, ''):
+                try:
+                    self.events.put(json.loads(line))
+                except ValueError:
+                    self.events.put({"type": "output", "line": line})
+        except (IOError, ValueError):
+            pass
+    
+    def _read_output(self):
+        try:
+            for line in iter(self.process.stderr.readline, ''):
+                self.events.put({"type": "output", "line": line})
+        except (IOError, ValueError):
+            pass
+    
+    def is_alive(self):
+        return self.process.poll() is None
+    
+    def send(self, message):
+        try:
+            self.process.stdin.write(json.dumps(message) + "\n")
+            self.process.stdin.flush()
+            return True
+        except (IOError, ValueError, OSError):
+            return False
+    
+    def run_job(self, args, cwd, line_callback, should_cancel, event_callback=None, cancel_timeout=5):
+        if self.selector is not None and self.selector.get_map():
+            self._poll_pipes(0)
+        while not self.events.empty():
+            try:
+                self.events.get_nowait()
+            except queue.Empty:
+                break
+        
+        if not self.send({"type": "translate", "args": args, "cwd": cwd}):
+            return -1
+        
+        cancel_sent_at = None
+        
+        while True:
+            if cancel_sent_at is None and should_cancel():
+                self.send({"type": "cancel"})
+                cancel_sent_at = time.time()
+            elif cancel_sent_at is not None and time.time() - cancel_sent_at > cancel_timeout:
+                # The worker interrupts gst with SIGINT, which normally answers within a second;
+                # one that stays silent is wedged, and the pool starts a fresh worker after the kill.
+                self.kill()
+                return -1
+            
+            try:
+                event = self._next_event()
+            except queue.Empty:
+                if not self.is_alive():
+                    self._finish_reading()
+                    if self.events.empty():
+                        return -1
+                continue
+            
+            event_type = event.get("type")
+            if event_type == "output":
+                line_callback(event.get("line", ""))
+            elif event_type == "done":
+                return event.get("returncode", 1)
+            elif event_type != "ready" and event_callback:
+                event_callback(event)
+    
+    def kill(self):
+        if not self.is_alive():
+            return
+        try:
+            if os.name == 'nt':
+                self.process.kill()
+            else:
+                os.killpg(os.getpgid(self.process.pid), signal.SIGKILL)
+            self.process.wait(timeout=5)
+        except (ProcessLookupError, OSError, subprocess.TimeoutExpired):
+            pass
+    
+    def shutdown(self):
+        if self.send({"type": "exit"}):
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2)
+            except (IOError, ValueError, OSError, subprocess.TimeoutExpired):
+                pass
+        self.kill()
+        if self.selector is not None:
+            self.selector.close()
+
+class GSTWorkerPool:
+    def __init__(self):
+        self.idle_workers = []
+        self.busy_workers = set()
+        self.lock = threading.Lock()
+        self.closed = False
+    
+    def acquire(self):
+        with self.lock:
+            while self.idle_workers:
+                worker_process = self.idle_workers.pop()
+                if worker_process.is_alive():
+                    self.busy_workers.add(worker_process)
+                    return worker_process
+            worker_process = GSTWorkerProcess()
+            self.busy_workers.add(worker_process)
+            return worker_process
+    
+    def release(self, worker_process):
+        with self.lock:
+            self.busy_workers.discard(worker_process)
+            if not self.closed and worker_process.is_alive():
+                self.idle_workers.append(worker_process)
+                return
+        worker_process.shutdown()
+    
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+            workers = self.idle_workers + list(self.busy_workers)
+            self.idle_workers = []
+            self.busy_workers = set()
+        for worker_process in workers:
+            worker_process.shutdown()
+
+GST_ERROR_STATUSES = {
+    "ffmpeg_missing": "Failed: FFmpeg not installed",
+    "source_missing": "Failed: Source file not found",
+    "subtitle_extraction": "Failed: Could not extract subtitles",
+    "audio_processing": "Failed: Could not process audio",
+}
+
+GST_RETRY_STATUSES = {
+    "size_mismatch": "API Error (Size Mismatch), retrying...",
+    "empty_line": "API Error (Empty Line), retrying...",
+    "bad_index": "API Error (Bad Index), retrying...",
+    "invalid_batch": "Invalid response, retrying batch...",
+}
+
 class TranslationWorker(QObject):
     finished = Signal(int, str, bool)
     progress_update = Signal(int, int, str)
@@ -2852,10 +4335,16 @@ class TranslationWorker(QObject):
         
         self.force_cancelled = False
         self.current_language = None
-        self.process = None
+        self.active_processes = set()
+        self.process_lock = threading.Lock()
         self.specific_error = None
         self.is_extracting = False
         self.pending_force_cancellation = False
+        
+        self.in_flight_languages = set()
+        self.parallel_progress = None
+        self.parallel_completed = 0
+        self.parallel_lock = threading.Lock()
     
     def _should_stop_gracefully(self):
         if self.main_window:
@@ -2877,39 +4366,68 @@ class TranslationWorker(QObject):
             except (IOError, ValueError):
                 pass
     
-    def _run_and_monitor_subprocess(self, cmd, line_callback, process_cwd):
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
-        env["PYTHONUNBUFFERED"] = "1"
-
-        creation_flags = 0
-        if os.name == 'nt':
-            creation_flags = subprocess.CREATE_NO_WINDOW
-
-        self.process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            bufsize=1,
-            env=env,
-            cwd=process_cwd,
-            creationflags=creation_flags
-        )
-
+    def _read_pipes(self, process, streams):
+        selector = selectors.DefaultSelector()
+        for stream, callback in streams:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            selector.register(stream, selectors.EVENT_READ, [decoder, "", False, callback])
+        
+        exit_deadline = None
+        try:
+            while selector.get_map():
+                if self._should_force_cancel():
+                    self._send_interrupt_signal(process)
+                    break
+                
+                if exit_deadline is None and process.poll() is not None:
+                    exit_deadline = time.monotonic() + 1
+                elif exit_deadline is not None and time.monotonic() > exit_deadline:
+                    break
+                
+                for key, _ in selector.select(timeout=0.1):
+                    line_callback = key.data[3]
+                    try:
+                        chunk = os.read(key.fd, 65536)
+                    except OSError:
+                        chunk = b""
+                    
+                    for line in split_pipe_chunk(key.data, chunk):
+                        line_callback(line + "\n")
+                    
+                    if not chunk:
+                        if key.data[1]:
+                            line_callback(key.data[1])
+                        selector.unregister(key.fileobj)
+        finally:
+            selector.close()
+            for stream, callback in streams:
+                try:
+                    stream.close()
+                except (IOError, ValueError):
+                    pass
+    
+    def _dispatch_event_line(self, line, event_callback, line_callback):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            line_callback(line)
+            return
+        
+        if isinstance(event, dict):
+            event_callback(event)
+    
+    def _read_pipes_with_threads(self, process, line_callback):
         q = queue.Queue()
         
-        stdout_thread = threading.Thread(target=self._read_stream, args=(self.process.stdout, q), daemon=True)
-        stderr_thread = threading.Thread(target=self._read_stream, args=(self.process.stderr, q), daemon=True)
+        stdout_thread = threading.Thread(target=self._read_stream, args=(process.stdout, q), daemon=True)
+        stderr_thread = threading.Thread(target=self._read_stream, args=(process.stderr, q), daemon=True)
         
         stdout_thread.start()
         stderr_thread.start()
 
-        while self.process.poll() is None:
+        while process.poll() is None:
             if self._should_force_cancel():
-                self._send_interrupt_signal()
+                self._send_interrupt_signal(process)
                 break
             try:
                 line = q.get(timeout=0.1)
@@ -2918,9 +4436,9 @@ class TranslationWorker(QObject):
                 continue
 
         try:
-            self.process.wait(timeout=5)
+            process.wait(timeout=5)
         except subprocess.TimeoutExpired:
-            self._send_interrupt_signal()
+            self._send_interrupt_signal(process)
             
         stdout_thread.join(timeout=1)
         stderr_thread.join(timeout=1)
@@ -2931,9 +4449,89 @@ class TranslationWorker(QObject):
                 line_callback(line)
             except queue.Empty:
                 break
+
+    def _run_and_monitor_subprocess(self, cmd, line_callback, process_cwd, event_callback=None):
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        env["PYTHONUNBUFFERED"] = "1"
+
+        creation_flags = 0
+        if os.name == 'nt':
+            creation_flags = subprocess.CREATE_NO_WINDOW
+            stream_options = {"text": True, "encoding": 'utf-8', "errors": 'replace', "bufsize": 1}
+        else:
+            stream_options = {"bufsize": 0}
+        
+        event_read_fd = event_write_fd = None
+        if event_callback is not None and os.name != 'nt':
+            event_read_fd, event_write_fd = os.pipe()
+            cmd = cmd + ["--event-fd", str(event_write_fd)]
+            stream_options["pass_fds"] = (event_write_fd,)
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+                cwd=process_cwd,
+                creationflags=creation_flags,
+                start_new_session=(os.name != 'nt'),
+                **stream_options
+            )
+        except Exception:
+            if event_read_fd is not None:
+                os.close(event_read_fd)
+            raise
+        finally:
+            if event_write_fd is not None:
+                os.close(event_write_fd)
+        
+        with self.process_lock:
+            self.active_processes.add(process)
+
+        if os.name == 'nt':
+            self._read_pipes_with_threads(process, line_callback)
+        else:
+            streams = [(process.stdout, line_callback), (process.stderr, line_callback)]
+            if event_read_fd is not None:
+                streams.append((
+                    os.fdopen(event_read_fd, 'rb', buffering=0),
+                    lambda line: self._dispatch_event_line(line, event_callback, line_callback)
+                ))
+            self._read_pipes(process, streams)
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._send_interrupt_signal(process)
             
-        return_code = self.process.returncode if self.process else -1
-        self.process = None
+        return_code = process.returncode if process.returncode is not None else -1
+        
+        with self.process_lock:
+            self.active_processes.discard(process)
+        
+        if self._should_force_cancel():
+            return -1
+
+        return return_code
+
+    def _run_translation_process(self, cmd, line_callback, process_cwd, event_callback=None):
+        worker_pool = getattr(self.main_window, "gst_worker_pool", None)
+        if worker_pool is None or not self.settings.get("use_warm_worker", True):
+            return self._run_and_monitor_subprocess(cmd, line_callback, process_cwd, event_callback)
+        
+        args = cmd[cmd.index("--run-gst-subprocess") + 1:]
+        
+        try:
+            worker_process = worker_pool.acquire()
+        except OSError as e:
+            print(f"Could not start warm translation worker: {e}")
+            return self._run_and_monitor_subprocess(cmd, line_callback, process_cwd, event_callback)
+        
+        try:
+            return_code = worker_process.run_job(args, process_cwd, line_callback, self._should_force_cancel, event_callback)
+        finally:
+            worker_pool.release(worker_process)
         
         if self._should_force_cancel():
             return -1
@@ -2952,62 +4550,30 @@ class TranslationWorker(QObject):
             
             self.status_message.emit(self.task_index, "Extracting Audio")
             self.queue_manager.set_audio_extraction_status(self.input_file_path, "extracting")
-            
-            executable_path = get_executable_path()
-            
-            if is_compiled():
-                cmd = [executable_path, "--run-audio-extraction"]
-            else:
-                cmd = [sys.executable, executable_path, "--run-audio-extraction"]
-            
-            cmd.extend(["--gemini_api_key", "DUMMY_KEY_FOR_AUDIO_EXTRACTION_ONLY"])
-            cmd.extend(["--video_file", video_file])
-            cmd.extend(["--model_name", self.model_name])
-            
-            extracted_srt_to_delete = None
             self.specific_error = None
             
-            def audio_line_callback(line):
-                nonlocal extracted_srt_to_delete
-                if not line: return
-                clean_line = line.strip()
-                
-                if "FFmpeg is not installed" in clean_line:
-                    self.specific_error = "Failed: FFmpeg not installed"
-                    return
-                elif "does not exist" in clean_line and "Video file" in clean_line:
-                    self.specific_error = "Failed: Video file not found"
-                    return
-                elif "Failed to process video" in clean_line:
-                    self.specific_error = "Failed: Could not process audio"
-                    return
-
-                if "Starting audio extraction" in clean_line:
-                    self.progress_update.emit(self.task_index, 30, "Starting audio extraction...")
-                elif "Success! Audio saved as:" in clean_line:
-                    self.progress_update.emit(self.task_index, 90, "Audio extraction completed")
-                elif "Please provide a target language" in clean_line:
-                    video_dir = os.path.dirname(video_file)
-                    video_name = os.path.splitext(os.path.basename(video_file))[0]
-                    extracted_srt_to_delete = os.path.join(video_dir, f"{video_name}_extracted.srt")
+            video_basename = os.path.basename(video_file)
+            video_name = os.path.splitext(video_basename)[0]
+            video_dir = os.path.dirname(video_file)
+            expected_audio = os.path.join(video_dir, f"{video_name}_extracted.mp3")
+            partial_audio = f"{expected_audio}.part"
             
-            process_cwd = get_app_directory()
-            self._run_and_monitor_subprocess(cmd, audio_line_callback, process_cwd)
+            if not os.path.exists(expected_audio):
+                extracted = self._run_ffmpeg_audio_extraction(video_file, partial_audio)
+                
+                if extracted and not self._should_force_cancel():
+                    os.replace(partial_audio, expected_audio)
+                    if self.queue_manager.audio_cache is not None:
+                        self.queue_manager.audio_cache.store(video_file, expected_audio)
+                elif os.path.exists(partial_audio):
+                    try:
+                        os.remove(partial_audio)
+                    except OSError:
+                        pass
             
             if self._should_force_cancel():
                 self._cleanup_current_language_only()
                 return False
-    
-            if extracted_srt_to_delete and os.path.exists(extracted_srt_to_delete):
-                try:
-                    os.remove(extracted_srt_to_delete)
-                except Exception as e:
-                    pass
-    
-            video_basename = os.path.basename(video_file)
-            video_name = os.path.splitext(video_basename)[0]
-            video_dir = os.path.dirname(video_file)
-            expected_audio = os.path.join(video_dir, f"{video_name}_extracted.mp3")
             
             if os.path.exists(expected_audio):
                 self.queue_manager.set_audio_extraction_status(
@@ -3028,7 +4594,61 @@ class TranslationWorker(QObject):
             self.queue_manager.set_audio_extraction_status(self.input_file_path, "failed")
             return False
 
-    def _execute_translation_command(self, cmd, lang_code, completed_count, total_languages):
+    def _run_ffmpeg_audio_extraction(self, video_file, output_path):
+        self.progress_update.emit(self.task_index, 30, "Starting audio extraction...")
+        
+        try:
+            stream = probe_primary_audio_stream(video_file)
+        except FileNotFoundError:
+            self.specific_error = "Failed: FFmpeg not installed"
+            return False
+        except (subprocess.SubprocessError, ValueError) as e:
+            print(f"Could not probe audio streams of {video_file}: {e}")
+            self.specific_error = "Failed: Could not process audio"
+            return False
+        
+        if not stream:
+            self.specific_error = "Failed: Could not process audio"
+            return False
+        
+        duration_us = stream["duration"] * 1000000
+        error_lines = []
+        
+        def progress_line_callback(line):
+            key, separator, value = line.strip().partition("=")
+            if not separator:
+                if key:
+                    error_lines.append(key)
+                return
+            
+            if key in ("out_time_us", "out_time_ms") and duration_us > 0:
+                try:
+                    position = int(value)
+                except ValueError:
+                    return
+                fraction = min(max(position / duration_us, 0), 1)
+                self.progress_update.emit(
+                    self.task_index, 30 + int(fraction * 59), f"Extracting audio... {int(fraction * 100)}%"
+                )
+            elif key == "progress" and value == "end":
+                self.progress_update.emit(self.task_index, 90, "Audio extraction completed")
+        
+        cmd = build_audio_extraction_command(video_file, stream, output_path)
+        try:
+            return_code = self._run_and_monitor_subprocess(cmd, progress_line_callback, os.path.dirname(video_file))
+        except FileNotFoundError:
+            self.specific_error = "Failed: FFmpeg not installed"
+            return False
+        
+        if return_code != 0:
+            if error_lines and not self._should_force_cancel():
+                print(f"FFmpeg audio extraction failed for {video_file}: {error_lines[-1]}")
+            self.specific_error = "Failed: Could not process audio"
+            return False
+        
+        return os.path.exists(output_path)
+
+    def _execute_translation_command(self, cmd, lang_code, completed_count, total_languages, process_cwd=None):
         lang_name = self._get_language_name(lang_code)
         
         if total_languages > 1:
@@ -3043,89 +4663,85 @@ class TranslationWorker(QObject):
         else:
             simple_status = f"Translating {lang_name}"
         
-        self.status_message.emit(self.task_index, simple_status)
+        self._emit_language_status(lang_code, simple_status)
         
         found_completion = [False]
-        self.specific_error = None
+        specific_error = [None]
+        if self.parallel_progress is None:
+            self.specific_error = None
+
+        def translation_event_callback(event):
+            event_type = event.get("type")
+
+            if event_type == "progress":
+                lang_percent = event.get("percent", 0)
+                progress_bar_text = f"{lang_percent}% - {event.get('details', '')} | {event.get('state', '')}..."
+                self._emit_language_progress(lang_code, lang_percent, progress_bar_text, simple_status)
+            elif event_type == "error":
+                specific_error[0] = GST_ERROR_STATUSES.get(event.get("reason"), "Failed: Translation error")
+            elif event_type == "quota_wait":
+                wait_time = event.get("seconds") or "..."
+                self._emit_language_status(lang_code, f"API Quota Exceeded. Waiting {wait_time}s")
+            elif event_type == "key_switch":
+                api_num = event.get("key") or "#?"
+                self._emit_language_status(lang_code, f"Quota Hit. Switching to API Key {api_num}...")
+            elif event_type == "retry":
+                self._emit_language_status(lang_code, GST_RETRY_STATUSES.get(event.get("reason"), "API Error, retrying..."))
+            elif event_type == "resume":
+                if event.get("line") is not None:
+                    self._emit_language_status(lang_code, f"Resuming {lang_name} from line {event['line']}")
+            elif event_type == "completed":
+                found_completion[0] = True
 
         def translation_line_callback(line):
             if not line: return
             line = line.strip()
 
-            if "FFmpeg is not installed" in line:
-                self.specific_error = "Failed: FFmpeg not installed"
-                return
-            elif "does not exist" in line and ("Input file" in line or "Video file" in line or "Audio file" in line):
-                self.specific_error = "Failed: Source file not found"
-                return
-            elif "Failed to extract subtitles from video file" in line:
-                self.specific_error = "Failed: Could not extract subtitles"
-                return
-            elif "Failed to process video" in line:
-                self.specific_error = "Failed: Could not process audio"
-                return
-
-            elif "All API quotas exceeded, waiting" in line:
-                wait_match = re.search(r"waiting (\d+) seconds", line)
-                wait_time = wait_match.group(1) if wait_match else "..."
-                self.status_message.emit(self.task_index, f"API Quota Exceeded. Waiting {wait_time}s")
-                return
-            elif "API quota exceeded! Switching to API" in line:
-                api_match = re.search(r"Switching to API (\d+)", line)
-                api_num = api_match.group(1) if api_match else "#?"
-                self.status_message.emit(self.task_index, f"Quota Hit. Switching to API Key {api_num}...")
-                return
-            elif "Gemini has returned an unexpected response. Expected" in line:
-                self.status_message.emit(self.task_index, "API Error (Size Mismatch), retrying...")
-                return
-            elif "Gemini has returned an empty translation for line" in line:
-                self.status_message.emit(self.task_index, "API Error (Empty Line), retrying...")
-                return
-            elif "Gemini has returned an unexpected line:" in line:
-                self.status_message.emit(self.task_index, "API Error (Bad Index), retrying...")
-                return
-            elif "Sending last batch again..." in line:
-                self.status_message.emit(self.task_index, "Invalid response, retrying batch...")
-                return
-
-            elif "Resuming from line" in line:
-                resume_match = re.search(r"Resuming from line (\d+)", line)
-                if resume_match:
-                    resume_line = resume_match.group(1)
-                    self.status_message.emit(self.task_index, f"Resuming {lang_name} from line {resume_line}")
-                return
-            
-            progress_match = re.search(r"Translating:\s*\|.*\|\s*(\d+)%\s*\(([^)]+)\)[^|]*\|\s*(Thinking|Processing)", line)
-            
-            if progress_match:
-                self.status_message.emit(self.task_index, simple_status)
-                lang_percent = int(progress_match.group(1))
-                details = progress_match.group(2)
-                state = progress_match.group(3)
-                progress_bar_text = f"{lang_percent}% - {details} | {state}..."
-                self.progress_update.emit(self.task_index, lang_percent, progress_bar_text)
-                return
-
-            elif "Translation completed successfully!" in line:
-                found_completion[0] = True
-            
+            event = parse_gst_output_line(line)
+            if event is not None:
+                translation_event_callback(event)
             elif "error" in line.lower() or "traceback" in line.lower():
                 print(f"GST subprocess error: {line}")
 
-        process_cwd = os.path.dirname(self.input_file_path)
-        return_code = self._run_and_monitor_subprocess(cmd, translation_line_callback, process_cwd)
+        if process_cwd is None:
+            process_cwd = os.path.dirname(self.input_file_path)
+        return_code = self._run_translation_process(cmd, translation_line_callback, process_cwd, translation_event_callback)
 
         self.is_extracting = False
         self.pending_force_cancellation = False
 
         if self._should_force_cancel() or return_code == -1:
-            self._cleanup_current_language_only()
+            self._cleanup_current_language_only(lang_code)
             return False
         
-        if self.specific_error:
+        if specific_error[0]:
+            self.specific_error = specific_error[0]
             return False
         
         return return_code == 0 and found_completion[0]
+    
+    def _emit_language_status(self, lang_code, message):
+        if self.parallel_progress is None:
+            self.status_message.emit(self.task_index, message)
+            return
+        
+        self.status_message.emit(self.task_index, f"{self._get_language_name(lang_code)}: {message}")
+    
+    def _emit_language_progress(self, lang_code, percentage, progress_text, status_text):
+        if self.parallel_progress is None:
+            self.status_message.emit(self.task_index, status_text)
+            self.progress_update.emit(self.task_index, percentage, progress_text)
+            return
+        
+        with self.parallel_lock:
+            self.parallel_progress[lang_code] = percentage
+            total_languages = max(1, len(self.target_languages))
+            overall_percent = sum(self.parallel_progress.values()) // total_languages
+            running_count = len(self.in_flight_languages)
+            completed_count = self.parallel_completed
+        
+        self.status_message.emit(self.task_index, f"Translating {running_count} languages ({completed_count}/{total_languages} completed)")
+        self.progress_update.emit(self.task_index, overall_percent, f"{overall_percent}% - {running_count} languages in parallel")
         
     def _generate_output_filename(self, lang_code):
         original_basename = os.path.basename(self.input_file_path)
@@ -3200,17 +4816,12 @@ class TranslationWorker(QObject):
         except Exception as e:
             print(f"Error cleaning up files for fresh start: {e}")
     
-    def _build_cli_command(self, target_language):
-        executable_path = get_executable_path()
-        
-        if is_compiled():
-            cmd = [executable_path, "--run-gst-subprocess"]
-        else:
-            cmd = [sys.executable, executable_path, "--run-gst-subprocess"]
+    def _build_cli_command(self, target_language, input_file=None):
+        cmd = get_subprocess_command("--run-gst-subprocess")
         
         cmd.extend(["--gemini_api_key", self.api_key])
         cmd.extend(["--target_language", target_language])
-        cmd.extend(["--input_file", self.input_file_path])
+        cmd.extend(["--input_file", input_file or self.input_file_path])
         cmd.extend(["--model_name", self.model_name])
         
         output_path = self._generate_output_filename(target_language)
@@ -3266,12 +4877,7 @@ class TranslationWorker(QObject):
         return cmd
         
     def _build_video_only_command(self, video_file, target_language):
-        executable_path = get_executable_path()
-        
-        if is_compiled():
-            cmd = [executable_path, "--run-gst-subprocess"]
-        else:
-            cmd = [sys.executable, executable_path, "--run-gst-subprocess"]
+        cmd = get_subprocess_command("--run-gst-subprocess")
         
         cmd.extend(["--gemini_api_key", self.api_key])
         cmd.extend(["--target_language", target_language])
@@ -3328,8 +4934,7 @@ class TranslationWorker(QObject):
                 return name
         return lang_code.upper()
     
-    def _send_interrupt_signal(self):
-        process = self.process
+    def _send_interrupt_signal(self, process):
         if process and process.poll() is None:
             try:
                 if os.name == 'nt':
@@ -3351,6 +4956,8 @@ class TranslationWorker(QObject):
             if os.path.exists(progress_file):
                 os.remove(progress_file)
             
+            remove_language_workspaces(self.input_file_path, self.target_languages)
+            
             app_dir_progress = os.path.join(get_app_directory(), os.path.basename(progress_file))
             if os.path.exists(app_dir_progress):
                 os.remove(app_dir_progress)
@@ -3437,7 +5044,7 @@ class TranslationWorker(QObject):
                 else:
                     if self.input_file_path in self.queue_manager.state["queue_state"]:
                         self.queue_manager.state["queue_state"][self.input_file_path]["extracted_subtitle_file"] = None
-                        self.queue_manager._save_queue_state()
+                        self.queue_manager._save_task_data(self.input_file_path)
                 
                 for lang_code in self.target_languages:
                     self.queue_manager.mark_language_queued(self.input_file_path, lang_code)
@@ -3589,6 +5196,10 @@ class TranslationWorker(QObject):
         return self._translate_with_languages()
     
     def _translate_with_languages(self):
+        max_parallel = max(1, int(self.settings.get("max_concurrent_languages", 1)))
+        if max_parallel > 1 and len(self.target_languages) > 1:
+            return self._translate_languages_in_parallel(max_parallel)
+        
         completed_count = 0
         total_languages = len(self.target_languages)
         
@@ -3655,6 +5266,120 @@ class TranslationWorker(QObject):
             return True
         else:
             return completed_count > 0
+    
+    def _translate_languages_in_parallel(self, max_parallel):
+        total_languages = len(self.target_languages)
+        claimed_languages = set()
+        claim_lock = threading.Lock()
+        
+        self.parallel_progress = {}
+        self.parallel_completed = 0
+        
+        def claim_language():
+            with claim_lock:
+                while not self._should_force_cancel():
+                    if self._should_stop_gracefully() and claimed_languages:
+                        return None
+                    
+                    lang_code = self.queue_manager.claim_next_language(self.input_file_path, claimed_languages)
+                    if not lang_code:
+                        return None
+                    claimed_languages.add(lang_code)
+                    
+                    should_skip, skip_reason = self._should_skip_language(lang_code)
+                    if not should_skip:
+                        return lang_code
+                    
+                    if skip_reason == "same_as_input":
+                        self.status_message.emit(self.task_index, f"Skipped {self._get_language_name(lang_code)} - same as input file")
+                    elif skip_reason == "exists":
+                        self.status_message.emit(self.task_index, f"Skipped {self._get_language_name(lang_code)} - file already exists")
+                    
+                    self.queue_manager.mark_language_completed(self.input_file_path, lang_code)
+                    self.language_completed.emit(self.task_index, lang_code, True)
+                    self._record_parallel_completion(lang_code)
+                
+                return None
+        
+        def run_languages():
+            while True:
+                lang_code = claim_language()
+                if not lang_code:
+                    return
+                self._translate_language_in_workspace(lang_code, total_languages)
+        
+        threads = []
+        for _ in range(min(max_parallel, total_languages)):
+            thread = threading.Thread(target=run_languages, daemon=True)
+            threads.append(thread)
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+        
+        with self.parallel_lock:
+            completed_count = self.parallel_completed
+            self.parallel_progress = None
+        
+        if self._should_force_cancel():
+            return False
+        
+        final_summary = self.queue_manager.get_language_progress_summary(self.input_file_path)
+        if final_summary == "Translated":
+            self.queue_manager.cleanup_completed_subtitle(self.input_file_path)
+            return True
+        else:
+            return completed_count > 0
+    
+    def _translate_language_in_workspace(self, lang_code, total_languages):
+        lang_name = self._get_language_name(lang_code)
+        
+        with self.parallel_lock:
+            self.in_flight_languages.add(lang_code)
+            self.parallel_progress[lang_code] = 0
+        
+        try:
+            # gst names its .progress file after the input, so every language gets its own copy.
+            # The workspace outlives failed runs so an interrupted language resumes from its progress file.
+            workspace = get_language_workspace_path(self.input_file_path, lang_code)
+            os.makedirs(workspace, exist_ok=True)
+            input_copy = os.path.join(workspace, os.path.basename(self.input_file_path))
+            shutil.copy2(self.input_file_path, input_copy)
+            
+            self._emit_language_status(lang_code, f"Translating to {lang_name}...")
+            
+            with self.parallel_lock:
+                completed_count = self.parallel_completed
+            
+            cmd = self._build_cli_command(lang_code, input_copy)
+            success = self._execute_translation_command(cmd, lang_code, completed_count, total_languages, workspace)
+            
+            if self._should_force_cancel():
+                return
+            
+            if success:
+                shutil.rmtree(workspace, ignore_errors=True)
+                self.queue_manager.mark_language_completed(self.input_file_path, lang_code)
+                self.language_completed.emit(self.task_index, lang_code, True)
+                self._record_parallel_completion(lang_code)
+            else:
+                self.queue_manager.mark_language_queued(self.input_file_path, lang_code)
+                self.language_completed.emit(self.task_index, lang_code, False)
+                
+        except Exception as e:
+            print(f"Exception during translation of {lang_code}: {e}")
+            if not self._should_force_cancel():
+                self.queue_manager.mark_language_queued(self.input_file_path, lang_code)
+                self.language_completed.emit(self.task_index, lang_code, False)
+        finally:
+            with self.parallel_lock:
+                self.in_flight_languages.discard(lang_code)
+    
+    def _record_parallel_completion(self, lang_code):
+        with self.parallel_lock:
+            self.parallel_completed += 1
+        
+        self._emit_language_progress(lang_code, 100, "", "")
             
     def _should_skip_language(self, lang_code):
         output_path = self._generate_output_filename(lang_code)
@@ -3669,17 +5394,21 @@ class TranslationWorker(QObject):
         
         return False, None
         
-    def _cleanup_current_language_only(self):
+    def _cleanup_current_language_only(self, lang_code=None):
+        current_language = lang_code or self.current_language
         try:
             progress_file = self._get_progress_file_path()
             if os.path.exists(progress_file):
                 os.remove(progress_file)
             
+            if current_language:
+                remove_language_workspaces(self.input_file_path, [current_language])
+            
             app_dir_progress = os.path.join(get_app_directory(), os.path.basename(progress_file))
             if os.path.exists(app_dir_progress):
                 os.remove(app_dir_progress)
     
-            if self.current_language:
+            if current_language:
                 original_basename = os.path.basename(self.input_file_path)
                 original_dir = os.path.dirname(self.input_file_path)
                 
@@ -3691,7 +5420,7 @@ class TranslationWorker(QObject):
                 
                 pattern = self.settings.get("output_file_naming_pattern", "{original_name}.{lang_code}.{modifiers}.srt")
                 
-                file_lang_code = self.current_language
+                file_lang_code = current_language
                 if file_lang_code.startswith('zh'):
                     file_lang_code = 'zh'
                 elif file_lang_code.startswith('pt'):
@@ -3722,7 +5451,7 @@ class TranslationWorker(QObject):
                         input_lang_normalized = _normalize_language_code(input_parsed['lang_code']) if input_parsed['lang_code'] else None
                         output_lang_normalized = _normalize_language_code(output_parsed['lang_code']) if output_parsed['lang_code'] else None
                         
-                        if input_lang_normalized == output_lang_normalized == self.current_language:
+                        if input_lang_normalized == output_lang_normalized == current_language:
                             safe_to_delete = False
                     
                     if safe_to_delete:
@@ -3738,7 +5467,7 @@ class TranslationWorker(QObject):
                                     pass
                 
                 if self.queue_manager:
-                    self.queue_manager.mark_language_queued(self.input_file_path, self.current_language)
+                    self.queue_manager.mark_language_queued(self.input_file_path, current_language)
             
             if self.queue_manager:
                 files_to_delete = set()
@@ -3775,7 +5504,7 @@ class TranslationWorker(QObject):
                 else:
                     if self.input_file_path in self.queue_manager.state["queue_state"]:
                         self.queue_manager.state["queue_state"][self.input_file_path]["extracted_subtitle_file"] = None
-                        self.queue_manager._save_queue_state()
+                        self.queue_manager._save_task_data(self.input_file_path)
                 
                 if should_cleanup_audio:
                     queue_entry = self.queue_manager.state["queue_state"].get(self.input_file_path, {})
@@ -3794,13 +5523,200 @@ class TranslationWorker(QObject):
         self.force_cancelled = True
         self.status_message.emit(self.task_index, "Force cancelling...")
         
-        process = self.process
-        if process and process.poll() is None:
-            self._send_interrupt_signal()
+        with self.process_lock:
+            processes = list(self.active_processes)
+        
+        for process in processes:
+            if process.poll() is None:
+                self._send_interrupt_signal(process)
     
     def cancel(self):
         self.force_cancel()
 
+class TranslationScheduler(QObject):
+    FLUSH_INTERVAL_MS = 66
+
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.active_tasks = {}
+        self.task_progress = {}
+        self.cancelled_tasks = set()
+        self.halted = False
+        self.pending_lock = threading.Lock()
+        self.pending_status = {}
+        self.pending_progress = {}
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_updates)
+
+    def max_workers(self):
+        return max(1, int(self.main_window.settings.get("max_concurrent_tasks", 1)))
+
+    def has_active_tasks(self):
+        return bool(self.active_tasks)
+
+    def is_task_active(self, task_idx):
+        return task_idx in self.active_tasks
+
+    def active_task_names(self):
+        names = []
+        for thread, worker in self.active_tasks.values():
+            names.append(os.path.basename(worker.input_file_path))
+        return names
+
+    def start(self):
+        self.halted = False
+        self.cancelled_tasks.clear()
+        self.main_window.is_running = True
+        self.dispatch()
+
+    def dispatch(self):
+        main_window = self.main_window
+
+        if not main_window.is_running:
+            return
+
+        if main_window.stop_after_current_task or self.halted:
+            if not self.active_tasks:
+                main_window._handle_queue_finished()
+            return
+
+        for row in range(main_window.model.rowCount()):
+            if len(self.active_tasks) >= self.max_workers():
+                break
+
+            if row in self.active_tasks or row in self.cancelled_tasks:
+                continue
+
+            task_path = main_window.model.index(row, 0).data(PathRole)
+            if main_window.queue_manager.get_next_language_to_process(task_path):
+                self._start_worker(row)
+
+        if not self.active_tasks:
+            main_window._handle_queue_finished()
+            return
+
+        main_window._refresh_overall_progress()
+        main_window.update_button_states()
+
+    def _start_worker(self, task_idx):
+        main_window = self.main_window
+        index = main_window.model.index(task_idx, 0)
+        task_path = index.data(PathRole)
+
+        main_window.model.set_task_value(task_idx, "status", "Preparing")
+        main_window.model.set_task_value(task_idx, "progress", 0)
+        self.task_progress[task_idx] = (0, "Starting...")
+
+        worker = TranslationWorker(
+            task_index=task_idx,
+            input_file_path=task_path,
+            target_languages=index.data(LanguagesRole),
+            api_key=main_window.config_panel.api_key_edit.text().strip(),
+            api_key2=main_window.config_panel.api_key2_edit.text().strip(),
+            model_name=main_window.settings.get("model_name", "gemini-flash-lite-latest"),
+            settings=main_window.settings,
+            description=index.data(DescriptionRole),
+            queue_manager=main_window.queue_manager,
+            main_window=main_window
+        )
+
+        thread = QThread(main_window)
+        worker.moveToThread(thread)
+        worker.status_message.connect(self.post_status, Qt.DirectConnection)
+        worker.progress_update.connect(self.post_progress, Qt.DirectConnection)
+        worker.finished.connect(main_window.on_worker_finished)
+        worker.language_completed.connect(main_window.on_language_completed)
+        thread.started.connect(worker.run)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+
+        self.active_tasks[task_idx] = (thread, worker)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+        thread.start()
+
+    def post_status(self, task_idx, message):
+        with self.pending_lock:
+            self.pending_status[task_idx] = message
+
+    def post_progress(self, task_idx, percentage, progress_text):
+        with self.pending_lock:
+            self.pending_progress[task_idx] = (percentage, progress_text)
+
+    def _take_pending(self, task_idx=None):
+        with self.pending_lock:
+            if task_idx is None:
+                statuses, self.pending_status = self.pending_status, {}
+                progress, self.pending_progress = self.pending_progress, {}
+                return statuses, progress
+
+            statuses = {}
+            progress = {}
+            if task_idx in self.pending_status:
+                statuses[task_idx] = self.pending_status.pop(task_idx)
+            if task_idx in self.pending_progress:
+                progress[task_idx] = self.pending_progress.pop(task_idx)
+            return statuses, progress
+
+    @Slot()
+    def flush_updates(self, task_idx=None):
+        statuses, progress = self._take_pending(task_idx)
+        if not statuses and not progress:
+            return
+
+        main_window = self.main_window
+        for idx, message in statuses.items():
+            main_window.on_worker_status_message(idx, message)
+
+        for idx, (percentage, progress_text) in progress.items():
+            main_window.on_worker_progress_update(idx, percentage, progress_text)
+
+        if progress and self.active_tasks:
+            main_window._refresh_overall_progress()
+
+    def release(self, task_idx):
+        entry = self.active_tasks.pop(task_idx, None)
+        self.task_progress.pop(task_idx, None)
+        self._take_pending(task_idx)
+        if not self.active_tasks:
+            self.flush_timer.stop()
+
+        if entry:
+            thread, worker = entry
+            if thread.isRunning():
+                thread.quit()
+                thread.wait(1000)
+
+        return task_idx in self.cancelled_tasks
+
+    def force_cancel(self, task_idx=None):
+        for idx, (thread, worker) in list(self.active_tasks.items()):
+            if task_idx is None or idx == task_idx:
+                if task_idx is not None:
+                    self.cancelled_tasks.add(idx)
+                worker.force_cancel()
+
+    def aggregate_progress(self):
+        if not self.task_progress:
+            return 0, "Starting..."
+
+        if len(self.task_progress) == 1:
+            return next(iter(self.task_progress.values()))
+
+        total = sum(percentage for percentage, _ in self.task_progress.values())
+        average = total // len(self.task_progress)
+        return average, f"{average}% - {len(self.task_progress)} tasks running"
+
+    def reset(self):
+        self.flush_timer.stop()
+        self._take_pending()
+        self.active_tasks.clear()
+        self.task_progress.clear()
+        self.cancelled_tasks.clear()
+        self.halted = False
+
 class CustomLineEdit(QLineEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -4282,25 +6198,29 @@ class MainWindow(FramelessWidget):
         
         self.setAcceptDrops(True)
         
-        self.tmdb_queue = []
+        self.tmdb_queue = OrderedDict()
         
         icon_path = get_resource_path("Files/icon.png")
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
         
-        self.current_task_index = -1
         self.settings = self._load_settings()
         self.file_adder_thread = None
-        self.active_thread = None
-        self.active_worker = None
         self.clipboard_description = ""
         self.is_running = False
         self.stop_after_current_task = False
         self._exit_timer = None
-        
-        self.tmdb_semaphore = threading.Semaphore(self.settings.get("tmdb_concurrent_requests", 3))
+        self._exit_performed = False
+        self.scheduler = TranslationScheduler(self)
+        self.gst_worker_pool = GSTWorkerPool()
+        
+        self.tmdb_thread_pool = QThreadPool(self)
+        self.tmdb_thread_pool.setMaxThreadCount(self.settings.get("tmdb_concurrent_requests", 3))
+        self.tmdb_session = create_tmdb_session()
+        self.tmdb_single_flight = SingleFlight()
+        self.tmdb_rate_limiter = TMDBRateLimiter()
         self.tmdb_lookup_workers = {}
-        self.tmdb_threads = {}
+        self._directory_listings = None
         
         self._setup_title_bar()
         self._setup_main_layout()
@@ -4308,11 +6228,27 @@ class MainWindow(FramelessWidget):
         self._initialize_components()
         
         queue_state_file = get_persistent_path(os.path.join("Files", "queue_state.json"))
-        self.queue_manager = QueueStateManager(queue_state_file)
+        queue_database_file = get_persistent_path(os.path.join("Files", "queue_state.db"))
+        if self.settings.get("queue_storage", "json") == "sqlite":
+            self.queue_manager = SQLiteQueueStateManager(queue_database_file, queue_state_file)
+        else:
+            self.queue_manager = QueueStateManager(queue_state_file)
+            if os.path.exists(queue_database_file) and not self.queue_manager.state["queue_state"]:
+                self._migrate_queue_database(queue_database_file)
+            elif not self.queue_manager.load_failed:
+                remove_migrated_queue_backup(queue_database_file, ("", "-wal", "-shm"))
+        
+        audio_cache_dir = get_persistent_path(os.path.join("Files", "audio_cache"))
+        self.audio_cache = ExtractedAudioCache(audio_cache_dir, self.settings)
+        self.queue_manager.audio_cache = self.audio_cache
         
         tmdb_cache_file = get_persistent_path(os.path.join("Files", "tmdb_cache.json"))
         self.tmdb_cache = TMDBCacheManager(tmdb_cache_file, self.settings)
         
+        self.tmdb_cache_flush_timer = QTimer(self)
+        self.tmdb_cache_flush_timer.timeout.connect(self.tmdb_cache.flush)
+        self.tmdb_cache_flush_timer.start(30000)
+        
         self._sync_ui_with_queue_state()
         
         QTimer.singleShot(100, lambda: self._on_key_text_changed('gemini1'))
@@ -4414,7 +6350,6 @@ class MainWindow(FramelessWidget):
         self.tree_view.setSelectionMode(QTreeView.ExtendedSelection)
         
         self.model = CustomTaskModel(self)
-        self.model.setHorizontalHeaderLabels(["Files", "Title", "Description", "Status"])
         
         self.custom_delegate = CustomTaskDelegate()
         self.tree_view.setItemDelegate(self.custom_delegate)
@@ -4560,7 +6495,7 @@ class MainWindow(FramelessWidget):
         self.update_button_states()
 
         val_model = self.settings.get("validation_model", "gemini-flash-lite-latest")
-        worker = APIKeyValidator(key_id, api_key, val_model)
+        worker = APIKeyValidator(key_id, api_key, val_model, self.tmdb_session)
         thread = QThread()
         self.active_validators[key_id] = (thread, worker)
         worker.moveToThread(thread)
@@ -4618,7 +6553,7 @@ class MainWindow(FramelessWidget):
             self.config_panel.api_key2_edit.setFocus()
             return
                 
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             CustomMessageBox.information(self, "In Progress", "A translation is already in progress.")
             return
         
@@ -4626,13 +6561,6 @@ class MainWindow(FramelessWidget):
             CustomMessageBox.information(self, "Queue Status", "No work remaining in queue.")
             return
             
-        self.model.blockSignals(True)
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row, 2)
-            if item:
-                item.setEditable(False)
-        self.model.blockSignals(False)
-        
         first_task_with_work = -1
         for i in range(self.model.rowCount()):
             index = self.model.index(i, 0)
@@ -4646,51 +6574,50 @@ class MainWindow(FramelessWidget):
             CustomMessageBox.information(self, "Queue Status", "No work remaining in queue.")
             return
             
-        self.current_task_index = first_task_with_work
-        self._process_task_at_index(self.current_task_index)
+        self.scheduler.start()
         self.update_button_states()
 
     def _sync_ui_with_queue_state(self):
         queue_state = self.queue_manager.state.get("queue_state", {})
-        
-        current_paths_in_model = set()
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            current_paths_in_model.add(index.data(PathRole))
 
         tasks_to_restore = []
-        for subtitle_path, subtitle_data in queue_state.items():
-            if not os.path.exists(subtitle_path):
-                continue
-            
-            if subtitle_path in current_paths_in_model:
-                continue
-
-            target_languages = subtitle_data.get("target_languages", [])
-            description = subtitle_data.get("description", "")
-            description_source = subtitle_data.get("description_source", "Manual")
-            tmdb_title = subtitle_data.get("tmdb_title", "")
-            task_type = subtitle_data.get("task_type", "subtitle")
-            video_file = subtitle_data.get("video_file")
+        downgraded_paths = []
+        self._directory_listings = {}
+        try:
+            for subtitle_path, subtitle_data in queue_state.items():
+                if not os.path.exists(subtitle_path):
+                    continue
             
-            if task_type == "video+subtitle":
-                if not video_file or not os.path.exists(video_file):
-                    task_type = "subtitle"
-                    subtitle_data["task_type"] = "subtitle"
-                    subtitle_data["video_file"] = None
-                    subtitle_data["requires_audio_extraction"] = False
-                    self.queue_manager._save_queue_state()
+                if self.model.find_task_index(subtitle_path).isValid():
+                    continue
 
-            model_row = self._prepare_model_row(subtitle_path, target_languages, description, task_type, description_source)
-            
-            if tmdb_title:
-                model_row[1].setText(tmdb_title)
-                model_row[1].setToolTip(tmdb_title)
-            
-            summary = self.queue_manager.get_language_progress_summary(subtitle_path)
-            model_row[3].setText(summary)
-            
-            self.model.appendRow(model_row)
+                target_languages = subtitle_data.get("target_languages", [])
+                description = subtitle_data.get("description", "")
+                description_source = subtitle_data.get("description_source", "Manual")
+                tmdb_title = subtitle_data.get("tmdb_title", "")
+                task_type = subtitle_data.get("task_type", "subtitle")
+                video_file = subtitle_data.get("video_file")
+            
+                if task_type == "video+subtitle":
+                    if not video_file or not os.path.exists(video_file):
+                        task_type = "subtitle"
+                        subtitle_data["task_type"] = "subtitle"
+                        subtitle_data["video_file"] = None
+                        subtitle_data["requires_audio_extraction"] = False
+                        downgraded_paths.append(subtitle_path)
+
+                record = self._prepare_task_record(subtitle_path, target_languages, description, task_type, description_source)
+                record.title = tmdb_title or ""
+                record.status = self.queue_manager.get_language_progress_summary(subtitle_path)
+            
+                tasks_to_restore.append(record)
+        finally:
+            self._directory_listings = None
+        
+        if downgraded_paths:
+            self.queue_manager._save_task_data(*downgraded_paths)
+        
+        self.model.append_tasks(tasks_to_restore)
         
     def _get_language_display_text(self, lang_codes):
         if len(lang_codes) <= 3:
@@ -4700,13 +6627,15 @@ class MainWindow(FramelessWidget):
             return ", ".join(lang_codes)
 
     def toggle_start_stop(self):
+        if not self.is_running and self.file_adder_thread:
+            self.file_adder_thread[1].cancel()
+            self.start_stop_btn.setText("Cancelling Discovery...")
+            self.start_stop_btn.setEnabled(False)
+            return
+        
         if self.is_running:
             if self.stop_after_current_task:
-                current_task_name = ""
-                if 0 <= self.current_task_index < self.model.rowCount():
-                    index = self.model.index(self.current_task_index, 0)
-                    task_path = index.data(PathRole)
-                    current_task_name = os.path.basename(task_path)
+                current_task_name = ", ".join(self.scheduler.active_task_names())
                 
                 reply = CustomMessageBox.question(
                     self, 
@@ -4724,12 +6653,28 @@ class MainWindow(FramelessWidget):
             self.start_translation_queue()
             
     def force_stop_translation(self):
-        if self.active_worker and self.is_running:
+        if self.scheduler.has_active_tasks() and self.is_running:
             self.stop_after_current_task = True
             self.start_stop_btn.setText("Cancelling...")
             self.start_stop_btn.setEnabled(False)
             
-            self.active_worker.force_cancel()
+            self.scheduler.force_cancel()
+            
+    def force_cancel_task(self, row):
+        if not self.scheduler.is_task_active(row):
+            return
+        
+        task_name = os.path.basename(self.model.index(row, 0).data(PathRole))
+        reply = CustomMessageBox.question(
+            self, 
+            'Force Cancel Task', 
+            f'Force cancel this translation?\n\nFile: {task_name}',
+            QMessageBox.Yes | QMessageBox.No, 
+            QMessageBox.No,
+            "WARNING: This will immediately stop the translation and DELETE progress for the current language. Other running tasks will continue."
+        )
+        if reply == QMessageBox.Yes and self.scheduler.is_task_active(row):
+            self.scheduler.force_cancel(row)
 
     def _update_task_description(self, row, new_description):
         index = self.model.index(row, 0)
@@ -4788,9 +6733,6 @@ class MainWindow(FramelessWidget):
         pass
 
     def show_context_menu(self, position):
-        if self.active_thread and self.active_thread.isRunning():
-            return
-            
         index = self.tree_view.indexAt(position)
         if not index.isValid():
             return
@@ -4798,6 +6740,18 @@ class MainWindow(FramelessWidget):
         if index.parent().isValid():
             return
         
+        if self.scheduler.has_active_tasks():
+            row = index.row()
+            if not self.scheduler.is_task_active(row):
+                return
+            
+            menu = QMenu(self)
+            cancel_task_action = QAction("Force Cancel Task", self)
+            cancel_task_action.triggered.connect(lambda: self.force_cancel_task(row))
+            menu.addAction(cancel_task_action)
+            menu.exec(self.tree_view.mapToGlobal(position))
+            return
+        
         selected_rows = self._get_selected_task_rows()
         if not selected_rows:
             return
@@ -4875,8 +6829,7 @@ class MainWindow(FramelessWidget):
         
         has_non_queued = False
         for row in selected_rows:
-            status_item = self.model.item(row, 3)
-            if status_item and status_item.text() != "Queued":
+            if self.model.get_task(row).status != "Queued":
                 has_non_queued = True
                 break
         
@@ -4928,7 +6881,7 @@ class MainWindow(FramelessWidget):
             self._update_task_description(row, self.clipboard_description)
 
     def move_selected_to_top(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_indexes = self.tree_view.selectionModel().selectedRows()
@@ -4938,7 +6891,7 @@ class MainWindow(FramelessWidget):
         rows = sorted([index.row() for index in selected_indexes])
         
         for i, row in enumerate(rows):
-            self.model.insertRow(i, self.model.takeRow(row))
+            self.model.move_task(row, i)
             
         self.tree_view.clearSelection()
         for i in range(len(rows)):
@@ -4948,7 +6901,7 @@ class MainWindow(FramelessWidget):
             )
 
     def move_selected_up(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_indexes = self.tree_view.selectionModel().selectedRows()
@@ -4961,7 +6914,7 @@ class MainWindow(FramelessWidget):
             return
             
         for row in rows:
-            self.model.insertRow(row - 1, self.model.takeRow(row))
+            self.model.move_task(row, row - 1)
 
         self.tree_view.clearSelection()
         for row in rows:
@@ -4972,7 +6925,7 @@ class MainWindow(FramelessWidget):
             )
 
     def move_selected_down(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_indexes = self.tree_view.selectionModel().selectedRows()
@@ -4985,7 +6938,7 @@ class MainWindow(FramelessWidget):
             return
 
         for row in rows:
-            self.model.insertRow(row + 1, self.model.takeRow(row))
+            self.model.move_task(row, row + 1)
 
         self.tree_view.clearSelection()
         for row in reversed(rows):
@@ -4996,19 +6949,17 @@ class MainWindow(FramelessWidget):
             )
 
     def move_selected_to_bottom(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_indexes = self.tree_view.selectionModel().selectedRows()
         if not selected_indexes:
             return
         
-        rows = sorted([index.row() for index in selected_indexes], reverse=True)
-        
-        taken_rows = [self.model.takeRow(row) for row in rows]
+        rows = sorted([index.row() for index in selected_indexes])
         
-        for row_items in reversed(taken_rows):
-            self.model.appendRow(row_items)
+        for i, row in enumerate(rows):
+            self.model.move_task(row - i, self.model.rowCount() - 1)
         
         self.tree_view.clearSelection()
         start_index = self.model.rowCount() - len(rows)
@@ -5019,7 +6970,7 @@ class MainWindow(FramelessWidget):
             )
 
     def remove_selected_items(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_indexes = self.tree_view.selectionModel().selectedRows()
@@ -5039,7 +6990,7 @@ class MainWindow(FramelessWidget):
         self.update_button_states()
 
     def reset_selected_status(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         selected_rows = self._get_selected_task_rows()
@@ -5048,18 +6999,18 @@ class MainWindow(FramelessWidget):
         
         reset_count = 0
         for row in selected_rows:
-            status_item = self.model.item(row, 3)
             index = self.model.index(row, 0)
             task_path = index.data(PathRole)
-            current_status = status_item.text()
+            current_status = self.model.get_task(row).status
             
             if current_status != "Queued":
-                status_item.setText("Queued")
+                self.model.set_task_value(row, "status", "Queued")
                 
                 if task_path in self.queue_manager.state["queue_state"]:
                     languages = self.queue_manager.state["queue_state"][task_path].get("languages", {})
                     for lang_code in languages.keys():
                         self.queue_manager.mark_language_queued(task_path, lang_code)
+                    remove_language_workspaces(task_path, languages.keys())
                 
                 original_basename = os.path.basename(task_path)
                 original_dir = os.path.dirname(task_path)
@@ -5097,7 +7048,7 @@ class MainWindow(FramelessWidget):
                 else:
                     if task_path in self.queue_manager.state["queue_state"]:
                         self.queue_manager.state["queue_state"][task_path]["extracted_subtitle_file"] = None
-                        self.queue_manager._save_queue_state()
+                        self.queue_manager._save_task_data(task_path)
                 
                 if task_path in self.queue_manager.state["queue_state"]:
                     queue_entry = self.queue_manager.state["queue_state"][task_path]
@@ -5147,12 +7098,11 @@ class MainWindow(FramelessWidget):
 
     def closeEvent(self, event):
         self._save_settings()
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             current_task_name = ""
-            if 0 <= self.current_task_index < self.model.rowCount():
-                index = self.model.index(self.current_task_index, 0)
-                task_path = index.data(PathRole)
-                current_task_name = f"\n\nCurrent file: {os.path.basename(task_path)}"
+            active_names = self.scheduler.active_task_names()
+            if active_names:
+                current_task_name = f"\n\nCurrent file: {', '.join(active_names)}"
             
             reply = CustomMessageBox.question(
                 self, 
@@ -5163,8 +7113,7 @@ class MainWindow(FramelessWidget):
                 "WARNING: This will immediately stop the translation and DELETE progress for the current language. Completed languages will be preserved."
             )
             if reply == QMessageBox.Yes:
-                if self.active_worker:
-                    self.active_worker.force_cancel()
+                self.scheduler.force_cancel()
                 
                 self._exit_timer = QTimer()
                 self._exit_timer.timeout.connect(lambda: self._check_translation_stopped(event))
@@ -5178,13 +7127,32 @@ class MainWindow(FramelessWidget):
             event.accept()
     
     def _check_translation_stopped(self, event):
-        if not self.is_running and (not self.active_thread or not self.active_thread.isRunning()):
+        if not self.is_running and not self.scheduler.has_active_tasks():
             self._exit_timer.stop()
             self._exit_timer = None
-            self._perform_exit()
             self.close()
     
+    def _migrate_queue_database(self, queue_database_file):
+        try:
+            database_manager = SQLiteQueueStateManager(queue_database_file)
+            database_state = database_manager.state
+            database_manager.close()
+            if database_manager.load_failed:
+                return
+            
+            self.queue_manager.state = database_state
+            if self.queue_manager._save_queue_state():
+                backup_migrated_queue_files(queue_database_file, ("", "-wal", "-shm"))
+        except Exception as e:
+            print(f"Error migrating queue database: {e}")
+    
     def _perform_exit(self):
+        if self._exit_performed:
+            return
+        self._exit_performed = True
+        
+        self.gst_worker_pool.shutdown()
+        
         queue_on_exit = self.settings.get("queue_on_exit", "clear_if_translated")
         
         all_translated = True
@@ -5204,6 +7172,10 @@ class MainWindow(FramelessWidget):
 
         if queue_on_exit == "clear" or (queue_on_exit == "clear_if_translated" and all_translated):
             self.queue_manager.clear_all_state()
+        
+        self.queue_manager.close()
+        self.tmdb_cache.flush()
+        self.tmdb_session.close()
 
     def add_files_action(self):
         if self.file_adder_thread:
@@ -5260,9 +7232,7 @@ class MainWindow(FramelessWidget):
             if not new_sub_parsed or not new_sub_parsed['base_name']:
                 continue
 
-            for task_idx in range(self.model.rowCount()):
-                index = self.model.index(task_idx, 0)
-                task_type = index.data(TaskTypeRole)
+            for index in self.model.find_task_indexes_by_base_name(new_sub_parsed['base_name']):
                 video_path = index.data(VideoPathRole)
 
                 if video_path:
@@ -5279,15 +7249,9 @@ class MainWindow(FramelessWidget):
                             if old_entry_data:
                                 old_entry_data['video_file'] = video_path
                                 self.queue_manager.state["queue_state"][new_sub_path] = old_entry_data
-                                self.queue_manager._save_queue_state()
+                                self.queue_manager._save_queue_state(existing_sub_path, new_sub_path)
                             
-                            path_item = self.model.itemFromIndex(index)
-                            path_item.setData(new_sub_path, PathRole)
-                            
-                            if path_item.rowCount() > 0:
-                                child_item = path_item.child(0, 0)
-                                child_item.setText(f"{os.path.basename(new_sub_path)}")
-                                child_item.setToolTip(f"Subtitle: {new_sub_path}")
+                            self.model.setData(index, new_sub_path, PathRole)
                             
                             handled_new_tasks_indices.add(i)
                         else:
@@ -5296,20 +7260,19 @@ class MainWindow(FramelessWidget):
         
         for i, new_vid_task in new_videos:
             if i in handled_new_tasks_indices: continue
-            for task_idx in range(self.model.rowCount()):
-                index = self.model.index(task_idx, 0)
+            video_base_name = os.path.splitext(os.path.basename(new_vid_task['primary_file']))[0]
+            for index in self.model.find_task_indexes_by_base_name(video_base_name):
                 if index.data(TaskTypeRole) == 'subtitle':
                     if _files_are_pair(index.data(PathRole), new_vid_task['primary_file']):
-                        self._update_task_to_video_subtitle(task_idx, index.data(PathRole), new_vid_task['primary_file'])
+                        self._update_task_to_video_subtitle(index.row(), index.data(PathRole), new_vid_task['primary_file'])
                         handled_new_tasks_indices.add(i)
                         break
 
-        existing_paths = {self.model.index(row, 0).data(PathRole) for row in range(self.model.rowCount())}
         tasks_to_finally_add = []
         for i, task_info in enumerate(prepared_tasks):
             if i in handled_new_tasks_indices:
                 continue
-            if task_info['primary_file'] in existing_paths:
+            if self.model.find_task_index(task_info['primary_file']).isValid():
                 continue
             tasks_to_finally_add.append(task_info)
         
@@ -5321,39 +7284,38 @@ class MainWindow(FramelessWidget):
         self.update_button_states()
     
     def _batch_add_tasks(self, tasks_info_list):
-        files_for_tmdb_indices = []
+        records = []
+        self._directory_listings = {}
         
-        for task_info in tasks_info_list:
-            primary_file = task_info['primary_file']
-            
-            self.queue_manager.add_subtitle_to_queue(
-                primary_file, 
+        try:
+            self.queue_manager.add_subtitles_to_queue(
+                [(task_info['primary_file'], task_info['task_type'], task_info['video_file'], task_info['requires_extraction'])
+                 for task_info in tasks_info_list],
                 self.selected_languages.copy(), 
                 "", 
-                self.settings.get("output_file_naming_pattern", "{original_name}.{lang_code}.srt"),
-                task_info['task_type'],
-                task_info['video_file'],
-                task_info['requires_extraction']
+                self.settings.get("output_file_naming_pattern", "{original_name}.{lang_code}.srt")
             )
             
-            model_row = self._prepare_model_row(
-                primary_file, 
-                self.selected_languages.copy(), 
-                "", 
-                task_info['task_type']
-            )
-            self.model.appendRow(model_row)
-            new_row_index = self.model.rowCount() - 1
-            files_for_tmdb_indices.append(new_row_index)
+            for task_info in tasks_info_list:
+                records.append(self._prepare_task_record(
+                    task_info['primary_file'], 
+                    self.selected_languages.copy(), 
+                    "", 
+                    task_info['task_type']
+                ))
+        finally:
+            self._directory_listings = None
 
+        first_row = self.model.rowCount()
+        self.model.append_tasks(records)
         self.update_button_states()
         
-        for task_index in files_for_tmdb_indices:
+        for task_index in range(first_row, self.model.rowCount()):
             self._start_tmdb_lookup(task_index)
         
         self._process_tmdb_queue()
     
-    def _prepare_model_row(self, file_path, languages, description, task_type="subtitle", description_source="Manual"):
+    def _prepare_task_record(self, file_path, languages, description, task_type="subtitle", description_source="Manual"):
         video_path = None
         subtitle_path_for_data = file_path
 
@@ -5365,123 +7327,38 @@ class MainWindow(FramelessWidget):
                 subtitle_path_for_data = file_path
                 video_path = self._find_video_pair(file_path)
         
-        display_name = os.path.basename(video_path) if video_path else os.path.basename(file_path)
-        
-        path_item = QStandardItem(display_name)
-        path_item.setToolTip(os.path.dirname(file_path))
-        path_item.setEditable(False)
-        path_item.setData(subtitle_path_for_data, PathRole)
-        path_item.setData(video_path, VideoPathRole)
-        path_item.setData(description, DescriptionRole)
-        path_item.setData(languages, LanguagesRole)
-        path_item.setData(task_type, TaskTypeRole)
-        path_item.setData(description_source, DescriptionSourceRole)
-        
-        movie_item = QStandardItem("")
-        movie_item.setEditable(False)
-        
-        desc_item = QStandardItem(description)
-        desc_item.setEditable(False)
-        desc_item.setToolTip(description)
-        
-        status_item = QStandardItem("Queued")
-        status_item.setEditable(False)
-        
-        if task_type == "video+subtitle":
-            subtitle_child = QStandardItem(f"{os.path.basename(subtitle_path_for_data)}")
-            subtitle_child.setToolTip(f"Subtitle: {subtitle_path_for_data}")
-            subtitle_child.setEditable(False)
-            path_item.appendRow([subtitle_child, QStandardItem(""), QStandardItem(""), QStandardItem("")])
-            
-        return [path_item, movie_item, desc_item, status_item]
-
-    def _process_task_at_index(self, task_idx):
-        if not (0 <= task_idx < self.model.rowCount()):
-            self._handle_queue_finished()
-            return
-        
-        index = self.model.index(task_idx, 0)
-        task_path = index.data(PathRole)
-        
-        next_lang = self.queue_manager.get_next_language_to_process(task_path)
-        if not next_lang:
-            self._find_and_process_next_queued_task()
-            return
-            
-        self.current_task_index = task_idx
-        self.model.item(task_idx, 3).setText("Preparing")
-        self.overall_progress_bar.setVisible(True)
-        self.overall_progress_bar.setValue(0)
-        self.overall_progress_bar.setFormat("Starting...")
-        self.is_running = True
-        
-        self.active_worker = TranslationWorker(
-            task_index=task_idx, 
-            input_file_path=task_path, 
-            target_languages=index.data(LanguagesRole),
-            api_key=self.config_panel.api_key_edit.text().strip(), 
-            api_key2=self.config_panel.api_key2_edit.text().strip(),
-            model_name=self.settings.get("model_name", "gemini-flash-lite-latest"), 
-            settings=self.settings,
-            description=index.data(DescriptionRole),
-            queue_manager=self.queue_manager,
-            main_window=self
-        )
-        
-        self.active_thread = QThread(self)
-        self.active_worker.moveToThread(self.active_thread)
-        self.active_worker.status_message.connect(self.on_worker_status_message)
-        self.active_worker.progress_update.connect(self.on_worker_progress_update)
-        self.active_worker.finished.connect(self.on_worker_finished)
-        self.active_worker.language_completed.connect(self.on_language_completed)
-        self.active_thread.started.connect(self.active_worker.run)
-        self.active_thread.finished.connect(self.active_worker.deleteLater)
-        self.active_thread.finished.connect(self.active_thread.deleteLater)
-        self.active_thread.start()
-        self.update_button_states()
-
-    def _find_and_process_next_queued_task(self):
-        if self.stop_after_current_task:
-            self.stop_after_current_task = False
-            self.is_running = False
-            self.overall_progress_bar.setFormat("Stopped")
-            self.overall_progress_bar.setValue(0)
-            self._handle_queue_finished()
-            return
-            
-        for i in range(self.model.rowCount()):
-            index = self.model.index(i, 0)
-            task_path = index.data(PathRole)
-            next_lang = self.queue_manager.get_next_language_to_process(task_path)
-            if next_lang:
-                self._process_task_at_index(i)
-                return
-        
-        self._handle_queue_finished()
+        return TaskRecord(subtitle_path_for_data, video_path, description, languages, task_type, description_source)
 
     def _handle_queue_finished(self):
         self.overall_progress_bar.setVisible(False)
         self.is_running = False
         self.stop_after_current_task = False
         self.update_button_states()
-        self.current_task_index = -1
+        
+    def _refresh_overall_progress(self):
+        percentage, progress_text = self.scheduler.aggregate_progress()
+        self.overall_progress_bar.setVisible(True)
+        self.overall_progress_bar.setValue(percentage)
+        self.overall_progress_bar.setFormat(progress_text)
 
     @Slot(int, str)
     def on_worker_status_message(self, task_idx, message):
-        if 0 <= task_idx < self.model.rowCount() and self.current_task_index == task_idx:
-            self.model.item(task_idx, 3).setText(message)
+        if 0 <= task_idx < self.model.rowCount() and self.scheduler.is_task_active(task_idx):
+            self.model.set_task_value(task_idx, "status", message)
 
     def on_worker_progress_update(self, task_idx, percentage, progress_text):
         if 0 <= task_idx < self.model.rowCount():
-            if self.current_task_index == task_idx:
-                self.overall_progress_bar.setValue(percentage)
-                self.overall_progress_bar.setFormat(progress_text)
+            if self.scheduler.is_task_active(task_idx):
+                self.scheduler.task_progress[task_idx] = (percentage, progress_text)
+                self.model.set_task_value(task_idx, "progress", percentage)
 
     def on_worker_finished(self, task_idx, message, success):
+        self.scheduler.flush_updates(task_idx)
         if 0 <= task_idx < self.model.rowCount():
             index = self.model.index(task_idx, 0)
             task_path = index.data(PathRole)
-            self.model.item(task_idx, 3).setText(message)
+            self.model.set_task_value(task_idx, "status", message)
+            self.model.set_task_value(task_idx, "progress", None)
             
             self.queue_manager.sync_audio_extraction_status(task_path)
             
@@ -5494,12 +7371,16 @@ class MainWindow(FramelessWidget):
             else:
                 self._cleanup_task_audio_and_extracted_files(task_path, "failure")
             
-        if self.active_thread and self.active_thread.isRunning():
-            self.active_thread.quit()
-            self.active_thread.wait(1000)
-            
-        self.active_worker = None
-        self.active_thread = None
+        was_cancelled = self.scheduler.release(task_idx)
+        if not success and not was_cancelled:
+            self.scheduler.halted = True
+        
+        if self.scheduler.has_active_tasks():
+            if (success or was_cancelled) and self.is_running:
+                QTimer.singleShot(500, self.scheduler.dispatch)
+            self._refresh_overall_progress()
+            self.update_button_states()
+            return
         
         if self.stop_after_current_task:
             self.stop_after_current_task = False
@@ -5516,15 +7397,15 @@ class MainWindow(FramelessWidget):
             self.overall_progress_bar.setValue(100)
             self.overall_progress_bar.setFormat("Completed")
         
-        if success and self.is_running:
-            QTimer.singleShot(500, self._find_and_process_next_queued_task)
+        if (success or was_cancelled) and self.is_running and not self.scheduler.halted:
+            QTimer.singleShot(500, self.scheduler.dispatch)
         else:
             QTimer.singleShot(500, self._handle_queue_finished)
             
         self.update_button_states()
 
     def stop_translation_action(self):
-        if self.active_worker and self.is_running:
+        if self.scheduler.has_active_tasks() and self.is_running:
             self.stop_after_current_task = True
             self.start_stop_btn.setText("Finishing Current Translation...")
             self.start_stop_btn.setEnabled(True)
@@ -5535,7 +7416,7 @@ class MainWindow(FramelessWidget):
     
     @Slot()
     def clear_queue_action(self):
-        if self.active_thread and self.active_thread.isRunning():
+        if self.scheduler.has_active_tasks():
             return
             
         reply = CustomMessageBox.question(self, "Clear Queue", "Remove all items from queue?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -5545,10 +7426,8 @@ class MainWindow(FramelessWidget):
             self.queue_manager.clear_all_state()
             
             self.model.removeRows(0, self.model.rowCount())
-            self.current_task_index = -1
             self.overall_progress_bar.setVisible(False)
-            self.active_thread = None
-            self.active_worker = None
+            self.scheduler.reset()
             self.is_running = False
             self.update_button_states()
     
@@ -5649,15 +7528,15 @@ class MainWindow(FramelessWidget):
         if dialog.exec():
             new_settings = dialog.get_settings()
             
-            if not self._update_tmdb_semaphore_if_needed(new_settings):
-                CustomMessageBox.information(self, "Settings Updated", "TMDB concurrent requests setting will take effect after current TMDB operations complete.")
-            
             self.settings.update(new_settings)
             self._save_settings()
+            self.tmdb_cache.enforce_size_limit()
+            self.audio_cache.enforce_size_limit()
+            self._update_tmdb_pool_size()
 
     def update_button_states(self):
         has_work_remaining = self.queue_manager.has_any_work_remaining()
-        is_processing = self.active_thread is not None and self.active_thread.isRunning()
+        is_processing = self.scheduler.has_active_tasks()
         is_adding_files = self.file_adder_thread is not None and self.file_adder_thread[0].isRunning()
         
         has_any_tasks = self.model.rowCount() > 0
@@ -5673,8 +7552,12 @@ class MainWindow(FramelessWidget):
             self.start_stop_btn.setText("Stop After Current Language")  
             self.start_stop_btn.setEnabled(True)
         elif is_adding_files:
-            self.start_stop_btn.setText("Discovering Files...")
-            self.start_stop_btn.setEnabled(False)
+            if self.file_adder_thread[1].cancelled:
+                self.start_stop_btn.setText("Cancelling Discovery...")
+                self.start_stop_btn.setEnabled(False)
+            else:
+                self.start_stop_btn.setText("Discovering Files... (Click to Cancel)")
+                self.start_stop_btn.setEnabled(True)
         elif has_tmdb_operations:
             total_count = len(self.tmdb_lookup_workers)
             queued_count = len(self.tmdb_queue)
@@ -5710,19 +7593,7 @@ class MainWindow(FramelessWidget):
         
     def _get_language_names_from_codes(self, lang_codes):
         unique_codes = list(dict.fromkeys(lang_codes))
-        names = []
-        for code in unique_codes:
-            found_name = None
-            for name, (two_letter, three_letter) in LANGUAGES.items():
-                if two_letter == code:
-                    found_name = name
-                    break
-            
-            if found_name:
-                names.append(found_name)
-            else:
-                names.append(code.upper())
-        return names
+        return [LANGUAGE_NAMES_BY_CODE.get(code) or code.upper() for code in unique_codes]
         
     def edit_selected_languages(self):
         selected_rows = self._get_selected_task_rows()
@@ -5770,6 +7641,40 @@ class MainWindow(FramelessWidget):
             
             self.tree_view.viewport().update()
     
+    def _list_directory(self, directory):
+        if self._directory_listings is not None and directory in self._directory_listings:
+            return self._directory_listings[directory]
+        
+        listing = {}
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    listing[os.path.normcase(entry.name)] = entry.name
+        except OSError:
+            pass
+        
+        if self._directory_listings is not None:
+            self._directory_listings[directory] = listing
+        return listing
+    
+    def _list_subtitle_candidates(self, directory):
+        cache_key = (directory, ".srt")
+        if self._directory_listings is not None and cache_key in self._directory_listings:
+            return self._directory_listings[cache_key]
+        
+        candidates_by_prefix = {}
+        for name, real_name in self._list_directory(directory).items():
+            if not name.endswith(".srt"):
+                continue
+            dot_index = name.find(".")
+            while dot_index != -1:
+                candidates_by_prefix.setdefault(name[:dot_index], {})[name] = real_name
+                dot_index = name.find(".", dot_index + 1)
+        
+        if self._directory_listings is not None:
+            self._directory_listings[cache_key] = candidates_by_prefix
+        return candidates_by_prefix
+    
     def _find_video_pair(self, subtitle_path):
         subtitle_info = _parse_subtitle_filename(os.path.basename(subtitle_path))
         if not subtitle_info:
@@ -5777,11 +7682,12 @@ class MainWindow(FramelessWidget):
         
         base_dir = os.path.dirname(subtitle_path)
         base_name = subtitle_info['base_name']
+        listing = self._list_directory(base_dir)
         
         for ext in VIDEO_EXTENSIONS:
-            video_path = os.path.join(base_dir, base_name + ext)
-            if os.path.exists(video_path):
-                return video_path
+            video_name = listing.get(os.path.normcase(base_name + ext))
+            if video_name:
+                return os.path.join(base_dir, video_name)
         
         return None
     
@@ -5790,25 +7696,19 @@ class MainWindow(FramelessWidget):
         video_name = os.path.basename(video_path)
         video_base = os.path.splitext(video_name)[0]
         
-        subtitle_path = os.path.join(base_dir, video_base + ".srt")
-        if os.path.exists(subtitle_path):
-            return subtitle_path
+        candidates = self._list_subtitle_candidates(base_dir).get(os.path.normcase(video_base))
+        if not candidates:
+            return None
         
-        all_codes = _get_all_language_codes()
+        subtitle_name = candidates.get(os.path.normcase(video_base + ".srt"))
+        if subtitle_name:
+            return os.path.join(base_dir, subtitle_name)
         
-        for code in all_codes:
-            subtitle_path = os.path.join(base_dir, f"{video_base}.{code}.srt")
-            if os.path.exists(subtitle_path):
-                return subtitle_path
-            
-            for modifier in ['forced', 'sdh']:
-                subtitle_path = os.path.join(base_dir, f"{video_base}.{code}.{modifier}.srt")
-                if os.path.exists(subtitle_path):
-                    return subtitle_path
-            
-            subtitle_path = os.path.join(base_dir, f"{video_base}.{code}.forced.sdh.srt")
-            if os.path.exists(subtitle_path):
-                return subtitle_path
+        for code in ALL_LANGUAGE_CODES:
+            for suffix in ("", ".forced", ".sdh", ".forced.sdh"):
+                subtitle_name = candidates.get(os.path.normcase(f"{video_base}.{code}{suffix}.srt"))
+                if subtitle_name:
+                    return os.path.join(base_dir, subtitle_name)
         
         return None
         
@@ -5880,7 +7780,7 @@ class MainWindow(FramelessWidget):
         if scenario == "partial_success":
             if task_path in self.queue_manager.state["queue_state"]:
                 self.queue_manager.state["queue_state"][task_path]["extracted_subtitle_file"] = None
-                self.queue_manager._save_queue_state()
+                self.queue_manager._save_task_data(task_path)
         else:
             should_cleanup_audio = self._should_cleanup_audio(scenario)
             
@@ -5897,7 +7797,7 @@ class MainWindow(FramelessWidget):
             else:
                 if task_path in self.queue_manager.state["queue_state"]:
                     self.queue_manager.state["queue_state"][task_path]["extracted_subtitle_file"] = None
-                    self.queue_manager._save_queue_state()
+                    self.queue_manager._save_task_data(task_path)
                 
     def _cleanup_all_task_files(self):
         for row in range(self.model.rowCount()):
@@ -5923,6 +7823,8 @@ class MainWindow(FramelessWidget):
                 if os.path.exists(app_dir_progress):
                     os.remove(app_dir_progress)
                 
+                remove_language_workspaces(task_path, languages)
+                
                 pattern = self.settings.get("output_file_naming_pattern", "{original_name}.{lang_code}.{modifiers}.srt")
                 
                 for lang_code in languages:
@@ -6007,7 +7909,7 @@ class MainWindow(FramelessWidget):
         index = self.model.index(task_index, 0)
         task_id = index.data(PathRole)
         
-        if task_id in self.tmdb_lookup_workers or any(item[0] == task_id for item in self.tmdb_queue):
+        if task_id in self.tmdb_lookup_workers or task_id in self.tmdb_queue:
             return
 
         if not force and index.data(DescriptionRole):
@@ -6015,13 +7917,12 @@ class MainWindow(FramelessWidget):
             
         lookup_path = index.data(VideoPathRole) or task_id
         
-        if (task_id, lookup_path) not in self.tmdb_queue:
-            self.tmdb_queue.append((task_id, lookup_path))
+        self.tmdb_queue[task_id] = lookup_path
         
     def _process_tmdb_queue(self):
         max_concurrent = self.settings.get("tmdb_concurrent_requests", 3)
         while len(self.tmdb_lookup_workers) < max_concurrent and self.tmdb_queue:
-            task_id, lookup_path = self.tmdb_queue.pop(0)
+            task_id, lookup_path = self.tmdb_queue.popitem(last=False)
             
             if task_id in self.tmdb_lookup_workers:
                 continue
@@ -6033,21 +7934,13 @@ class MainWindow(FramelessWidget):
             movie_template = self.settings.get("tmdb_movie_template", "Overview: {movie.overview}\n\n{movie.title} - {movie.year}\nGenre(s): {movie.genres}")
             episode_template = self.settings.get("tmdb_episode_template", "Episode Overview: {episode.overview}\n\n{show.title} {episode.number} - {episode.title}\nShow Overview: {show.overview}")
             
-            worker = TMDBLookupWorker(task_id, lookup_path, api_key, movie_template, episode_template, self.tmdb_semaphore, self.settings)
+            worker = TMDBLookupWorker(task_id, lookup_path, api_key, movie_template, episode_template, self.settings, self.tmdb_session, self.tmdb_single_flight, self.tmdb_rate_limiter)
             worker.tmdb_cache = self.tmdb_cache
-            thread = QThread(self)
-            
-            worker.moveToThread(thread)
             worker.status_update.connect(self._on_tmdb_status_update)
             worker.finished.connect(self._on_tmdb_finished_ordered)
-            thread.started.connect(worker.run)
-            thread.finished.connect(worker.deleteLater)
-            thread.finished.connect(thread.deleteLater)
             
             self.tmdb_lookup_workers[task_id] = worker
-            self.tmdb_threads[task_id] = thread
-            
-            thread.start()
+            self.tmdb_thread_pool.start(worker.run)
         
         self.update_button_states()
     
@@ -6055,94 +7948,36 @@ class MainWindow(FramelessWidget):
         if task_id in self.tmdb_lookup_workers:
             del self.tmdb_lookup_workers[task_id]
         
-        if task_id in self.tmdb_threads:
-            thread = self.tmdb_threads[task_id]
-            if thread.isRunning():
-                thread.quit()
-                thread.wait()
-            del self.tmdb_threads[task_id]
-        
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            if index.data(PathRole) == task_id:
-                if success and description:
-                    self.model.setData(index, description, DescriptionRole)
-                    self.model.setData(index, "Auto", DescriptionSourceRole)
-                    self.model.itemFromIndex(index.siblingAtColumn(2)).setText(description)
-                    self.model.itemFromIndex(index.siblingAtColumn(2)).setToolTip(description)
-                    
-                    movie_name = self._extract_movie_name_from_description(description)
-                    if movie_name:
-                        self.model.itemFromIndex(index.siblingAtColumn(1)).setText(movie_name)
-                        self.model.itemFromIndex(index.siblingAtColumn(1)).setToolTip(movie_name)
-                    
-                    if task_id in self.queue_manager.state["queue_state"]:
-                        queue_entry = self.queue_manager.state["queue_state"][task_id]
-                        queue_entry["description"] = description
-                        queue_entry["tmdb_info"] = description
-                        queue_entry["tmdb_title"] = movie_name
-                        queue_entry["description_source"] = "Auto"
-                        self.queue_manager._save_queue_state()
+        index = self.model.find_task_index(task_id)
+        if index.isValid():
+            if success and description:
+                self.model.setData(index, description, DescriptionRole)
+                self.model.setData(index, "Auto", DescriptionSourceRole)
                 
-                self.model.itemFromIndex(index.siblingAtColumn(3)).setText("Queued")
-                break
+                movie_name = self._extract_movie_name_from_description(description)
+                if movie_name:
+                    self.model.setData(index.siblingAtColumn(1), movie_name)
+                
+                if task_id in self.queue_manager.state["queue_state"]:
+                    queue_entry = self.queue_manager.state["queue_state"][task_id]
+                    queue_entry["description"] = description
+                    queue_entry["tmdb_info"] = description
+                    queue_entry["tmdb_title"] = movie_name
+                    queue_entry["description_source"] = "Auto"
+                    self.queue_manager._save_task_data(task_id)
+            
+            self.model.setData(index.siblingAtColumn(3), "Queued")
         
         self._process_tmdb_queue()
 
     def _on_tmdb_status_update(self, task_id, status):
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            if index.data(PathRole) == task_id:
-                self.model.itemFromIndex(index.siblingAtColumn(3)).setText(status)
-                break
-
-    def _on_tmdb_finished(self, file_path, description, success):
-        if file_path in self.tmdb_lookup_workers:
-            del self.tmdb_lookup_workers[file_path]
-        
-        if file_path in self.tmdb_threads:
-            thread = self.tmdb_threads[file_path]
-            if thread.isRunning():
-                thread.quit()
-                thread.wait()
-            del self.tmdb_threads[file_path]
-        
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            if index.data(PathRole) == file_path:
-                if success and description:
-                    self.model.setData(index, description, DescriptionRole)
-                    self.model.setData(index, "Auto", DescriptionSourceRole)
-                    self.model.itemFromIndex(index.siblingAtColumn(2)).setText(description)
-                    self.model.itemFromIndex(index.siblingAtColumn(2)).setToolTip(description)
-                    
-                    movie_name = self._extract_movie_name_from_description(description)
-                    if movie_name:
-                        self.model.itemFromIndex(index.siblingAtColumn(1)).setText(movie_name)
-                        self.model.itemFromIndex(index.siblingAtColumn(1)).setToolTip(movie_name)
-                    
-                    if file_path in self.queue_manager.state["queue_state"]:
-                        self.queue_manager.state["queue_state"][file_path]["description"] = description
-                        self.queue_manager.state["queue_state"][file_path]["tmdb_info"] = description
-                        self.queue_manager.state["queue_state"][file_path]["tmdb_title"] = movie_name
-                        self.queue_manager._save_queue_state()
-                
-                self.model.itemFromIndex(index.siblingAtColumn(3)).setText("Queued")
-                break
-        
-        self.update_button_states()
-        
-    def _update_tmdb_semaphore_if_needed(self, new_settings):
-        old_count = getattr(self.tmdb_semaphore, '_value', 3)
-        new_count = new_settings.get("tmdb_concurrent_requests", 3)
-        
-        if old_count != new_count:
-            if self.tmdb_lookup_workers:
-                return False
+        index = self.model.find_task_index(task_id)
+        if index.isValid():
+            self.model.setData(index.siblingAtColumn(3), status)
 
-            self.tmdb_semaphore = threading.Semaphore(new_count)
-            return True
-        return True
+    def _update_tmdb_pool_size(self):
+        self.tmdb_thread_pool.setMaxThreadCount(self.settings.get("tmdb_concurrent_requests", 3))
+        self._process_tmdb_queue()
         
     def _extract_movie_name_from_description(self, description):
         if not description:
@@ -6170,28 +8005,15 @@ class MainWindow(FramelessWidget):
 
         self.queue_manager.transform_to_video_subtitle(old_path, subtitle_path, video_path)
 
-        path_item = self.model.itemFromIndex(index)
-        path_item.setText(os.path.basename(video_path))
-        path_item.setToolTip(os.path.dirname(video_path))
-        path_item.setData(subtitle_path, PathRole)
-        path_item.setData(video_path, VideoPathRole)
-        path_item.setData("video+subtitle", TaskTypeRole)
-
-        while path_item.rowCount() > 0:
-            path_item.removeRow(0)
-
-        subtitle_child = QStandardItem(f"{os.path.basename(subtitle_path)}")
-        subtitle_child.setToolTip(f"Subtitle: {subtitle_path}")
-        subtitle_child.setEditable(False)
-        path_item.appendRow([subtitle_child, QStandardItem(""), QStandardItem(""), QStandardItem("")])
-
-        self.tree_view.viewport().update()
+        self.model.setData(index, subtitle_path, PathRole)
+        self.model.setData(index, video_path, VideoPathRole)
+        self.model.setData(index, "video+subtitle", TaskTypeRole)
         
     def _initiate_file_addition(self, files):
         if self.file_adder_thread:
             return
 
-        valid_files = [f for f in files if is_video_file(f) or is_subtitle_file(f)]
+        valid_files = [f for f in files if os.path.isdir(f) or is_video_file(f) or is_subtitle_file(f)]
         if not valid_files:
             return
 
@@ -6203,7 +8025,7 @@ class MainWindow(FramelessWidget):
         worker.moveToThread(thread)
         
         worker.status_update.connect(self.start_stop_btn.setText)
-        worker.finished.connect(self._on_files_processed)
+        worker.tasks_discovered.connect(self._on_files_processed)
         thread.started.connect(worker.run)
         worker.finished.connect(thread.quit)
         thread.finished.connect(worker.deleteLater)
@@ -6298,23 +8120,18 @@ class MainWindow(FramelessWidget):
         self.populate_model_combo()
 
 if __name__ == "__main__":
-    if "--run-gst-subprocess" in sys.argv:
-        run_gst_translation_subprocess()
-    elif "--run-audio-extraction" in sys.argv:
-        run_audio_extraction_subprocess()
-    else:
-        app = QApplication(sys.argv)
+    app = QApplication(sys.argv)
 
-        def sigint_handler(*args):
-            return
-            
-        signal.signal(signal.SIGINT, sigint_handler)
-            
-        timer = QTimer()
-        timer.start(200)
-        timer.timeout.connect(lambda: None)
+    def sigint_handler(*args):
+        return
+        
+    signal.signal(signal.SIGINT, sigint_handler)
+        
+    timer = QTimer()
+    timer.start(200)
+    timer.timeout.connect(lambda: None)
 
-        app.setStyleSheet(load_stylesheet())
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec())
\ No newline at end of file
+    app.setStyleSheet(load_stylesheet())
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
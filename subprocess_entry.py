@@ -0,0 +1,359 @@
+import sys
+import os
+import json
+import re
+import subprocess
+import argparse
+import queue
+import signal
+import threading
+
+SUBPROCESS_MODES = ("--run-gst-subprocess", "--run-gst-worker")
+
+GST_PROGRESS_PATTERN = re.compile(r"Translating:\s*\|.*\|\s*(\d+)%\s*\(([^)]+)\)[^|]*\|\s*(Thinking|Processing)")
+GST_QUOTA_WAIT_PATTERN = re.compile(r"waiting (\d+) seconds")
+GST_KEY_SWITCH_PATTERN = re.compile(r"Switching to API (\d+)")
+GST_RESUME_PATTERN = re.compile(r"Resuming from line (\d+)")
+
+def is_subprocess_invocation(argv):
+    return any(mode in argv for mode in SUBPROCESS_MODES)
+
+def parse_gst_output_line(line):
+    if "Translating:" in line:
+        progress_match = GST_PROGRESS_PATTERN.search(line)
+        if progress_match:
+            return {
+                "type": "progress",
+                "percent": int(progress_match.group(1)),
+                "details": progress_match.group(2),
+                "state": progress_match.group(3)
+            }
+    
+    if "FFmpeg is not installed" in line:
+        return {"type": "error", "reason": "ffmpeg_missing"}
+    if "does not exist" in line and ("Input file" in line or "Video file" in line or "Audio file" in line):
+        return {"type": "error", "reason": "source_missing"}
+    if "Failed to extract subtitles from video file" in line:
+        return {"type": "error", "reason": "subtitle_extraction"}
+    if "Failed to process video" in line:
+        return {"type": "error", "reason": "audio_processing"}
+    
+    if "All API quotas exceeded, waiting" in line:
+        wait_match = GST_QUOTA_WAIT_PATTERN.search(line)
+        return {"type": "quota_wait", "seconds": int(wait_match.group(1)) if wait_match else None}
+    if "API quota exceeded! Switching to API" in line:
+        api_match = GST_KEY_SWITCH_PATTERN.search(line)
+        return {"type": "key_switch", "key": int(api_match.group(1)) if api_match else None}
+    
+    if "Gemini has returned an unexpected response. Expected" in line:
+        return {"type": "retry", "reason": "size_mismatch"}
+    if "Gemini has returned an empty translation for line" in line:
+        return {"type": "retry", "reason": "empty_line"}
+    if "Gemini has returned an unexpected line:" in line:
+        return {"type": "retry", "reason": "bad_index"}
+    if "Sending last batch again..." in line:
+        return {"type": "retry", "reason": "invalid_batch"}
+    
+    if "Resuming from line" in line:
+        resume_match = GST_RESUME_PATTERN.search(line)
+        return {"type": "resume", "line": int(resume_match.group(1)) if resume_match else None}
+    
+    if "Translation completed successfully!" in line:
+        return {"type": "completed"}
+    
+    return None
+
+def _patch_subprocess_for_windows():
+    if os.name != 'nt':
+        return
+    
+    original_Popen = subprocess.Popen
+    original_run = subprocess.run
+
+    class PatchedPopen(original_Popen):
+        def __init__(self, *args, **kwargs):
+            if 'creationflags' not in kwargs:
+                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+            super().__init__(*args, **kwargs)
+
+    def patched_run(*args, **kwargs):
+        if 'creationflags' not in kwargs:
+            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+        if not kwargs.get('capture_output') and not kwargs.get('stdout') and not kwargs.get('stderr'):
+            kwargs['stdout'] = subprocess.DEVNULL
+            kwargs['stderr'] = subprocess.DEVNULL
+            
+        return original_run(*args, **kwargs)
+
+    subprocess.Popen = PatchedPopen
+    subprocess.run = patched_run
+
+def _build_gst_argument_parser():
+    parser = argparse.ArgumentParser(description="Run Gemini SRT Translator for a single file (subprocess mode).")
+    parser.add_argument("--run-gst-subprocess", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--event-fd", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--gemini_api_key", required=True, help="Gemini API Key")
+    parser.add_argument("--target_language", required=True, help="Target language")
+    parser.add_argument("--input_file", help="Input SRT file path")
+    parser.add_argument("--video_file", help="Video file path")
+    parser.add_argument("--audio_file", help="Audio file path")
+    parser.add_argument("--extract_audio", type=bool, default=False, help="Extract audio from video")
+    parser.add_argument("--model_name", help="Gemini model")
+    parser.add_argument("--gemini_api_key2", help="Second API Key")
+    parser.add_argument("--output_file", help="Output file name")
+    parser.add_argument("--start_line", type=int, help="Start line")
+    parser.add_argument("--description", help="Description")
+    parser.add_argument("--batch_size", type=int, help="Batch size")
+    parser.add_argument("--free_quota", type=bool, help="Free quota")
+    parser.add_argument("--skip_upgrade", type=bool, help="Skip upgrade")
+    parser.add_argument("--use_colors", type=bool, help="Use colors")
+    parser.add_argument("--progress_log", type=bool, help="Progress log")
+    parser.add_argument("--thoughts_log", type=bool, help="Thoughts log")
+    parser.add_argument("--temperature", type=float, help="Temperature")
+    parser.add_argument("--top_p", type=float, help="Top P")
+    parser.add_argument("--top_k", type=int, help="Top K")
+    parser.add_argument("--streaming", type=bool, help="Streaming")
+    parser.add_argument("--thinking", type=bool, help="Thinking")
+    parser.add_argument("--thinking_budget", type=int, help="Thinking budget")
+    return parser
+
+def _apply_gst_arguments(gst, args):
+    gst.gemini_api_key = args.gemini_api_key
+    gst.target_language = args.target_language
+    
+    if args.video_file and args.extract_audio:
+        gst.video_file = args.video_file
+        gst.extract_audio = True
+    elif args.input_file:
+        gst.input_file = args.input_file
+    elif args.video_file:
+        gst.video_file = args.video_file
+    if args.audio_file:
+        gst.audio_file = args.audio_file
+    if args.extract_audio:
+        gst.extract_audio = args.extract_audio
+    if args.model_name:
+        gst.model_name = args.model_name
+    if args.gemini_api_key2:
+        gst.gemini_api_key2 = args.gemini_api_key2
+    if args.output_file:
+        gst.output_file = args.output_file
+    if args.start_line is not None:
+        gst.start_line = args.start_line
+    if args.description:
+        gst.description = args.description
+    if args.batch_size is not None:
+        gst.batch_size = args.batch_size
+    if args.free_quota is not None:
+        gst.free_quota = args.free_quota
+    if args.skip_upgrade is not None:
+        gst.skip_upgrade = args.skip_upgrade
+    if args.use_colors is not None:
+        gst.use_colors = args.use_colors
+    if args.progress_log is not None:
+        gst.progress_log = args.progress_log
+    if args.thoughts_log is not None:
+        gst.thoughts_log = args.thoughts_log
+    if args.temperature is not None:
+        gst.temperature = args.temperature
+    if args.top_p is not None:
+        gst.top_p = args.top_p
+    if args.top_k is not None:
+        gst.top_k = args.top_k
+    if args.streaming is not None:
+        gst.streaming = args.streaming
+    if args.thinking is not None:
+        gst.thinking = args.thinking
+    if args.thinking_budget is not None:
+        gst.thinking_budget = args.thinking_budget
+    
+    gst.use_colors = False
+
+def run_gst_translation_subprocess():
+    args = _build_gst_argument_parser().parse_args()
+    
+    _patch_subprocess_for_windows()
+    
+    if args.event_fd is not None:
+        event_stream = os.fdopen(args.event_fd, 'w', encoding='utf-8', buffering=1)
+        
+        def send_event(event):
+            event_stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+            event_stream.flush()
+        
+        for name in ("stdout", "stderr"):
+            original_stream = getattr(sys, name)
+            
+            def send_line(line, original_stream=original_stream):
+                original_stream.write(line + "\n")
+                original_stream.flush()
+            
+            setattr(sys, name, _GSTOutputStream(send_line, send_event))
+
+    try:
+        import gemini_srt_translator as gst
+        
+        _apply_gst_arguments(gst, args)
+        
+        gst.translate()
+        sys.exit(0)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if args.event_fd is not None:
+            sys.stdout.write("\n")
+            sys.stderr.write("\n")
+
+class _GSTOutputStream:
+    def __init__(self, send_line, send_event):
+        self._send_line = send_line
+        self._send_event = send_event
+        self._pending = ""
+        self.encoding = "utf-8"
+
+    def write(self, text):
+        self._pending += text
+        parts = re.split(r'[\r\n]', self._pending)
+        self._pending = parts.pop()
+        for part in parts:
+            if part:
+                event = parse_gst_output_line(part)
+                if event is None:
+                    self._send_line(part)
+                else:
+                    self._send_event(event)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+def run_gst_worker_process():
+    _patch_subprocess_for_windows()
+    
+    protocol_stream = os.fdopen(os.dup(1), 'w', encoding='utf-8', buffering=1)
+    os.dup2(2, 1)
+    command_stream = sys.stdin
+    sys.stdin = open(os.devnull, 'r')
+    
+    write_lock = threading.RLock()
+    
+    def send(message):
+        with write_lock:
+            protocol_stream.write(json.dumps(message, ensure_ascii=False) + "\n")
+            protocol_stream.flush()
+    
+    sys.stdout = _GSTOutputStream(lambda line: send({"type": "output", "line": line}), send)
+    sys.stderr = _GSTOutputStream(lambda line: send({"type": "output", "line": line}), send)
+    
+    import _thread
+    import gemini_srt_translator as gst
+    
+    gst_defaults = {
+        name: value for name, value in vars(gst).items()
+        if not name.startswith('_') and not callable(value) and not isinstance(value, type(gst))
+    }
+    
+    jobs = queue.Queue()
+    job_running = threading.Event()
+    cancel_requested = threading.Event()
+    interrupt_lock = threading.Lock()
+    main_thread_id = threading.main_thread().ident
+    
+    def interrupt_job(signum, frame):
+        if job_running.is_set():
+            raise KeyboardInterrupt
+    
+    def restore_interrupt_handler():
+        signal.signal(signal.SIGINT, interrupt_job)
+    
+    def read_commands():
+        for raw_line in command_stream:
+            try:
+                message = json.loads(raw_line)
+            except ValueError:
+                continue
+            
+            message_type = message.get("type")
+            if message_type == "translate":
+                cancel_requested.clear()
+                jobs.put(message)
+            elif message_type == "cancel":
+                with interrupt_lock:
+                    if job_running.is_set() and not cancel_requested.is_set():
+                        if hasattr(signal, "pthread_kill"):
+                            signal.pthread_kill(main_thread_id, signal.SIGINT)
+                        else:
+                            _thread.interrupt_main()
+                    cancel_requested.set()
+            elif message_type == "exit":
+                break
+        jobs.put(None)
+    
+    restore_interrupt_handler()
+    
+    threading.Thread(target=read_commands, daemon=True).start()
+    send({"type": "ready", "pid": os.getpid()})
+    
+    parser = _build_gst_argument_parser()
+    parser.exit_on_error = False
+    
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        
+        return_code = 1
+        
+        for name, value in gst_defaults.items():
+            setattr(gst, name, value)
+        
+        try:
+            try:
+                with interrupt_lock:
+                    job_running.set()
+                if cancel_requested.is_set():
+                    raise KeyboardInterrupt
+                args = parser.parse_args(job.get("args", []))
+                if job.get("cwd"):
+                    os.chdir(job["cwd"])
+                _apply_gst_arguments(gst, args)
+                gst.translate()
+                return_code = 0
+            finally:
+                with interrupt_lock:
+                    job_running.clear()
+                restore_interrupt_handler()
+        except KeyboardInterrupt:
+            return_code = -1
+        except SystemExit as e:
+            return_code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            return_code = 1
+        
+        # The single interrupt a cancel may raise can land inside the finally above; job_running
+        # is only set again for the next job, so nothing below can be interrupted.
+        job_running.clear()
+        restore_interrupt_handler()
+        
+        sys.stdout.write("\n")
+        sys.stderr.write("\n")
+        if cancel_requested.is_set():
+            return_code = -1
+        send({"type": "done", "returncode": return_code})
+        
+def main():
+    if "--run-gst-subprocess" in sys.argv:
+        run_gst_translation_subprocess()
+    elif "--run-gst-worker" in sys.argv:
+        run_gst_worker_process()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+main = pytest.importorskip("main")
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="_read_pipes is the POSIX reader")
+
+CHILDREN = 16
+LINES_PER_CHILD = 5
+MAX_LATENCY = 0.5
+
+CHILD_SCRIPT = (
+    "import sys, time\n"
+    f"for i in range({LINES_PER_CHILD}):\n"
+    "    stream = sys.stdout if i % 2 == 0 else sys.stderr\n"
+    "    stream.write(f'{time.time()!r}\\n')\n"
+    "    stream.flush()\n"
+    "    time.sleep(0.05)\n"
+)
+
+
+def make_worker():
+    worker = main.TranslationWorker.__new__(main.TranslationWorker)
+    worker.force_cancelled = False
+    return worker
+
+
+def test_read_pipes_uses_no_threads_and_delivers_promptly():
+    baseline_threads = set(threading.enumerate())
+    drivers = []
+    latencies = []
+    extra_threads = set()
+    results_lock = threading.Lock()
+    start = threading.Barrier(CHILDREN)
+
+    def on_line(line):
+        received = time.time()
+        with results_lock:
+            latencies.append(received - float(line))
+            extra_threads.update(set(threading.enumerate()) - baseline_threads - set(drivers))
+
+    def drive_child():
+        worker = make_worker()
+        start.wait()
+        process = subprocess.Popen(
+            [sys.executable, "-c", CHILD_SCRIPT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        worker._read_pipes(process, [(process.stdout, on_line), (process.stderr, on_line)])
+        process.wait(timeout=5)
+
+    drivers.extend(threading.Thread(target=drive_child) for _ in range(CHILDREN))
+    for driver in drivers:
+        driver.start()
+    for driver in drivers:
+        driver.join(timeout=30)
+
+    assert not any(driver.is_alive() for driver in drivers)
+    assert len(latencies) == CHILDREN * LINES_PER_CHILD
+    assert extra_threads == set()
+    assert max(latencies) < MAX_LATENCY
+    assert set(threading.enumerate()) == baseline_threads
+
+
+FAKE_GST = (
+    "import os\n"
+    "gemini_api_key = None\n"
+    "target_language = None\n"
+    "input_file = None\n"
+    "def translate():\n"
+    f"    for i in range({LINES_PER_CHILD}):\n"
+    "        print(f'line {i}')\n"
+    "        os.write(2, f'raw {i}\\r'.encode())\n"
+)
+
+
+def test_warm_worker_reads_pipes_without_threads(tmp_path, monkeypatch):
+    (tmp_path / "gemini_srt_translator.py").write_text(FAKE_GST)
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    baseline_threads = set(threading.enumerate())
+
+    worker_process = main.GSTWorkerProcess()
+    try:
+        assert set(threading.enumerate()) == baseline_threads
+
+        for _ in range(2):
+            lines = []
+            returncode = worker_process.run_job(
+                ["--gemini_api_key", "key", "--target_language", "French", "--input_file", "input.srt"],
+                str(tmp_path), lines.append, lambda: False,
+            )
+            assert returncode == 0
+            assert sorted(line.rstrip("\n") for line in lines) == sorted(
+                [f"line {i}" for i in range(LINES_PER_CHILD)] + [f"raw {i}" for i in range(LINES_PER_CHILD)]
+            )
+            assert set(threading.enumerate()) == baseline_threads
+    finally:
+        worker_process.shutdown()
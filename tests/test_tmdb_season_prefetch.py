@@ -0,0 +1,92 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+main = pytest.importorskip("main")
+requests = pytest.importorskip("requests")
+
+SHOW_ID = 42
+SEASON = 1
+EPISODES = [1, 2, 3, 4]
+
+RESPONSES = {
+    "/3/search/tv": {"results": [{"id": SHOW_ID}]},
+    f"/3/tv/{SHOW_ID}": {"id": SHOW_ID, "name": "Stub Show", "overview": "A show.", "genres": [{"name": "Drama"}]},
+    f"/3/tv/{SHOW_ID}/season/{SEASON}": {
+        "episodes": [
+            {"episode_number": n, "name": f"Episode {n}", "overview": f"Overview {n}"}
+            for n in EPISODES
+        ]
+    },
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = urlparse(self.path).path
+        self.server.paths.append(path)
+        body = RESPONSES.get(path)
+
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def tmdb_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.paths = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def worker(tmdb_stub, tmp_path):
+    session = requests.Session()
+    worker = main.TMDBLookupWorker(
+        "task", "Stub.Show.S01E01.mkv", "key", "", "{episode.number} - {episode.title}", session=session
+    )
+    worker.base_url = f"http://127.0.0.1:{tmdb_stub.server_address[1]}/3"
+    worker.tmdb_cache = main.TMDBCacheManager(str(tmp_path / "tmdb_cache.json"))
+    yield worker
+    session.close()
+
+
+def test_first_episode_miss_fetches_season_once(tmdb_stub, worker):
+    description = worker._lookup_episode("Stub Show", SEASON, EPISODES[0])
+
+    assert description == "S01E01 - Episode 1"
+    season_path = f"/3/tv/{SHOW_ID}/season/{SEASON}"
+    assert tmdb_stub.paths.count(season_path) == 1
+    assert not any(path.startswith(season_path + "/episode/") for path in tmdb_stub.paths)
+
+
+def test_remaining_episodes_served_from_cache(tmdb_stub, worker):
+    worker._lookup_episode("Stub Show", SEASON, EPISODES[0])
+    requests_after_first = len(tmdb_stub.paths)
+
+    for episode in EPISODES[1:]:
+        description = worker._lookup_episode("Stub Show", SEASON, episode)
+        assert description == f"S01E{episode:02d} - Episode {episode}"
+        assert worker.tmdb_cache.get_cached_episode("Stub Show", SEASON, episode) is not None
+
+    assert len(tmdb_stub.paths) == requests_after_first
@@ -1,6 +1,6 @@
 import platform
 from enum import Enum
-from ctypes import cast, POINTER, Structure, c_int, byref, windll, c_bool, sizeof
+from ctypes import cast, POINTER, Structure, c_int, byref, c_bool, sizeof
 from ctypes.wintypes import LPRECT, MSG, HWND, RECT, UINT, DWORD, LPARAM, BOOL
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
@@ -31,6 +31,7 @@ class TitleBar(QWidget):
         return self._layout
 
 if IS_WINDOWS:
+    from ctypes import windll
     try:
         from winreg import ConnectRegistry, HKEY_CURRENT_USER, OpenKey, KEY_READ, QueryValueEx
         import win32con, win32gui, win32api